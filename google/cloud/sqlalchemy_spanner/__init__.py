@@ -12,9 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .sqlalchemy_spanner import SpannerDialect
+from .sqlalchemy_spanner import (
+    SpannerDialect,
+    begin_ddl_batch,
+    install_index_hints,
+    spanner_hints,
+    with_index,
+)
 
 from .version import __version__
 
 
-__all__ = (SpannerDialect, __version__)
+__all__ = (
+    SpannerDialect,
+    begin_ddl_batch,
+    install_index_hints,
+    spanner_hints,
+    with_index,
+    __version__,
+)
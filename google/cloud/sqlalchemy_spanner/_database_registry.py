@@ -0,0 +1,386 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shares Spanner clients, databases and session pools between connections.
+
+By default, each DB API connection creates its own Client, Database and
+session pool. A :class:`DatabaseRegistry` instead creates these once for
+each database, and returns connections that all use the same objects. Each
+Database object has its own gRPC channel, so a shared database can be
+created with multiple Database objects to spread the connections over
+multiple channels.
+
+A shared database can be warmed up when it is created. The warm-up creates
+the sessions of the session pools with BatchCreateSessions, which also opens
+the gRPC channel of each Database object, so the first statements do not
+have to wait for this. A FixedSizePool or PingingPool creates its sessions
+when it is bound to its Database object. The sessions of a BurstyPool are
+created by the warm-up.
+"""
+
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+import weakref
+
+from google.cloud import spanner_dbapi
+from google.cloud.spanner_v1 import BatchCreateSessionsRequest
+from google.cloud.spanner_v1 import __version__ as spanner_v1_version
+from google.cloud.spanner_v1 import Session as SessionProto
+from google.cloud.spanner_v1.database_sessions_manager import TransactionType
+from google.cloud.spanner_v1.pool import BurstyPool, FixedSizePool, PingingPool
+from google.cloud.spanner_v1.session import Session
+
+try:
+    from google.cloud.spanner_v1._helpers import (
+        _metadata_with_leader_aware_routing,
+        _metadata_with_prefix,
+    )
+except ImportError:  # pragma: NO COVER
+    _metadata_with_prefix = None
+
+from google.cloud.sqlalchemy_spanner._opentelemetry_tracing import trace_call
+
+_logger = logging.getLogger(__name__)
+
+# The connection arguments that configure a shared session pool. These are
+# removed from the arguments before a DB API connection is created.
+SESSION_POOL_ARGS = ("session_pool", "session_pool_size", "num_channels")
+
+SESSION_POOL_TYPES = {
+    "bursty": BurstyPool,
+    "fixed": FixedSizePool,
+    "pinging": PingingPool,
+}
+
+
+def _spanner_version():
+    return tuple(int(part) for part in spanner_v1_version.split(".")[:2])
+
+
+# A BurstyPool does not create sessions when it is bound to a database. The
+# warm-up creates them with BatchCreateSessions in the same way as the
+# FixedSizePool of the client library, which uses internals of the client
+# library: the request metadata helpers, the routing option and the API of
+# the database, and the session id of a session. These are verified for the
+# versions below, and test/unit/test_database_registry.py verifies that the
+# installed version still has them. With other versions, the sessions are
+# created one by one with the public Session API.
+_BATCH_CREATE_SESSIONS_VERSIONS = ((3, 55), (3, 72))
+_BATCH_CREATE_SESSIONS_SUPPORTED = (
+    _metadata_with_prefix is not None
+    and _BATCH_CREATE_SESSIONS_VERSIONS[0]
+    <= _spanner_version()
+    < _BATCH_CREATE_SESSIONS_VERSIONS[1]
+)
+
+
+class _SharedDatabase:
+    """The Database objects of one Spanner database, one for each channel."""
+
+    def __init__(self, instance, databases, pools, key_objects=()):
+        self.instance = instance
+        self.databases = databases
+        self.pools = pools
+        # The objects whose ids are part of the registry key. These are kept
+        # alive as long as the shared database is registered, so that their
+        # ids can't be reused by other objects.
+        self.key_objects = key_objects
+        self._next_database = itertools.cycle(databases)
+        self._lock = threading.Lock()
+
+        self.warmup_duration = None
+
+    def next_database(self):
+        with self._lock:
+            return next(self._next_database)
+
+    def warm_up(self, num_sessions):
+        """Create the sessions of the session pools and open the channels.
+
+        The sessions are spread evenly over the Database objects. A session
+        pool is not filled beyond its size. A FixedSizePool or PingingPool
+        has already created its sessions when it was bound to its Database
+        object. The multiplexed session of each Database object is also
+        created if the client uses multiplexed sessions.
+
+        Args:
+            num_sessions (int): The total number of sessions to create.
+
+        Returns:
+            float: The number of seconds that the warm-up took.
+        """
+        start = time.perf_counter()
+        per_database = math.ceil(num_sessions / len(self.databases))
+        trace_attributes = {
+            "db.instance": self.databases[0].name,
+            "db.sessions": num_sessions,
+            "db.channels": len(self.databases),
+        }
+        with trace_call("SpannerSqlAlchemy.WarmUpSessions", trace_attributes):
+            for database, pool in zip(self.databases, self.pools):
+                if isinstance(pool, BurstyPool):
+                    _fill_bursty_pool(database, pool, per_database)
+                # Getting a session for a read-only transaction creates the
+                # multiplexed session, if the client uses multiplexed sessions.
+                sessions_manager = database.sessions_manager
+                sessions_manager.put_session(
+                    sessions_manager.get_session(TransactionType.READ_ONLY)
+                )
+        self.warmup_duration = time.perf_counter() - start
+        _logger.info(
+            "Warmed up %d sessions on %d channels for %s in %.3f seconds",
+            num_sessions,
+            len(self.databases),
+            self.databases[0].name,
+            self.warmup_duration,
+        )
+        return self.warmup_duration
+
+
+class DatabaseRegistry:
+    """A registry of Database objects that are shared by connections.
+
+    A registry is used by all connections of an engine, or by all engines in
+    the process that set ``share_across_engines``.
+    """
+
+    def __init__(self):
+        self._databases = {}
+        self._lock = threading.Lock()
+        _REGISTRIES.add(self)
+
+    def _reset(self):
+        # The gRPC channels and sessions of a parent process can't be used
+        # after a fork, so the child process creates new shared databases.
+        self._databases = {}
+        self._lock = threading.Lock()
+
+    def connect(
+        self,
+        instance_id,
+        database_id=None,
+        project=None,
+        credentials=None,
+        pool=None,
+        user_agent=None,
+        client=None,
+        route_to_leader_enabled=True,
+        database_role=None,
+        session_pool=None,
+        session_pool_size=None,
+        num_channels=None,
+        warmup_sessions=None,
+        **kwargs,
+    ):
+        """Create a DB API connection that uses a shared Database object.
+
+        The arguments are the same as for
+        :func:`google.cloud.spanner_dbapi.connect`, with the additional
+        arguments that configure the shared session pool.
+
+        Args:
+            session_pool (str): Optional. The type of the session pool:
+                ``bursty`` (default), ``fixed`` or ``pinging``.
+            session_pool_size (int): Optional. The total number of sessions
+                in the session pools of the database.
+            num_channels (int): Optional. The number of gRPC channels to use
+                for the database. Defaults to 1.
+            warmup_sessions (int): Optional. The number of sessions to create
+                when the shared database is created.
+
+        Returns:
+            google.cloud.spanner_dbapi.Connection: A connection that does not
+                clear the shared session pool when it is closed.
+        """
+        num_channels = int(num_channels or 1)
+        if session_pool is not None and session_pool not in SESSION_POOL_TYPES:
+            raise ValueError(
+                f"Unknown session pool type: {session_pool}. Supported types "
+                f"are: {', '.join(SESSION_POOL_TYPES)}"
+            )
+        if pool is not None and num_channels > 1:
+            raise ValueError("A session pool can't be shared by multiple channels")
+        key_objects = tuple(
+            obj
+            for obj in (pool, client, credentials)
+            if obj is not None and not isinstance(obj, str)
+        )
+        key = (
+            project,
+            instance_id,
+            database_id,
+            database_role,
+            session_pool,
+            session_pool_size,
+            num_channels,
+            credentials if isinstance(credentials, str) else None,
+            tuple(id(obj) for obj in key_objects),
+            route_to_leader_enabled,
+        )
+        with self._lock:
+            shared = self._databases.get(key)
+            if shared is None:
+                shared = self._databases[key] = self._create_shared_database(
+                    instance_id,
+                    database_id,
+                    project,
+                    credentials,
+                    pool,
+                    user_agent,
+                    client,
+                    route_to_leader_enabled,
+                    database_role,
+                    session_pool,
+                    session_pool_size,
+                    num_channels,
+                    kwargs,
+                    key_objects,
+                )
+                if warmup_sessions and database_id:
+                    shared.warm_up(int(warmup_sessions))
+        database = shared.next_database() if database_id else None
+        connection = spanner_dbapi.Connection(shared.instance, database, **kwargs)
+        # A connection clears the session pool of its database when it is
+        # closed, unless it does not own the pool. This is the same flag that
+        # spanner_dbapi.connect() sets for a pool that is passed in by the
+        # application. test_shared_session_pool verifies that the DB API still
+        # uses it.
+        connection._own_pool = False
+        return connection
+
+    def _create_shared_database(
+        self,
+        instance_id,
+        database_id,
+        project,
+        credentials,
+        pool,
+        user_agent,
+        client,
+        route_to_leader_enabled,
+        database_role,
+        session_pool,
+        session_pool_size,
+        num_channels,
+        kwargs,
+        key_objects,
+    ):
+        # The DB API creates the client in the same way as for a connection
+        # that does not use a shared database.
+        instance = spanner_dbapi.connect(
+            instance_id,
+            project=project,
+            credentials=credentials,
+            user_agent=user_agent,
+            client=client,
+            route_to_leader_enabled=route_to_leader_enabled,
+            client_options=kwargs.get("client_options"),
+        ).instance
+        databases = []
+        pools = []
+        if database_id:
+            size = None
+            if session_pool_size is not None:
+                size = max(1, math.ceil(int(session_pool_size) / num_channels))
+            for _ in range(num_channels):
+                pools.append(pool or _create_pool(session_pool, size))
+                databases.append(
+                    instance.database(
+                        database_id,
+                        pool=pools[-1],
+                        database_role=database_role,
+                        logger=kwargs.get("logger"),
+                    )
+                )
+        return _SharedDatabase(instance, databases, pools, key_objects)
+
+
+def _fill_bursty_pool(database, pool, num_sessions):
+    num_sessions = min(num_sessions, pool.target_size)
+    if _BATCH_CREATE_SESSIONS_SUPPORTED:
+        _batch_create_sessions(database, pool, num_sessions)
+        return
+    for _ in range(num_sessions):
+        session = _new_session(database, pool)
+        session.create()
+        pool.put(session)
+
+
+def _new_session(database, pool):
+    return Session(
+        database,
+        labels=pool.labels,
+        database_role=pool.database_role or database.database_role,
+    )
+
+
+def _batch_create_sessions(database, pool, num_sessions):
+    """Create the sessions of a pool with BatchCreateSessions.
+
+    This is the same as FixedSizePool.bind() of the client library does, and
+    uses the same internals of the client library. It is only used with the
+    versions in _BATCH_CREATE_SESSIONS_VERSIONS.
+    """
+    metadata = _metadata_with_prefix(database.name)
+    if database._route_to_leader_enabled:
+        metadata.append(
+            _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
+        )
+    request = BatchCreateSessionsRequest(
+        database=database.name,
+        session_template=SessionProto(
+            creator_role=pool.database_role or database.database_role
+        ),
+    )
+    created = 0
+    while created < num_sessions:
+        # Spanner can return fewer sessions than requested.
+        request.session_count = num_sessions - created
+        response = database.spanner_api.batch_create_sessions(
+            request=request, metadata=metadata
+        )
+        for session_pb in response.session:
+            session = _new_session(database, pool)
+            session._session_id = session_pb.name.split("/")[-1]
+            pool.put(session)
+            created += 1
+
+
+def _create_pool(session_pool, size):
+    if session_pool is None and size is None:
+        # The default session pool of the client library.
+        return BurstyPool()
+    pool_type = SESSION_POOL_TYPES[session_pool or "bursty"]
+    if size is None:
+        return pool_type()
+    if pool_type is BurstyPool:
+        return pool_type(target_size=size)
+    return pool_type(size=size)
+
+
+def _reset_registries():
+    for registry in list(_REGISTRIES):
+        registry._reset()
+
+
+_REGISTRIES = weakref.WeakSet()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_registries)
+
+# The registry of the engines that set share_across_engines.
+PROCESS_REGISTRY = DatabaseRegistry()
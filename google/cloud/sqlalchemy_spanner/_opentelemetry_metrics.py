@@ -0,0 +1,246 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Records OpenTelemetry metrics for the operations of the dialect.
+
+Metrics are only recorded if OpenTelemetry is installed and a meter provider
+has been configured. Otherwise the hooks of the dialect do no extra work.
+The instruments are created once, when the dialect first finds a meter
+provider:
+
+* ``spanner.sqlalchemy.execute.duration``: The duration of executing a
+  statement, by ``db.operation`` (``select``, ``insert``, ``update``,
+  ``delete``, ``ddl`` or ``other``) and ``db.executemany``.
+* ``spanner.sqlalchemy.rows_returned``: The number of rows that were fetched
+  from the result of a statement.
+* ``spanner.sqlalchemy.rows_affected``: The number of rows that were
+  inserted, updated or deleted by a statement.
+* ``spanner.sqlalchemy.executemany.batch_size``: The number of parameter
+  sets of an executemany call.
+* ``spanner.sqlalchemy.commit.duration``: The duration of a commit.
+* ``spanner.sqlalchemy.rollbacks``: The number of rollbacks.
+* ``spanner.sqlalchemy.transaction.retries``: The number of transactions
+  that were aborted by Spanner and retried, by whether the retry succeeded.
+* ``spanner.sqlalchemy.pool.checkout.duration``: The time it took to check
+  out a connection from the connection pool.
+
+A failed operation is recorded with the ``error.type`` attribute.
+"""
+
+from contextlib import contextmanager, nullcontext
+import time
+
+from google.cloud.sqlalchemy_spanner import version as sqlalchemy_spanner_version
+
+try:
+    from opentelemetry import metrics
+    from opentelemetry.metrics._internal import _ProxyMeterProvider
+
+    HAS_OPENTELEMETRY_INSTALLED = True
+except ImportError:
+    HAS_OPENTELEMETRY_INSTALLED = False
+
+# Returned by the measure functions if no metrics are recorded.
+_NO_METRICS = nullcontext()
+
+_metrics = None
+
+
+class DialectMetrics:
+    """The instruments of the dialect.
+
+    Args:
+        meter (opentelemetry.metrics.Meter): The meter that creates the
+            instruments.
+    """
+
+    def __init__(self, meter):
+        self.execute_duration = meter.create_histogram(
+            "spanner.sqlalchemy.execute.duration",
+            unit="s",
+            description="Duration of executing a statement.",
+        )
+        self.rows_returned = meter.create_histogram(
+            "spanner.sqlalchemy.rows_returned",
+            unit="{row}",
+            description="Number of rows fetched from the result of a statement.",
+        )
+        self.rows_affected = meter.create_histogram(
+            "spanner.sqlalchemy.rows_affected",
+            unit="{row}",
+            description="Number of rows inserted, updated or deleted.",
+        )
+        self.batch_size = meter.create_histogram(
+            "spanner.sqlalchemy.executemany.batch_size",
+            unit="{row}",
+            description="Number of parameter sets of an executemany call.",
+        )
+        self.commit_duration = meter.create_histogram(
+            "spanner.sqlalchemy.commit.duration",
+            unit="s",
+            description="Duration of a commit.",
+        )
+        self.rollbacks = meter.create_counter(
+            "spanner.sqlalchemy.rollbacks",
+            unit="{rollback}",
+            description="Number of rollbacks.",
+        )
+        self.retries = meter.create_counter(
+            "spanner.sqlalchemy.transaction.retries",
+            unit="{retry}",
+            description="Number of aborted transactions that were retried.",
+        )
+        self.pool_checkout_duration = meter.create_histogram(
+            "spanner.sqlalchemy.pool.checkout.duration",
+            unit="s",
+            description="Time to check out a connection from the pool.",
+        )
+
+    @contextmanager
+    def measure_execute(self, context, cursor, batch_size=None):
+        attributes = {
+            "db.operation": statement_kind(context),
+            "db.executemany": batch_size is not None,
+        }
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as error:
+            attributes["error.type"] = type(error).__name__
+            raise
+        finally:
+            self.execute_duration.record(time.perf_counter() - start, attributes)
+        if batch_size is not None:
+            self.batch_size.record(batch_size, attributes)
+        if attributes["db.operation"] in ("insert", "update", "delete"):
+            rowcount = getattr(context, "_rowcount", None)
+            if rowcount is None:
+                rowcount = cursor.rowcount
+            if rowcount is not None and rowcount >= 0:
+                self.rows_affected.record(rowcount, attributes)
+
+    @contextmanager
+    def measure_commit(self):
+        attributes = {}
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as error:
+            attributes["error.type"] = type(error).__name__
+            raise
+        finally:
+            self.commit_duration.record(time.perf_counter() - start, attributes)
+
+
+def get_metrics():
+    """Return the instruments of the dialect.
+
+    Returns:
+        DialectMetrics: The instruments, or None if OpenTelemetry is not
+            installed or no meter provider has been configured.
+    """
+    global _metrics
+    if _metrics is None and HAS_OPENTELEMETRY_INSTALLED:
+        provider = metrics.get_meter_provider()
+        # The global meter provider is a proxy until the application sets a
+        # meter provider, in the same way as the tracer provider.
+        if not isinstance(provider, (_ProxyMeterProvider, metrics.NoOpMeterProvider)):
+            _metrics = DialectMetrics(
+                provider.get_meter(
+                    "google.cloud.sqlalchemy_spanner",
+                    sqlalchemy_spanner_version.__version__,
+                )
+            )
+    return _metrics
+
+
+def statement_kind(context):
+    """Return the kind of the statement of an execution context."""
+    if context is None:
+        return "other"
+    if context.isinsert:
+        return "insert"
+    if context.isupdate:
+        return "update"
+    if context.isdelete:
+        return "delete"
+    if context.isddl:
+        return "ddl"
+    if getattr(context, "_is_query", False):
+        return "select"
+    return "other"
+
+
+def measure_execute(context, cursor, batch_size=None):
+    """Record the duration and the row count of executing a statement.
+
+    Args:
+        context (SpannerExecutionContext): The context of the statement, or
+            None.
+        cursor: The DB API cursor that executes the statement.
+        batch_size (int): Optional. The number of parameter sets of an
+            executemany call.
+
+    Returns:
+        A context manager that measures the execution.
+    """
+    dialect_metrics = get_metrics()
+    if dialect_metrics is None:
+        return _NO_METRICS
+    return dialect_metrics.measure_execute(context, cursor, batch_size)
+
+
+def measure_commit():
+    """Record the duration of a commit."""
+    dialect_metrics = get_metrics()
+    if dialect_metrics is None:
+        return _NO_METRICS
+    return dialect_metrics.measure_commit()
+
+
+def record_rollback():
+    dialect_metrics = get_metrics()
+    if dialect_metrics is not None:
+        dialect_metrics.rollbacks.add(1)
+
+
+def record_pool_checkout(duration):
+    dialect_metrics = get_metrics()
+    if dialect_metrics is not None:
+        dialect_metrics.pool_checkout_duration.record(duration)
+
+
+def instrument_retries(dbapi_connection):
+    """Count the transaction retries of a DB API connection.
+
+    The DB API retries a transaction that is aborted by Spanner by executing
+    its statements again. The retry helper of the connection is wrapped, so
+    each retry is counted.
+    """
+    dialect_metrics = get_metrics()
+    if dialect_metrics is None:
+        return
+    helper = dbapi_connection._transaction_helper
+    retry_transaction = helper.retry_transaction
+
+    def counted_retry_transaction(*args, **kwargs):
+        try:
+            result = retry_transaction(*args, **kwargs)
+        except Exception:
+            dialect_metrics.retries.add(1, {"success": False})
+            raise
+        dialect_metrics.retries.add(1, {"success": True})
+        return result
+
+    helper.retry_transaction = counted_retry_transaction
@@ -12,13 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Manages OpenTelemetry trace creation and handling"""
+"""Manages OpenTelemetry trace creation and handling
+
+Spans are only created if OpenTelemetry is installed and a tracer provider
+has been configured. Otherwise :func:`trace_call` returns a shared context
+manager that does nothing.
+
+The attributes of a span, except for the fixed attributes of every span, are
+only added if the span is recorded, so statements that are not sampled do
+not pay for converting their parameters to strings. The following
+environment variables are read once, when this module is imported:
+
+* ``SQLALCHEMY_SPANNER_TRACE_HIDE_QUERY_PARAMETERS``: Set to any value to
+  not add the parameters of statements to spans.
+* ``SQLALCHEMY_SPANNER_TRACE_MAX_PARAMS``: The maximum number of parameters
+  of a statement, or the maximum number of parameter sets of an executemany
+  call, that is added to a span. Defaults to 100.
+* ``SQLALCHEMY_SPANNER_TRACE_MAX_PARAM_LENGTH``: The maximum length of each
+  parameter in a span. Longer values are truncated. Defaults to 1000.
+"""
 
 import collections
+from contextlib import contextmanager, nullcontext
 import os
 
-from contextlib import contextmanager
-
 from google.api_core.exceptions import GoogleAPICallError
 from google.cloud.spanner_v1 import SpannerClient
 
@@ -32,39 +49,68 @@ except ImportError:
     HAS_OPENTELEMETRY_INSTALLED = False
     tracer = None
 
+HIDE_QUERY_PARAMETERS = bool(
+    os.environ.get("SQLALCHEMY_SPANNER_TRACE_HIDE_QUERY_PARAMETERS")
+)
+MAX_TRACED_PARAMS = int(os.environ.get("SQLALCHEMY_SPANNER_TRACE_MAX_PARAMS", 100))
+MAX_TRACED_PARAM_LENGTH = int(
+    os.environ.get("SQLALCHEMY_SPANNER_TRACE_MAX_PARAM_LENGTH", 1000)
+)
+
+# Base attributes that we know for every trace created
+BASE_ATTRIBUTES = {
+    "db.type": "spanner",
+    "db.engine": "sqlalchemy_spanner",
+    "db.url": SpannerClient.DEFAULT_ENDPOINT,
+    "net.host.name": SpannerClient.DEFAULT_ENDPOINT,
+}
+
+# Returned by trace_call if no spans are created.
+_NO_SPAN = nullcontext()
+
+_tracing_enabled = False
+
+
+def tracing_enabled():
+    """Return True if OpenTelemetry is installed and a tracer provider is set.
+
+    A tracer provider can't be removed once it has been set, so the result
+    is cached once it is True.
+    """
+    global _tracing_enabled
+    if not _tracing_enabled and HAS_OPENTELEMETRY_INSTALLED:
+        _tracing_enabled = not isinstance(
+            trace.get_tracer_provider(),
+            (trace.ProxyTracerProvider, trace.NoOpTracerProvider),
+        )
+    return _tracing_enabled
+
 
-@contextmanager
 def trace_call(name, extra_attributes=None):
-    if not HAS_OPENTELEMETRY_INSTALLED:
-        # Empty context manager. Users will have to check if the generated value
-        # is None or a span
-        yield None
-        return
-
-    # Set base attributes that we know for every trace created
-    attributes = {
-        "db.type": "spanner",
-        "db.engine": "sqlalchemy_spanner",
-        "db.url": SpannerClient.DEFAULT_ENDPOINT,
-        "net.host.name": SpannerClient.DEFAULT_ENDPOINT,
-    }
-
-    if extra_attributes:
-        if os.environ.get("SQLALCHEMY_SPANNER_TRACE_HIDE_QUERY_PARAMETERS"):
-            extra_attributes.pop("db.params", None)
-
-        # Stringify "db.params" sequence values before sending to OpenTelemetry,
-        # otherwise OpenTelemetry may log a Warning if types differ.
-        if isinstance(extra_attributes, dict):
-            for k, v in extra_attributes.items():
-                if k == "db.params" and isinstance(v, collections.abc.Sequence):
-                    extra_attributes[k] = [str(e) for e in v]
-
-        attributes.update(extra_attributes)
+    """Create a span for an operation.
+
+    Args:
+        name (str): The name of the span.
+        extra_attributes (dict): Optional. The attributes of the operation.
+            These are only added to the span if it is recorded.
+
+    Returns:
+        A context manager that returns the span, or None if no span is
+        created.
+    """
+    if not tracing_enabled():
+        # Users will have to check if the generated value is None or a span
+        return _NO_SPAN
+    return _trace_call(name, extra_attributes)
+
 
+@contextmanager
+def _trace_call(name, extra_attributes):
     with tracer.start_as_current_span(
-        name, kind=trace.SpanKind.CLIENT, attributes=attributes
+        name, kind=trace.SpanKind.CLIENT, attributes=BASE_ATTRIBUTES
     ) as span:
+        if extra_attributes and span.is_recording():
+            span.set_attributes(_span_attributes(extra_attributes))
         try:
             yield span
         except GoogleAPICallError as error:
@@ -72,3 +118,25 @@ def trace_call(name, extra_attributes=None):
             span.record_exception(error)
             raise
         span.set_status(Status(StatusCode.OK))
+
+
+def _span_attributes(extra_attributes):
+    attributes = dict(extra_attributes)
+    params = attributes.pop("db.params", None)
+    if params is None or HIDE_QUERY_PARAMETERS:
+        return attributes
+    # Stringify "db.params" sequence values before sending to OpenTelemetry,
+    # otherwise OpenTelemetry may log a Warning if types differ.
+    if isinstance(params, collections.abc.Sequence) and not isinstance(params, str):
+        if len(params) > MAX_TRACED_PARAMS:
+            attributes["db.params_truncated"] = True
+            params = params[:MAX_TRACED_PARAMS]
+        params = [_truncate(str(param)) for param in params]
+    attributes["db.params"] = params
+    return attributes
+
+
+def _truncate(value):
+    if len(value) > MAX_TRACED_PARAM_LENGTH:
+        return value[:MAX_TRACED_PARAM_LENGTH] + "..."
+    return value
@@ -0,0 +1,476 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""asyncio support for the Cloud Spanner dialect.
+
+The Spanner DB API is synchronous. The asyncio dialect therefore gives each
+connection its own worker thread, and runs every DB API call that can do
+network I/O on that thread. The event loop is not blocked while a statement
+is executed or while rows are fetched, and the number of concurrent queries
+is limited by the size of the connection pool instead of by a shared thread
+pool. Schema reflection, for example with ``AsyncConnection.run_sync`` and
+``inspect``, also runs on the worker thread of the connection.
+
+Use the ``spanner+spanner_async`` scheme with ``create_async_engine``:
+
+.. code:: python
+
+    engine = create_async_engine(
+        "spanner+spanner_async:///projects/project-id/instances/instance-id/"
+        "databases/database-id"
+    )
+
+This module requires SQLAlchemy 2.0 with the ``asyncio`` extra (greenlet).
+"""
+
+import asyncio
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+
+from google.cloud import spanner_dbapi
+from google.cloud.spanner_dbapi.parsed_statement import StatementType
+from sqlalchemy import pool
+from sqlalchemy.connectors.asyncio import (
+    AsyncAdapt_dbapi_connection,
+    AsyncAdapt_dbapi_cursor,
+    AsyncAdapt_dbapi_module,
+    AsyncAdapt_dbapi_ss_cursor,
+)
+from sqlalchemy.util.concurrency import await_only
+
+from google.cloud.sqlalchemy_spanner._opentelemetry_metrics import record_rollback
+from google.cloud.sqlalchemy_spanner._opentelemetry_tracing import trace_call
+from google.cloud.sqlalchemy_spanner.sqlalchemy_spanner import (
+    _PENDING_DML_BATCH,
+    SpannerDialect,
+    SpannerExecutionContext,
+    _PoolCheckoutMetrics,
+    _execute_with_statement_type,
+    _known_statement_type,
+)
+
+# Set on the worker thread of a connection while it runs a reflection method,
+# so reflection methods that call each other are not dispatched again.
+_reflection_thread = threading.local()
+
+
+def _reflect(function, *args, **kwargs):
+    _reflection_thread.active = True
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _reflection_thread.active = False
+
+
+class AsyncSpannerCursor:
+    """An asyncio wrapper around a Spanner DB API cursor.
+
+    All methods that can execute a request on Spanner are coroutines that run
+    the DB API call on the worker thread of the connection.
+    """
+
+    def __init__(self, connection, cursor):
+        self._connection = connection
+        self._cursor = cursor
+        # The statement type of the next statement that is executed, if it
+        # does not have to be classified by the DB API.
+        self.statement_type = None
+
+    async def __aenter__(self):
+        return self
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def arraysize(self):
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value):
+        self._cursor.arraysize = value
+
+    @property
+    def request_tag(self):
+        return self._cursor.request_tag
+
+    @request_tag.setter
+    def request_tag(self, value):
+        self._cursor.request_tag = value
+
+    async def execute(self, operation, parameters=None):
+        statement_type, self.statement_type = self.statement_type, None
+        if statement_type is not None:
+            return await self._connection.run_in_thread(
+                _execute_with_statement_type,
+                self._cursor.execute,
+                statement_type,
+                operation,
+                parameters,
+            )
+        return await self._connection.run_in_thread(
+            self._cursor.execute, operation, parameters
+        )
+
+    async def executemany(self, operation, seq_of_parameters):
+        statement_type, self.statement_type = self.statement_type, None
+        if statement_type is not None:
+            return await self._connection.run_in_thread(
+                _execute_with_statement_type,
+                self._cursor.executemany,
+                statement_type,
+                operation,
+                seq_of_parameters,
+            )
+        return await self._connection.run_in_thread(
+            self._cursor.executemany, operation, seq_of_parameters
+        )
+
+    async def fetchone(self):
+        return await self._connection.run_in_thread(self._cursor.fetchone)
+
+    async def fetchmany(self, size=None):
+        return await self._connection.run_in_thread(self._cursor.fetchmany, size)
+
+    async def fetchall(self):
+        return await self._connection.run_in_thread(self._cursor.fetchall)
+
+    async def nextset(self):
+        return None
+
+    async def setinputsizes(self, *inputsizes):
+        return None
+
+    async def close(self):
+        self._cursor.close()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        while True:
+            rows = await self.fetchmany()
+            if not rows:
+                return
+            for row in rows:
+                yield row
+
+
+class AsyncSpannerConnection:
+    """An asyncio wrapper around a Spanner DB API connection.
+
+    The wrapped connection is only used from the worker thread of this
+    wrapper. Attributes that are not defined by the wrapper, such as
+    ``read_only`` and ``staleness``, are read from and written to the
+    wrapped connection.
+    """
+
+    def __init__(self, connection, executor):
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_executor", executor)
+
+    def __getattr__(self, key):
+        return getattr(self._connection, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._connection, key, value)
+
+    async def run_in_thread(self, function, *args):
+        """Run the given function on the worker thread of this connection."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args)
+        )
+
+    def cursor(self):
+        return AsyncSpannerCursor(self, self._connection.cursor())
+
+    async def commit(self):
+        await self.run_in_thread(self._connection.commit)
+
+    async def rollback(self):
+        await self.run_in_thread(self._connection.rollback)
+
+    async def close(self):
+        try:
+            await self.run_in_thread(self._connection.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+class AsyncAdapt_spanner_cursor(AsyncAdapt_dbapi_cursor):
+    __slots__ = ()
+
+    @property
+    def connection(self):
+        return self._adapt_connection
+
+    @property
+    def request_tag(self):
+        return self._cursor.request_tag
+
+    @request_tag.setter
+    def request_tag(self, value):
+        self._cursor.request_tag = value
+
+
+class AsyncAdapt_spanner_ss_cursor(
+    AsyncAdapt_dbapi_ss_cursor, AsyncAdapt_spanner_cursor
+):
+    __slots__ = ()
+
+
+class AsyncAdapt_spanner_connection(AsyncAdapt_dbapi_connection):
+    """Adapts an :class:`AsyncSpannerConnection` to the sync DB API interface.
+
+    Spanner specific attributes, such as ``read_only``, ``staleness`` and
+    ``database``, are passed through to the DB API connection, so the
+    dialect can use them in the same way as for a synchronous connection.
+    """
+
+    _cursor_cls = AsyncAdapt_spanner_cursor
+    _ss_cursor_cls = AsyncAdapt_spanner_ss_cursor
+
+    __slots__ = ()
+
+    _adapted_attributes = frozenset(("dbapi", "_connection", "_execute_mutex"))
+
+    def __getattr__(self, key):
+        if key in self._adapted_attributes:
+            raise AttributeError(key)
+        return getattr(self._connection, key)
+
+    def __setattr__(self, key, value):
+        if key in self._adapted_attributes:
+            object.__setattr__(self, key, value)
+        else:
+            setattr(self._connection, key, value)
+
+    @property
+    def connection(self):
+        """The Spanner DB API connection that is wrapped by this adapter."""
+        return self._connection._connection
+
+    def run_in_thread(self, function, *args):
+        """Run a blocking function on the worker thread of this connection."""
+        return self.await_(self._connection.run_in_thread(function, *args))
+
+    def start_batch_dml(self, cursor):
+        # The DB API keeps a reference to the cursor of the batch and sets
+        # the results of the batch on it, so it must be a DB API cursor.
+        self.connection.start_batch_dml(self.connection.cursor())
+
+
+class AsyncAdapt_spanner_dbapi(AsyncAdapt_dbapi_module):
+    def __init__(self, spanner_dbapi):
+        self.spanner_dbapi = spanner_dbapi
+        self.paramstyle = spanner_dbapi.paramstyle
+        for name in (
+            "Warning",
+            "Error",
+            "InterfaceError",
+            "DatabaseError",
+            "DataError",
+            "OperationalError",
+            "IntegrityError",
+            "InternalError",
+            "ProgrammingError",
+            "NotSupportedError",
+            "Binary",
+            "Date",
+            "Time",
+            "Timestamp",
+            "DateFromTicks",
+            "TimeFromTicks",
+            "TimestampFromTicks",
+            "STRING",
+            "BINARY",
+            "NUMBER",
+            "DATETIME",
+            "ROWID",
+        ):
+            setattr(self, name, getattr(spanner_dbapi, name))
+
+    def connect(self, *args, **kwargs):
+        return self.connect_with(self.spanner_dbapi.connect, *args, **kwargs)
+
+    def connect_with(self, connect, *args, **kwargs):
+        """Create a connection with the given DB API connect function."""
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlalchemy-spanner"
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            connection = await_only(
+                loop.run_in_executor(
+                    executor,
+                    functools.partial(connect, *args, **kwargs),
+                )
+            )
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        return AsyncAdapt_spanner_connection(
+            self, AsyncSpannerConnection(connection, executor)
+        )
+
+
+class SpannerAsyncQueuePool(_PoolCheckoutMetrics, pool.AsyncAdaptedQueuePool):
+    """The default connection pool of the asyncio dialect."""
+
+
+class SpannerAsyncExecutionContext(SpannerExecutionContext):
+    def create_server_side_cursor(self):
+        return self._dbapi_connection.cursor(server_side=True)
+
+
+class SpannerAsyncDialect(SpannerDialect):
+    """Cloud Spanner dialect for asyncio applications.
+
+    Results of statements that are executed with the ``stream_results``
+    execution option, or with ``AsyncConnection.stream()``, are fetched from
+    Spanner in batches while they are iterated.
+
+    Schema reflection is executed on the worker thread of the connection.
+    """
+
+    driver = "spanner_async"
+    is_async = True
+    supports_statement_cache = True
+
+    execution_ctx_cls = SpannerAsyncExecutionContext
+
+    @classmethod
+    def import_dbapi(cls):
+        return AsyncAdapt_spanner_dbapi(spanner_dbapi)
+
+    @classmethod
+    def get_pool_class(cls, url):
+        return SpannerAsyncQueuePool
+
+    @classmethod
+    def engine_created(cls, engine):
+        # A connection of an asyncio engine can only be created from a
+        # coroutine, so the first connection warms up the session pool.
+        pass
+
+    def do_rollback(self, dbapi_connection):
+        self._abort_dml_batch(dbapi_connection)
+        transaction = dbapi_connection._transaction
+        if transaction and (transaction.rolled_back or transaction.committed):
+            return
+        trace_attributes = {
+            "db.instance": dbapi_connection.database.name
+            if dbapi_connection.database
+            else ""
+        }
+        started = dbapi_connection._spanner_transaction_started
+        with trace_call("SpannerSqlAlchemy.Rollback", trace_attributes):
+            dbapi_connection.rollback()
+        if started:
+            record_rollback()
+
+    def _connect_shared(self, registry, cargs, cparams):
+        # Creating the shared database can create sessions, so it runs on
+        # the worker thread of the new connection.
+        return self.loaded_dbapi.connect_with(registry.connect, *cargs, **cparams)
+
+    def _run_reflection(self, connection, function, *args, **kwargs):
+        # The reflection queries are blocking calls, so the whole reflection
+        # method runs on the worker thread of the connection.
+        if getattr(_reflection_thread, "active", False):
+            return function(self, connection, *args, **kwargs)
+        return connection.connection.run_in_thread(
+            functools.partial(_reflect, function, self, connection, *args, **kwargs)
+        )
+
+    def _validate_connection(self, dbapi_connection):
+        dbapi_connection.run_in_thread(dbapi_connection.connection.validate)
+
+    def _run_dml_batch(self, connection):
+        if connection.info.get(_PENDING_DML_BATCH):
+            connection.run_in_thread(super()._run_dml_batch, connection)
+
+    def _run_ddl_batch(self, connection):
+        if connection._ddl_statements:
+            connection.run_in_thread(super()._run_ddl_batch, connection)
+
+    def _execute_insert_as_mutations(self, cursor, context):
+        # Committing mutations is a blocking call, so the whole operation
+        # runs on the worker thread of the connection.
+        return cursor.connection.run_in_thread(
+            super()._execute_insert_as_mutations, cursor, context
+        )
+
+    def _execute_partitioned_query(self, cursor, statement, parameters, context):
+        # The partitions are executed by the DB API cursor on the worker
+        # thread of the connection. The rows are buffered afterwards in the
+        # same way as for any other statement, unless the cursor is a server
+        # side cursor, which fetches the rows from the DB API cursor.
+        dbapi_cursor = cursor._cursor._cursor
+        executed = cursor.connection.run_in_thread(
+            super()._execute_partitioned_query,
+            dbapi_cursor,
+            statement,
+            parameters,
+            context,
+        )
+        if executed and not context._is_server_side:
+            cursor._rows = collections.deque(
+                cursor.connection.run_in_thread(dbapi_cursor.fetchall)
+            )
+        return executed
+
+    def _cursor_execute(self, cursor, statement, parameters, context):
+        # The statement type is passed to the asyncio cursor, which executes
+        # the statement on the worker thread of the connection.
+        cursor._cursor.statement_type = _known_statement_type(statement, context)
+        if parameters is None:
+            cursor.execute(statement)
+        else:
+            cursor.execute(statement, parameters)
+
+    def _cursor_executemany(self, cursor, statement, parameters, context):
+        statement_type = _known_statement_type(statement, context)
+        if statement_type is StatementType.QUERY:
+            statement_type = None
+        cursor._cursor.statement_type = statement_type
+        cursor.executemany(statement, parameters)
+
+    def _execute_point_read(self, cursor, context):
+        # The read is executed by the DB API cursor on the worker thread of
+        # the connection, and the rows are buffered in the same way as for a
+        # partitioned query.
+        if not context.execution_options.get("point_reads"):
+            return False
+        dbapi_cursor = cursor._cursor._cursor
+        executed = cursor.connection.run_in_thread(
+            super()._execute_point_read, dbapi_cursor, context
+        )
+        if executed and not context._is_server_side:
+            cursor._rows = collections.deque(
+                cursor.connection.run_in_thread(dbapi_cursor.fetchall)
+            )
+        return executed
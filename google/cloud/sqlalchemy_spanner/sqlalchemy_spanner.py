@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
-
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import copy
 import re
+import sys
+import threading
+import time
 
 from alembic.ddl.base import (
     ColumnNullable,
@@ -23,17 +28,30 @@ from alembic.ddl.base import (
     format_server_default,
     format_type,
 )
+from alembic.ddl.impl import DefaultImpl
 from google.api_core.client_options import ClientOptions
 from google.auth.credentials import AnonymousCredentials
-from google.cloud.spanner_v1 import Client, TransactionOptions
-from sqlalchemy.exc import NoSuchTableError
+from google.cloud.spanner_v1 import Client, TransactionOptions, param_types
+from sqlalchemy.exc import CompileError, NoSuchTableError
 from sqlalchemy.sql import elements
-from sqlalchemy import ForeignKeyConstraint, types, TypeDecorator, PickleType
+from sqlalchemy import (
+    Column,
+    ForeignKeyConstraint,
+    event,
+    MetaData,
+    Table,
+    types,
+    TypeDecorator,
+    PickleType,
+)
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.cursor import CursorFetchStrategy
 from sqlalchemy.engine.default import DefaultDialect, DefaultExecutionContext
 from sqlalchemy.event import listens_for
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.pool import Pool
+from sqlalchemy.orm import UserDefinedOption
+from sqlalchemy.pool import Pool, QueuePool
+from sqlalchemy.schema import DDLElement
 from sqlalchemy.sql.compiler import (
     selectable,
     DDLCompiler,
@@ -45,13 +63,36 @@ from sqlalchemy.sql.compiler import (
 )
 from sqlalchemy.sql.default_comparator import operator_lookup
 from sqlalchemy.sql.operators import json_getitem_op
-from sqlalchemy.sql import expression
+from sqlalchemy.sql import expression, operators
 
+from google.cloud.spanner_v1 import KeySet
 from google.cloud.spanner_v1.data_types import JsonObject
+from google.cloud.spanner_v1.merged_result_set import MergedResultSet
 from google.cloud import spanner_dbapi
+from google.cloud.spanner_dbapi import parse_utils
+from google.cloud.spanner_dbapi.batch_dml_executor import BatchMode
+from google.cloud.spanner_dbapi.parse_utils import get_param_types
+from google.cloud.spanner_dbapi.parsed_statement import (
+    AutocommitDmlMode,
+    ParsedStatement,
+    Statement,
+    StatementType,
+)
+from google.cloud.spanner_dbapi.utils import PeekIterator
+from google.cloud.sqlalchemy_spanner import _database_registry
+from google.cloud.sqlalchemy_spanner._opentelemetry_metrics import (
+    get_metrics,
+    instrument_retries,
+    measure_commit,
+    measure_execute,
+    record_pool_checkout,
+    record_rollback,
+    statement_kind,
+)
 from google.cloud.sqlalchemy_spanner._opentelemetry_tracing import trace_call
 from google.cloud.sqlalchemy_spanner import version as sqlalchemy_spanner_version
 import sqlalchemy
+import sqlparse
 
 USING_SQLACLCHEMY_20 = False
 if sqlalchemy.__version__.split(".")[0] == "2":
@@ -72,6 +113,239 @@ def reset_connection(dbapi_conn, connection_record, reset_state=None):
 
         dbapi_conn.staleness = None
         dbapi_conn.read_only = False
+        if dbapi_conn.autocommit_dml_mode is not AutocommitDmlMode.TRANSACTIONAL:
+            dbapi_conn.set_autocommit_dml_mode(AutocommitDmlMode.TRANSACTIONAL)
+        connection_record.info.pop(_METADATA_DDL_RUNNERS, None)
+        if connection_record.info.pop(_DDL_BATCH, None):
+            # A DDL batch that was not finished, for example because
+            # create_all failed. The statements in the batch are discarded.
+            dbapi_conn._ddl_statements.clear()
+
+
+# The key in the info dictionary of a pooled connection that holds the
+# statements that have been added to the DML batch of the connection.
+_PENDING_DML_BATCH = "spanner_pending_dml_batch"
+
+# The key in the info dictionary of a pooled connection that holds the number
+# of DDL batches that have been started and not yet finished on the
+# connection. DDL statements are buffered while this is more than zero.
+_DDL_BATCH = "spanner_ddl_batch"
+
+# The key in the info dictionary of a pooled connection that holds the DDL
+# runners of the MetaData.create_all() and drop_all() calls that have started
+# a DDL batch on the connection.
+_METADATA_DDL_RUNNERS = "spanner_metadata_ddl_runners"
+
+# The attribute of a DB API connection that holds the time.monotonic() value
+# of the last statement, commit or ping that succeeded on the connection.
+_LAST_USED = "_sqlalchemy_spanner_last_used"
+
+# The prefix of the Spanner statement hints of a SELECT statement that are
+# join hints, for example ``JOIN@{JOIN_METHOD=HASH_JOIN}``. Join hints are
+# added to all joins in the statement.
+_JOIN_HINT_PREFIX = "JOIN"
+
+
+@contextlib.contextmanager
+def begin_ddl_batch(connection):
+    """Execute all DDL statements in the block as one batch.
+
+    DDL statements that are executed on the connection inside the block are
+    buffered, and sent to Spanner as one UpdateDatabaseDdl operation at the
+    end of the block. The statements are executed in the order that they
+    were executed on the connection. The batch is discarded if the block
+    raises an exception.
+
+    ``MetaData.create_all()`` and ``MetaData.drop_all()`` automatically
+    batch the DDL statements that they generate.
+
+    .. code:: python
+
+        with engine.connect() as connection:
+            with begin_ddl_batch(connection):
+                metadata.create_all(connection)
+                connection.execute(text("CREATE INDEX ..."))
+            connection.commit()
+
+    Args:
+        connection (sqlalchemy.engine.Connection): The connection to use.
+    """
+    dbapi_connection = connection.connection
+    dialect = connection.dialect
+    dialect._start_ddl_batch(dbapi_connection)
+    try:
+        yield
+    except BaseException:
+        dialect._abort_ddl_batch(dbapi_connection)
+        raise
+    dialect._end_ddl_batch(dbapi_connection)
+
+
+def _start_metadata_ddl_batch(target, connection, **kw):
+    """Start a DDL batch for MetaData.create_all() and drop_all()."""
+    if isinstance(connection.dialect, SpannerDialect):
+        connection.dialect._start_ddl_batch(
+            connection.connection, kw.get("_ddl_runner")
+        )
+
+
+def _end_metadata_ddl_batch(target, connection, **kw):
+    """Execute the DDL batch of MetaData.create_all() and drop_all()."""
+    if isinstance(connection.dialect, SpannerDialect):
+        connection.dialect._end_ddl_batch(connection.connection, kw.get("_ddl_runner"))
+
+
+def _running_ddl_runners():
+    """Return the ids of the DDL runners that are executing on this thread.
+
+    A DDL runner executes MetaData.create_all() or drop_all() in its
+    ``visit_metadata`` method, which is on the call stack until the call
+    finishes or fails.
+    """
+    runners = set()
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_name == "visit_metadata":
+            runners.add(id(frame.f_locals.get("self")))
+        frame = frame.f_back
+    return runners
+
+
+def _listen_for_metadata_ddl():
+    """Batch the DDL statements of MetaData.create_all() and drop_all().
+
+    The listeners are registered when the first Spanner dialect is created,
+    and not when this module is imported, so applications that import the
+    dialect without using it are not affected.
+    """
+    if event.contains(MetaData, "before_create", _start_metadata_ddl_batch):
+        return
+    for identifier in ("before_create", "before_drop"):
+        event.listen(MetaData, identifier, _start_metadata_ddl_batch)
+    for identifier in ("after_create", "after_drop"):
+        event.listen(MetaData, identifier, _end_metadata_ddl_batch)
+
+
+def _format_hint_values(hints):
+    """Format a dictionary of hints as ``NAME=value`` pairs."""
+    pairs = []
+    for name, value in hints.items():
+        if isinstance(value, bool):
+            value = "TRUE" if value else "FALSE"
+        pairs.append("%s=%s" % (name, value))
+    return ", ".join(pairs)
+
+
+def spanner_hints(query, statement=None, join=None, tables=None):
+    """Add Spanner statement, join and table hints to a query.
+
+    The hints are given as dictionaries of hint names and values. Boolean
+    values are rendered as ``TRUE`` and ``FALSE``. Statement hints are
+    rendered in front of the statement, join hints are added to all joins in
+    the statement, and table hints are added after the given tables.
+
+    .. code:: python
+
+        stmt = spanner_hints(
+            select(Singer.name, Album.title).join(Album.singer),
+            statement={"USE_ADDITIONAL_PARALLELISM": True},
+            join={"JOIN_METHOD": "HASH_JOIN"},
+            tables={Album: {"FORCE_INDEX": "idx_albums_title"}},
+        )
+        # @{USE_ADDITIONAL_PARALLELISM=TRUE} SELECT ...
+        # FROM albums @{FORCE_INDEX=idx_albums_title}
+        # JOIN@{JOIN_METHOD=HASH_JOIN} singers ON ...
+
+    Args:
+        query (sqlalchemy.sql.expression.Select): The query to add the hints
+            to. An ORM ``Query`` is also accepted.
+        statement (dict): Optional. The statement hints.
+        join (dict): Optional. The join hints.
+        tables (dict): Optional. The table hints for each table or entity.
+
+    Returns:
+        sqlalchemy.sql.expression.Select: A copy of the query with the hints.
+    """
+    if statement:
+        query = query.with_statement_hint(
+            _format_hint_values(statement), dialect_name=SpannerDialect.name
+        )
+    if join:
+        query = query.with_statement_hint(
+            "%s@{%s}" % (_JOIN_HINT_PREFIX, _format_hint_values(join)),
+            dialect_name=SpannerDialect.name,
+        )
+    for table, hints in (tables or {}).items():
+        query = query.with_hint(
+            table,
+            "@{%s}" % _format_hint_values(hints),
+            dialect_name=SpannerDialect.name,
+        )
+    return query
+
+
+class _IndexHintOption(UserDefinedOption):
+    """An ORM option that adds a FORCE_INDEX hint for an entity."""
+
+    propagate_to_loaders = True
+
+    def __init__(self, entity, index_name):
+        super().__init__((entity, index_name))
+
+
+def with_index(entity, index_name):
+    """Force the use of a secondary index for an entity in ORM queries.
+
+    The returned option is added to a query with ``options()``. The option
+    adds a ``FORCE_INDEX`` table hint for the table of the entity, also to
+    the queries that load the relationships of the results. The option is
+    applied by the sessions that :func:`install_index_hints` was called for.
+
+    .. code:: python
+
+        Session = sessionmaker(engine)
+        install_index_hints(Session)
+
+        session.scalars(
+            select(Album)
+            .where(Album.title == "Blue")
+            .options(with_index(Album, "idx_albums_title"))
+        )
+        # SELECT ... FROM albums @{FORCE_INDEX=idx_albums_title} WHERE ...
+
+    Args:
+        entity: The mapped class or table to add the hint for.
+        index_name (str): The name of the index to use.
+
+    Returns:
+        sqlalchemy.orm.UserDefinedOption: The option to add to the query.
+    """
+    return _IndexHintOption(entity, index_name)
+
+
+def install_index_hints(session_factory):
+    """Apply the :func:`with_index` options of the ORM queries of sessions.
+
+    Args:
+        session_factory: The sessions to apply the options for. This can be a
+            ``sessionmaker``, a ``Session`` subclass or a single ``Session``.
+    """
+    if not event.contains(session_factory, "do_orm_execute", _add_index_hints):
+        event.listen(session_factory, "do_orm_execute", _add_index_hints)
+
+
+def _add_index_hints(orm_execute_state):
+    """Add the table hints of with_index() options to an ORM query."""
+    if not orm_execute_state.is_select:
+        return
+    for option in orm_execute_state.user_defined_options:
+        if isinstance(option, _IndexHintOption):
+            entity, index_name = option.payload
+            orm_execute_state.statement = orm_execute_state.statement.with_hint(
+                entity,
+                "@{FORCE_INDEX=%s}" % index_name,
+                dialect_name=SpannerDialect.name,
+            )
 
 
 # register a method to get a single value of a JSON object
@@ -107,6 +381,96 @@ class SpannerPickleType(TypeDecorator):
         return process
 
 
+class _ArrayValue(list):
+    """The value of an array parameter that replaces an expanding IN parameter.
+
+    The Spanner DB API looks up the type of a query parameter by the class of
+    its value in ``parse_utils.TYPES_MAP``. Each element type of an array
+    parameter has its own subclass, see :func:`_array_value_class`.
+    """
+
+
+# The subclasses of _ArrayValue by the name of their element type.
+_array_value_classes = {}
+
+
+def _array_value_class(element_type, element_param_type):
+    """Return the list class of array parameters with the given element type.
+
+    The class is registered in ``parse_utils.TYPES_MAP``, so the Spanner DB
+    API sends a value of the class with the type
+    ``ARRAY<element_type>``.
+
+    Args:
+        element_type (str): The name of the element type, for example
+            ``INT64`` or ``STRUCT<INT64, STRING>``.
+        element_param_type (google.cloud.spanner_v1.Type): The element type.
+
+    Returns:
+        type: A subclass of :class:`_ArrayValue`.
+    """
+    value_class = _array_value_classes.get(element_type)
+    if value_class is None:
+        value_class = type("_ArrayValue", (_ArrayValue,), {})
+        parse_utils.TYPES_MAP[value_class] = param_types.Array(element_param_type)
+        value_class = _array_value_classes.setdefault(element_type, value_class)
+    return value_class
+
+
+class _UnnestArray(types.TypeEngine):
+    """The type of an array parameter that replaces an expanding IN parameter.
+
+    The bind processor of the element type is applied to each element. The
+    elements of a tuple IN parameter are tuples, and the bind processors of
+    the tuple type are applied to each field of the tuples.
+    """
+
+    def __init__(self, item_type, element_type, element_param_type):
+        self.item_type = item_type
+        self.element_type = element_type
+        self.element_param_type = element_param_type
+
+    def bind_processor(self, dialect):
+        value_class = _array_value_class(self.element_type, self.element_param_type)
+        if self.item_type._is_tuple_type:
+            field_processors = [
+                field_type._cached_bind_processor(dialect)
+                for field_type in self.item_type.types
+            ]
+
+            def process_item(item):
+                return [
+                    processor(value) if processor else value
+                    for processor, value in zip(field_processors, item)
+                ]
+
+        else:
+            process_item = self.item_type._cached_bind_processor(dialect)
+
+        def process(value):
+            if value is None:
+                return None
+            if process_item is None:
+                return value_class(value)
+            return value_class(process_item(item) for item in value)
+
+        return process
+
+
+# The Spanner types that an IN list can be sent as an array parameter for.
+_UNNEST_TYPES = {
+    "BOOL": param_types.BOOL,
+    "BYTES": param_types.BYTES,
+    "DATE": param_types.DATE,
+    "FLOAT32": param_types.FLOAT32,
+    "FLOAT64": param_types.FLOAT64,
+    "INT64": param_types.INT64,
+    "NUMERIC": param_types.NUMERIC,
+    "STRING": param_types.STRING,
+    "TIMESTAMP": param_types.TIMESTAMP,
+}
+
+
 # Spanner-to-SQLAlchemy types map
 _type_map = {
     "BOOL": types.Boolean,
@@ -166,6 +530,316 @@ def int_from_size(size_str):
     return _max_size if size_str == "MAX" else int(size_str)
 
 
+def _partitioned_query_rows(result_set, batch_snapshot):
+    """
+    Yield the rows of a partitioned query, and close the batch
+    snapshot of the query when all rows have been read.
+    """
+    try:
+        for row in result_set:
+            yield row
+    finally:
+        batch_snapshot.close()
+
+
+def _statement_type(context):
+    """
+    Return the DB API type of a compiled INSERT, UPDATE, DELETE or SELECT
+    statement, or None if the DB API must classify the SQL of the statement.
+
+    The DB API adds a WHERE clause to an UPDATE or DELETE statement without
+    one, as Spanner requires it, so these are classified by the DB API.
+    """
+    compiled = context.compiled
+    if compiled is None or context.isddl:
+        return None
+    if context.isinsert:
+        return StatementType.INSERT
+    if context.isupdate or context.isdelete:
+        if not getattr(compiled.statement, "_where_criteria", None):
+            return None
+        return StatementType.UPDATE
+    if context._is_query:
+        return StatementType.QUERY
+    return None
+
+
+# SQL that can contain comments or string literals is classified by the DB
+# API, which removes the comments with sqlparse.
+_COMMENTS_OR_LITERALS = re.compile(r"--|/\*|#|'|\"")
+
+# Textual statements that contain one of these keywords can be DDL statements.
+_DDL_KEYWORDS = re.compile(
+    r"\b(CREATE|ALTER|DROP|GRANT|REVOKE|RENAME|ANALYZE)\b", re.IGNORECASE
+)
+
+
+def _known_statement_type(statement, context):
+    """
+    Return the statement type of a compiled statement that can be executed
+    without being classified by the DB API, or None.
+    """
+    statement_type = context._statement_type if context is not None else None
+    if statement_type is None or _COMMENTS_OR_LITERALS.search(statement):
+        return None
+    return statement_type
+
+
+def _format_sql(sql):
+    # The same whitespace as the DB API sends for a statement without
+    # comments, so the SQL of a statement does not change.
+    return "\n".join(line.rstrip() for line in sql.strip().split("\n"))
+
+
+# The type of the compiled statement that a DB API cursor executes on this
+# thread, see _classify_statement().
+_statement_type_hint = threading.local()
+
+# The classify_statement() function of the DB API.
+_dbapi_classify_statement = parse_utils.classify_statement
+
+
+def _classify_statement(query, args=None):
+    """Classify a statement that is executed by a DB API cursor.
+
+    The dialect installs this function as ``parse_utils.classify_statement``
+    of the DB API, which ``Cursor.execute()`` and ``Cursor.executemany()``
+    call to determine the type of a statement. The DB API formats and parses
+    the SQL string with sqlparse for that. A statement that is executed with
+    :func:`_execute_with_statement_type` is classified with the type that it
+    was compiled as instead. All other statements are classified by the DB
+    API.
+    """
+    statement_type = getattr(_statement_type_hint, "statement_type", None)
+    if statement_type is None:
+        return _dbapi_classify_statement(query, args)
+    _statement_type_hint.statement_type = None
+    query, args = parse_utils.sql_pyformat_args_to_spanner(
+        _format_sql(query), args or None
+    )
+    return ParsedStatement(
+        statement_type, Statement(query, args, get_param_types(args))
+    )
+
+
+def _execute_with_statement_type(execute, statement_type, *args):
+    """Call a DB API cursor method for a statement with a known type.
+
+    Args:
+        execute (Callable): ``Cursor.execute`` or ``Cursor.executemany``.
+        statement_type (StatementType): The type of the statement.
+        args: The SQL string and the parameters of the statement.
+    """
+    _statement_type_hint.statement_type = statement_type
+    try:
+        return execute(*args)
+    finally:
+        _statement_type_hint.statement_type = None
+
+
+def _install_classify_statement():
+    """Classify compiled statements without parsing them in the DB API.
+
+    The function is installed when the first Spanner dialect is created, and
+    not when this module is imported, so applications that import the
+    dialect without using it are not affected.
+    """
+    parse_utils.classify_statement = _classify_statement
+
+
+class _PointRead:
+    """A query that only selects rows of a table by their primary key.
+
+    Such a query can be executed with a Read request with a KeySet, which
+    does not need to be parsed and planned by Spanner.
+
+    Args:
+        table (sqlalchemy.Table): The table to read from.
+        columns (list): The names of the columns to read.
+        key_params (list): The names of the parameters of the key. Either one
+            parameter for each primary key column, which together select one
+            row, or one parameter with a list of keys.
+        many (bool): Whether the parameter is a list of keys.
+        key_order (list): For a list of keys, the position of each primary
+            key column in the keys of the list, or None if the keys are not
+            tuples.
+    """
+
+    def __init__(self, table, columns, key_params, many=False, key_order=None):
+        self.table = table
+        self.columns = columns
+        self.key_params = key_params
+        self.many = many
+        self.key_order = key_order
+
+    def keys(self, context):
+        """Return the keys of the rows to read, or None if SQL must be used.
+
+        SQL is used for NULL key values, which do not select any rows in SQL,
+        and for empty lists of keys.
+        """
+        values = context.compiled_parameters[0]
+        key_columns = list(self.table.primary_key.columns)
+        if not self.many:
+            key = [
+                _bind_value(context, column, values[name])
+                for column, name in zip(key_columns, self.key_params)
+            ]
+            keys = [key]
+        else:
+            keys = []
+            for value in values[self.key_params[0]]:
+                if self.key_order is None:
+                    value = (value,)
+                keys.append(
+                    [
+                        _bind_value(context, column, value[index])
+                        for column, index in zip(key_columns, self.key_order or [0])
+                    ]
+                )
+        if not keys or any(value is None for key in keys for value in key):
+            return None
+        return keys
+
+
+def _bind_value(context, column, value):
+    processor = column.type._cached_bind_processor(context.dialect)
+    return processor(value) if processor is not None and value is not None else value
+
+
+def _point_read(compiled):
+    """Return the point read of a compiled query, or None.
+
+    The point read is determined once for each compiled statement. A query
+    is a point read if it selects columns of one table in the default
+    schema, and only filters on the complete primary key of the table:
+    either with a comparison for each primary key column, or with one IN
+    list of primary key values.
+    """
+    try:
+        return compiled._spanner_point_read
+    except AttributeError:
+        pass
+    try:
+        point_read = _analyze_point_read(compiled)
+    except (AttributeError, TypeError):
+        point_read = None
+    compiled._spanner_point_read = point_read
+    return point_read
+
+
+def _analyze_point_read(compiled):
+    statement = getattr(compiled.compile_state, "statement", None)
+    if not isinstance(statement, selectable.Select):
+        return None
+    if (
+        statement._limit_clause is not None
+        or statement._offset_clause is not None
+        or statement._order_by_clauses
+        or statement._group_by_clauses
+        or statement._having_criteria
+        or statement._distinct
+        or statement._for_update_arg is not None
+        or statement._setup_joins
+        or statement._hints
+        or statement._statement_hints
+        or statement._prefixes
+        or statement._suffixes
+    ):
+        return None
+    froms = statement.get_final_froms() if USING_SQLACLCHEMY_20 else statement.froms
+    if len(froms) != 1 or not isinstance(froms[0], Table) or froms[0].schema:
+        return None
+    table = froms[0]
+    # The IN lists that are sent as arrays are compiled with a copy of the
+    # bind parameter of the statement, so the names are found by key.
+    param_names = {bind.key: name for bind, name in compiled.bind_names.items()}
+
+    columns = []
+    for column in statement.selected_columns:
+        if isinstance(column, elements.Label):
+            column = column.element
+        if not isinstance(column, Column) or table.corresponding_column(column) is None:
+            return None
+        columns.append(column.name)
+
+    criteria = list(statement._where_criteria)
+    comparisons = []
+    while criteria:
+        criterion = criteria.pop()
+        if (
+            isinstance(criterion, elements.BooleanClauseList)
+            and criterion.operator is operators.and_
+        ):
+            criteria.extend(criterion.clauses)
+        elif isinstance(criterion, elements.BinaryExpression):
+            comparisons.append(criterion)
+        else:
+            return None
+
+    key_columns = [column.name for column in table.primary_key.columns]
+    if len(comparisons) == 1 and comparisons[0].operator is operators.in_op:
+        comparison = comparisons[0]
+        bind = comparison.right
+        if (
+            not isinstance(bind, elements.BindParameter)
+            or not bind.expanding
+            or bind.key not in param_names
+        ):
+            return None
+        left = comparison.left
+        if isinstance(left, elements.Tuple):
+            left_columns = [_key_column(table, c) for c in left.clauses]
+            if None in left_columns or len(set(left_columns)) != len(key_columns):
+                return None
+            key_order = [left_columns.index(c) for c in key_columns]
+        elif len(key_columns) == 1 and _key_column(table, left) == key_columns[0]:
+            key_order = None
+        else:
+            return None
+        return _PointRead(
+            table, columns, [param_names[bind.key]], many=True, key_order=key_order
+        )
+
+    binds = {}
+    for comparison in comparisons:
+        if comparison.operator is not operators.eq:
+            return None
+        column, bind = comparison.left, comparison.right
+        if isinstance(column, elements.BindParameter):
+            column, bind = bind, column
+        key_column = _key_column(table, column)
+        if (
+            key_column is None
+            or key_column in binds
+            or not isinstance(bind, elements.BindParameter)
+            or bind.expanding
+            or bind.key not in param_names
+        ):
+            return None
+        binds[key_column] = param_names[bind.key]
+    if len(binds) != len(key_columns):
+        return None
+    return _PointRead(table, columns, [binds[c] for c in key_columns])
+
+
+def _key_column(table, column):
+    """Return the name of the primary key column for a column, or None."""
+    if not isinstance(column, Column):
+        return None
+    column = table.corresponding_column(column)
+    if column is None or not column.primary_key:
+        return None
+    return column.name
+
+
+def _to_bool(value):
+    """Convert a boolean connection argument that can be set in a URL."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return bool(value)
+
+
 def engine_to_connection(function):
     """
     Decorator to initiate a connection to a
@@ -184,12 +858,150 @@ def engine_to_connection(function):
         if isinstance(connection, Engine):
             connection = connection.connect()
 
-        return function(self, connection, *args, **kwargs)
+        return self._run_reflection(connection, function, *args, **kwargs)
 
     return wrapper
 
 
+def cache_reflection(function):
+    """
+    Decorator to cache the result of a get_multi_* reflection
+    method when the reflection cache of the dialect is enabled.
+
+    The cache stores the information of all objects in a schema,
+    so calls for different subsets of tables are served from
+    the same entry. All other keyword arguments, such as ``scope``
+    and ``kind``, are part of the cache key, except for the
+    ``info_cache`` of the inspector.
+    """
+
+    def wrapper(self, connection, schema=None, filter_names=None, **kw):
+        key = None
+        if self.reflection_cache_ttl:
+            key = (
+                connection.connection.database.name,
+                schema or "",
+                function.__name__,
+                tuple(
+                    sorted(
+                        (name, value)
+                        for name, value in kw.items()
+                        if name != "info_cache"
+                    )
+                ),
+            )
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+        if key is None:
+            return function(
+                self, connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        now = time.monotonic()
+        entry = self._reflection_cache.get(key)
+        if entry is None or entry[0] <= now:
+            result = function(self, connection, schema=schema, filter_names=None, **kw)
+            entry = (now + self.reflection_cache_ttl, result)
+            self._reflection_cache[key] = entry
+
+        result = entry[1]
+        if filter_names is not None:
+            schema = schema or None
+            result = {
+                (schema, name): result[(schema, name)]
+                for name in filter_names
+                if (schema, name) in result
+            }
+        # SQLAlchemy and event listeners may modify the reflected information.
+        return copy.deepcopy(result)
+
+    return wrapper
+
+
+# The execution options that set the query options of a query, and the
+# statement hints that they are sent as.
+_QUERY_OPTION_HINTS = {
+    "optimizer_version": "OPTIMIZER_VERSION",
+    "optimizer_statistics_package": "OPTIMIZER_STATISTICS_PACKAGE",
+}
+
+
+class _RowCountingFetchStrategy(CursorFetchStrategy):
+    """
+    Fetches rows from a DB API cursor, and records the number of rows that
+    were fetched when the result is closed.
+    """
+
+    __slots__ = ("_dialect_metrics", "_attributes", "_rows")
+
+    def __init__(self, dialect_metrics, attributes):
+        self._dialect_metrics = dialect_metrics
+        self._attributes = attributes
+        self._rows = 0
+
+    def _record(self):
+        self._dialect_metrics.rows_returned.record(self._rows, self._attributes)
+
+    def soft_close(self, result, dbapi_cursor):
+        self._record()
+        super().soft_close(result, dbapi_cursor)
+
+    def hard_close(self, result, dbapi_cursor):
+        self._record()
+        super().hard_close(result, dbapi_cursor)
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        row = super().fetchone(result, dbapi_cursor, hard_close)
+        if row is not None:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        rows = super().fetchmany(result, dbapi_cursor, size)
+        if rows:
+            self._rows += len(rows)
+        return rows
+
+    def fetchall(self, result, dbapi_cursor):
+        # The rows are counted before the result is closed.
+        try:
+            rows = dbapi_cursor.fetchall()
+            self._rows += len(rows)
+            result._soft_close()
+            return rows
+        except BaseException as e:
+            self.handle_exception(result, dbapi_cursor, e)
+
+
+class _PoolCheckoutMetrics:
+    """Records the time it takes to check out a connection from a pool."""
+
+    def _do_get(self):
+        if get_metrics() is None:
+            return super()._do_get()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            record_pool_checkout(time.perf_counter() - start)
+
+
+class SpannerQueuePool(_PoolCheckoutMetrics, QueuePool):
+    """The default connection pool of the dialect."""
+
+
 class SpannerExecutionContext(DefaultExecutionContext):
+    # Set if this statement switched the DB API connection to Partitioned DML.
+    _partitioned_dml = False
+
+    # Set if the statement is a compiled query.
+    _is_query = False
+
+    # The DB API statement type of a compiled query or DML statement.
+    _statement_type = None
+
     def pre_exec(self):
         """
         Apply execution options to the DB API connection before
@@ -227,6 +1039,84 @@ class SpannerExecutionContext(DefaultExecutionContext):
                     "ignore_transaction_warnings"
                 ] = ignore_transaction_warnings
 
+        statement = getattr(self.compiled, "statement", None)
+        # The SQL of a textual select is not known to be a query.
+        self._is_query = getattr(statement, "is_select", False) and not isinstance(
+            statement, expression.TextualSelect
+        )
+        self._statement_type = _statement_type(self)
+        self._apply_query_options()
+
+        dialect_metrics = get_metrics()
+        if dialect_metrics is not None and not (
+            self._is_server_side or self.execution_options.get("stream_results")
+        ):
+            self.cursor_fetch_strategy = _RowCountingFetchStrategy(
+                dialect_metrics, {"db.operation": statement_kind(self)}
+            )
+
+        if self.execution_options.get("partitioned_dml"):
+            # Partitioned DML is only used for this statement. The DML mode
+            # is reset in post_exec, or when the statement fails.
+            self._dbapi_connection.connection.set_autocommit_dml_mode(
+                AutocommitDmlMode.PARTITIONED_NON_ATOMIC
+            )
+            self._partitioned_dml = True
+
+    def _apply_query_options(self):
+        """
+        Add the ``optimizer_version`` and ``optimizer_statistics_package``
+        execution options of a query to the statement hint of the query.
+
+        The DB API can't set the QueryOptions of an ExecuteSql request, so
+        the options are sent as the equivalent statement hints, which
+        Spanner applies in the same way, and which take precedence over the
+        query options of the client. Hints in the statement itself take
+        precedence over the execution options.
+        """
+        hints = {}
+        for option, hint in _QUERY_OPTION_HINTS.items():
+            value = self.execution_options.get(option)
+            if value is not None:
+                hints[hint] = value
+        if not hints or not self._is_query:
+            return
+        if hints.get("OPTIMIZER_VERSION") == "latest":
+            hints["OPTIMIZER_VERSION"] = "latest_version"
+        self.statement = _add_statement_hints(self.statement, hints)
+
+    def post_exec(self):
+        super(SpannerExecutionContext, self).post_exec()
+        self._reset_dml_mode()
+        setattr(self._dbapi_connection.connection, _LAST_USED, time.monotonic())
+
+    def handle_dbapi_exception(self, e):
+        super(SpannerExecutionContext, self).handle_dbapi_exception(e)
+        self._reset_dml_mode()
+
+    def _reset_dml_mode(self):
+        """
+        Reset the DML mode of the DB API connection after a statement that
+        was executed with the ``partitioned_dml`` execution option.
+        """
+        if self._partitioned_dml:
+            self._partitioned_dml = False
+            self._dbapi_connection.connection.set_autocommit_dml_mode(
+                AutocommitDmlMode.TRANSACTIONAL
+            )
+
+    def create_server_side_cursor(self):
+        """
+        Create a cursor for a statement that is executed with the
+        ``stream_results`` or ``yield_per`` execution option.
+
+        The Spanner DB API cursor reads the PartialResultSets of an
+        ExecuteStreamingSql call while rows are fetched, and SQLAlchemy
+        fetches rows in batches of at most ``max_row_buffer`` or
+        ``yield_per`` rows, so the full result is never held in memory.
+        """
+        return self._dbapi_connection.cursor()
+
     def fire_sequence(self, seq, type_):
         """Builds a statement for fetching next value of the sequence."""
         return self._execute_scalar(
@@ -237,6 +1127,86 @@ class SpannerExecutionContext(DefaultExecutionContext):
             type_,
         )
 
+    def get_insert_mutation(self):
+        """Convert the INSERT statement of this context into a mutation.
+
+        Returns:
+            Optional[Tuple[str, str, List[str], List[list]]]:
+                The name of the mutation method (``insert`` or
+                ``insert_or_update``), the table name, the column names and
+                the rows to write. None if the statement can't be executed
+                as a mutation, for example because it has a THEN RETURN
+                clause or contains SQL expressions.
+        """
+        compiled = self.compiled
+        if compiled is None or not self.isinsert or not self.compiled_parameters:
+            return None
+        statement = compiled.statement
+        if (
+            compiled.effective_returning
+            or getattr(statement, "select", None) is not None
+            or getattr(statement, "_post_values_clause", None) is not None
+        ):
+            return None
+
+        prefixes = [str(prefix).strip().upper() for prefix, _ in statement._prefixes]
+        if not prefixes:
+            method = "insert"
+        elif prefixes == ["OR UPDATE"]:
+            method = "insert_or_update"
+        else:
+            # INSERT OR IGNORE has no mutation equivalent.
+            return None
+
+        # Columns that are not bound as parameters must be filled by a
+        # server-side default. Any other SQL expression requires DML.
+        for column in compiled.postfetch:
+            if column.server_default is None or column.default is not None:
+                return None
+
+        table = statement.table
+        if statement._multi_values:
+            # A multi-values INSERT has one set of parameters, with a suffix
+            # for each row in the name of the parameters.
+            params = self.compiled_parameters[0]
+            row_count = sum(len(rows) for rows in statement._multi_values)
+            # SQLAlchemy 1.4 does not add a suffix to the first row.
+            suffix = "_m0" if USING_SQLACLCHEMY_20 else ""
+            keys = [key for key in table.c.keys() if key + suffix in params]
+            bind_names = [
+                [key if i == 0 and not suffix else "%s_m%d" % (key, i) for key in keys]
+                for i in range(row_count)
+            ]
+            param_sets = [params] * row_count
+            if len(keys) * row_count != len(params):
+                return None
+        else:
+            param_sets = self.compiled_parameters
+            keys = list(param_sets[0])
+            bind_names = [keys] * len(param_sets)
+        if not keys or not all(key in table.c for key in keys):
+            return None
+
+        processors = compiled._bind_processors
+        rows = []
+        for row_params, names in zip(param_sets, bind_names):
+            row = []
+            for name in names:
+                if name not in row_params:
+                    return None
+                value = row_params[name]
+                processor = processors.get(name)
+                if processor is not None and value is not None:
+                    value = processor(value)
+                row.append(value)
+            rows.append(row)
+
+        table_name = table.name
+        effective_schema = self.identifier_preparer.schema_for_object(table)
+        if effective_schema:
+            table_name = f"{effective_schema}.{table_name}"
+        return method, table_name, [table.c[key].name for key in keys], rows
+
 
 class SpannerIdentifierPreparer(IdentifierPreparer):
     """Identifiers compiler.
@@ -267,6 +1237,116 @@ class SpannerIdentifierPreparer(IdentifierPreparer):
         )
 
 
+def _is_join_hint(hint_text):
+    """Return True if a statement hint text is a ``JOIN@{...}`` join hint."""
+    return hint_text.strip().startswith(_JOIN_HINT_PREFIX + "@{")
+
+
+def _insert_join_hints(text, join_keyword, hints):
+    """Insert join hints after the join keyword of a rendered join.
+
+    The join keyword of the join is the first occurrence of the keyword that
+    is not in parentheses or quotes. Joins on the left side of the join are
+    rendered with their hints, so their keywords do not match.
+    """
+    depth = 0
+    quote = None
+    for index, char in enumerate(text):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and text.startswith(join_keyword, index):
+            end = index + len(join_keyword.rstrip())
+            return text[:end] + hints + text[end:]
+    return text
+
+
+def _format_hints(hint_texts):
+    """Join hint texts to one ``@{...}`` hint, or return None if empty.
+
+    A hint text is either a single ``HINT=value`` pair or a complete
+    ``@{...}`` hint.
+    """
+    hints = []
+    for hint_text in hint_texts:
+        hint_text = hint_text.strip()
+        if _is_join_hint(hint_text):
+            hint_text = hint_text.replace(_JOIN_HINT_PREFIX, "", 1)
+        if hint_text.startswith("@{") and hint_text.endswith("}"):
+            hint_text = hint_text[2:-1]
+        hints.append(hint_text)
+    if not hints:
+        return None
+    return "@{%s}" % ", ".join(hints)
+
+
+def _add_statement_hints(statement, hints):
+    """Add hints to the statement hint in front of a statement.
+
+    Hints that are already in the statement hint are not added.
+
+    Args:
+        statement (str): The SQL statement.
+        hints (dict): The names and values of the hints to add.
+
+    Returns:
+        str: The statement with the hints.
+    """
+    hint_texts = []
+    if statement.startswith("@{"):
+        hint_text, statement = statement[2:].split("}", 1)
+        hint_texts.append(hint_text)
+        existing = {hint.split("=")[0].strip().upper() for hint in hint_text.split(",")}
+        hints = {name: value for name, value in hints.items() if name not in existing}
+        statement = statement.lstrip()
+    hint_texts.extend("%s=%s" % (name, value) for name, value in hints.items())
+    return "%s %s" % (_format_hints(hint_texts), statement)
+
+
+class _SchemaAlias:
+    """The alias of a schema-qualified table.
+
+    Caches the columns of the alias that correspond to the columns of the
+    table, so the correspondence is only determined once for each column.
+    The alias is only valid as long as the columns of the table do not
+    change, see :meth:`matches`.
+    """
+
+    def __init__(self, table):
+        self.alias = table.alias()
+        self._table_columns = tuple(table.c)
+        # Only contains the columns of the table, which live as long as the
+        # alias.
+        self._columns = {}
+
+    def matches(self, table):
+        """Returns True if the table has the columns that the alias was created for.
+
+        Columns that are added to the table with ``Table.append_column`` or
+        by reflecting the table again with ``extend_existing=True`` are not
+        in the alias.
+        """
+        columns = table.c
+        return len(columns) == len(self._table_columns) and all(
+            column is table_column
+            for column, table_column in zip(columns, self._table_columns)
+        )
+
+    def corresponding_column(self, column):
+        try:
+            return self._columns[column]
+        except KeyError:
+            converted = elements._corresponding_column_or_error(self.alias, column)
+            self._columns[column] = converted
+            return converted
+
+
 class SpannerSQLCompiler(SQLCompiler):
     """Spanner SQL statements compiler."""
 
@@ -286,6 +1366,62 @@ class SpannerSQLCompiler(SQLCompiler):
         """
         return text
 
+    def get_statement_hint_text(self, hint_texts):
+        # Statement hints are rendered in front of the statement by
+        # visit_select instead of after it.
+        return ""
+
+    def visit_select(self, select_stmt, **kwargs):
+        """Build a SELECT statement.
+
+        Statement hints are rendered as ``@{HINT=value, ...}`` in front of
+        the top-level statement. Spanner does not support statement hints in
+        subqueries.
+        """
+        toplevel = not self.stack
+        text = super().visit_select(select_stmt, **kwargs)
+        hint_texts = self._statement_hint_texts(select_stmt)
+        if not hint_texts:
+            return text
+        if not select_stmt._suffixes and text.endswith(" "):
+            # Remove the separator of the empty statement hint text.
+            text = text[:-1]
+        hints = _format_hints(ht for ht in hint_texts if not _is_join_hint(ht))
+        if toplevel and hints is not None:
+            text = "%s %s" % (hints, text)
+        return text
+
+    def _statement_hint_texts(self, select_stmt):
+        """Return the texts of the Spanner statement hints of a SELECT statement.
+
+        The texts include the ``JOIN@{...}`` join hints.
+        """
+        return [
+            ht
+            for (dialect_name, ht) in getattr(select_stmt, "_statement_hints", ())
+            if dialect_name in ("*", self.dialect.name)
+        ]
+
+    def visit_join(self, join, **kwargs):
+        """Build a JOIN clause with the join hints of the SELECT statement."""
+        text = super().visit_join(join, **kwargs)
+        if not self.stack:
+            return text
+        hints = _format_hints(
+            ht
+            for ht in self._statement_hint_texts(self.stack[-1].get("selectable"))
+            if _is_join_hint(ht)
+        )
+        if hints is None:
+            return text
+        if join.full:
+            join_keyword = " FULL OUTER JOIN "
+        elif join.isouter:
+            join_keyword = " LEFT OUTER JOIN "
+        else:
+            join_keyword = " JOIN "
+        return _insert_join_hints(text, join_keyword, hints)
+
     def visit_now_func(self, func, **kwargs):
         return "current_timestamp"
 
@@ -314,6 +1450,93 @@ class SpannerSQLCompiler(SQLCompiler):
             binary.right._compiler_dispatch(self, **kw),
         )
 
+    def visit_in_op_binary(self, binary, operator, **kw):
+        """Build an IN clause.
+
+        A list of values is sent as one array parameter, so the SQL string
+        does not depend on the number of values.
+        """
+        unnest = self._generate_unnest_binary(binary, "IN", **kw)
+        if unnest is not None:
+            return unnest
+        return self._generate_generic_binary(binary, OPERATORS[operator], **kw)
+
+    def visit_not_in_op_binary(self, binary, operator, **kw):
+        """Build a NOT IN clause."""
+        unnest = self._generate_unnest_binary(binary, "NOT IN", **kw)
+        if unnest is not None:
+            return "(%s)" % unnest
+        return super().visit_not_in_op_binary(binary, operator, **kw)
+
+    def _generate_unnest_binary(self, binary, opstring, **kw):
+        """Render ``expr IN UNNEST(@param)`` for an expanding IN parameter.
+
+        A tuple IN expression is rendered as
+        ``STRUCT(a, b) IN UNNEST(@param)``, where the parameter is an array
+        of structs. The parameter is sent with its array type.
+
+        Returns:
+            str: The rendered expression, or None if the parameter must be
+                expanded into one parameter per value.
+        """
+        bindparam = binary.right
+        if (
+            not self.dialect.unnest_in_lists
+            or not isinstance(bindparam, elements.BindParameter)
+            or not bindparam.expanding
+            or bindparam.literal_execute
+            or kw.get("literal_binds")
+            or kw.get("literal_execute")
+        ):
+            return None
+        if bindparam.type._is_tuple_type:
+            field_types = [
+                self._unnest_element_type(field_type)
+                for field_type in bindparam.type.types
+            ]
+            if None in field_types:
+                return None
+            element_type = "STRUCT<%s>" % ", ".join(field_types)
+            element_param_type = param_types.Struct(
+                [
+                    param_types.StructField("", _UNNEST_TYPES[field_type])
+                    for field_type in field_types
+                ]
+            )
+            left = "STRUCT%s" % self.process(binary.left, **kw)
+        else:
+            element_type = self._unnest_element_type(bindparam.type)
+            if element_type is None:
+                return None
+            element_param_type = _UNNEST_TYPES[element_type]
+            left = self.process(binary.left, **kw)
+        # The copy keeps the key of the bind parameter, so the value of the
+        # parameter can be found by the key of the parameter in the statement.
+        array_param = bindparam._clone(maintain_key=True)
+        array_param.expanding = False
+        array_param.type = _UnnestArray(
+            bindparam.type, element_type, element_param_type
+        )
+        return "%s %s UNNEST(%s)" % (
+            left,
+            opstring,
+            self.process(array_param, **kw),
+        )
+
+    def _unnest_element_type(self, type_):
+        # SQLAlchemy 1.4 has no type_compiler_instance, and its type_compiler
+        # attribute holds the instance.
+        type_compiler = (
+            getattr(self.dialect, "type_compiler_instance", None)
+            or self.dialect.type_compiler
+        )
+        try:
+            spanner_type = type_compiler.process(type_)
+        except (CompileError, NotImplementedError):
+            return None
+        spanner_type = spanner_type.split("(", 1)[0]
+        return spanner_type if spanner_type in _UNNEST_TYPES else None
+
     def _generate_generic_binary(self, binary, opstring, eager_grouping=False, **kw):
         """The method is overriden to process JSON data type cases."""
         _in_binary = kw.get("_in_binary", False)
@@ -470,9 +1693,9 @@ class SpannerSQLCompiler(SQLCompiler):
         # Add an alias for schema-qualified tables.
         # Tables in the default schema are not aliased and follow the
         # standard SQLAlchemy code path.
-        alias = self._schema_aliased_table(table)
-        if alias is not None:
-            return self.process(alias, spanner_aliased=table, **kwargs)
+        schema_alias = self._schema_aliased_table(table)
+        if schema_alias is not None:
+            return self.process(schema_alias.alias, spanner_aliased=table, **kwargs)
         else:
             return super().visit_table(table, **kwargs)
 
@@ -492,9 +1715,9 @@ class SpannerSQLCompiler(SQLCompiler):
         """
         if column.table is not None and not self.isinsert or self.is_subquery():
             # translate for schema-qualified table aliases
-            t = self._schema_aliased_table(column.table)
-            if t is not None:
-                converted = elements._corresponding_column_or_error(t, column)
+            schema_alias = self._schema_aliased_table(column.table)
+            if schema_alias is not None:
+                converted = schema_alias.corresponding_column(column)
                 if add_to_result_map is not None:
                     add_to_result_map(
                         column.name,
@@ -523,15 +1746,22 @@ class SpannerSQLCompiler(SQLCompiler):
         return super().visit_column(column, add_to_result_map=add_to_result_map, **kw)
 
     def _schema_aliased_table(self, table):
-        """Creates an alias for the table if it is schema-qualified.
-
-        If the table is schema-qualified, returns an alias for the
-        table and caches the alias for future references to the
-        table. If the table is not schema-qualified, returns None.
+        """Returns the alias of the table if it is schema-qualified.
+
+        If the table is schema-qualified, returns a :class:`_SchemaAlias`
+        for the table. The alias is cached on the table, so all statements
+        that are compiled for the table use the same alias, and the alias is
+        garbage collected together with the table. The alias is created
+        again when the columns of the table have changed. If the table is
+        not schema-qualified, returns None.
         """
         if getattr(table, "schema", None) is not None:
             if table not in self.tablealiases:
-                self.tablealiases[table] = table.alias()
+                schema_alias = getattr(table, "_spanner_schema_alias", None)
+                if schema_alias is None or not schema_alias.matches(table):
+                    schema_alias = _SchemaAlias(table)
+                    table._spanner_schema_alias = schema_alias
+                self.tablealiases[table] = schema_alias
             return self.tablealiases[table]
         else:
             return None
@@ -837,6 +2067,8 @@ class SpannerDialect(DefaultDialect):
 
     execute_sequence_format = list
 
+    poolclass = SpannerQueuePool
+
     supports_alter = True
     supports_sane_rowcount = False
     supports_sane_multi_rowcount = False
@@ -853,6 +2085,9 @@ class SpannerDialect(DefaultDialect):
     # to generate check constraints to enforce the enum values if the
     # create_constraint=True flag is passed to the Enum constructor.
     supports_native_enum = False
+    # Query results are streamed from Spanner while they are fetched, so
+    # every cursor can be used as a server-side cursor.
+    supports_server_side_cursors = True
 
     postfetch_lastrowid = False
     insert_returning = True
@@ -860,6 +2095,9 @@ class SpannerDialect(DefaultDialect):
     delete_returning = True
     supports_multivalues_insert = True
     use_insertmanyvalues = True
+    # The maximum number of mutations (rows * columns) that are sent in one
+    # commit when an INSERT statement is executed with use_mutations=True.
+    max_mutations_per_commit = 80000
 
     ddl_compiler = SpannerDDLCompiler
     preparer = SpannerIdentifierPreparer
@@ -869,6 +2107,77 @@ class SpannerDialect(DefaultDialect):
     _json_serializer = JsonObject
     _json_deserializer = JsonObject
 
+    def __init__(
+        self,
+        reflection_cache_ttl=None,
+        bulk_reflection=False,
+        warmup_sessions=None,
+        ping_idle_threshold=30,
+        autocommit_staleness=None,
+        unnest_in_lists=True,
+        **kwargs,
+    ):
+        """
+        Args:
+            reflection_cache_ttl (float): Optional. The number of seconds that
+                reflected tables, columns, indexes and constraints are cached.
+                The cache is disabled if not set. The cache is cleared when
+                the dialect executes a DDL statement.
+            bulk_reflection (bool): Optional. Reflect the columns, indexes,
+                primary keys and foreign keys of tables with parallel queries
+                in one read-only transaction, instead of one read-only
+                transaction per type of information.
+            warmup_sessions (int): Optional. Create this number of sessions
+                with BatchCreateSessions, and open the gRPC channels, when the
+                engine is created. The connections of the engine share one
+                session pool if this is set.
+            ping_idle_threshold (float): Optional. The number of seconds that
+                a connection can be idle before ``pool_pre_ping`` checks it
+                with a request to Spanner. Defaults to 30 seconds. Set to 0
+                to check the connection on every checkout.
+            autocommit_staleness (dict): Optional. The staleness of the
+                single-use read-only snapshots of queries in autocommit mode,
+                for example ``{"max_staleness": datetime.timedelta(seconds=10)}``.
+                Queries read the latest data (strong reads) if not set. The
+                ``staleness`` execution option takes precedence.
+            unnest_in_lists (bool): Optional. Send the values of an ``IN``
+                list as one array parameter with ``IN UNNEST(@param)``.
+                Defaults to True. Set to False to send one parameter per
+                value.
+        """
+        super().__init__(**kwargs)
+        _listen_for_metadata_ddl()
+        _install_classify_statement()
+        self.reflection_cache_ttl = reflection_cache_ttl
+        self._reflection_cache = {}
+        self.bulk_reflection = bulk_reflection
+        self.warmup_sessions = warmup_sessions
+        self.ping_idle_threshold = ping_idle_threshold
+        self.autocommit_staleness = autocommit_staleness
+        self.unnest_in_lists = unnest_in_lists
+        # The number of seconds that the warm-up at engine creation took.
+        self.warmup_duration = None
+        # The shared databases of the connections of this engine.
+        self._database_registry = _database_registry.DatabaseRegistry()
+
+    def clear_reflection_cache(self):
+        """Remove all entries from the reflection cache."""
+        self._reflection_cache.clear()
+
+    @classmethod
+    def engine_created(cls, engine):
+        """Warm up the session pool of a new engine.
+
+        The first connection of the engine creates the shared database and
+        its sessions. The warm-up is repeated by the first connection of a
+        child process after a fork.
+        """
+        dialect = engine.dialect
+        if dialect.warmup_sessions:
+            start = time.perf_counter()
+            engine.raw_connection().close()
+            dialect.warmup_duration = time.perf_counter() - start
+
     @classmethod
     def dbapi(cls):
         """A pointer to the Cloud Spanner DB API package.
@@ -947,21 +2256,32 @@ class SpannerDialect(DefaultDialect):
         """
         Generates WHERE query for tables or views for which
         information is reflected.
+
+        The names of the tables are passed in the ``filter_names`` query
+        parameter, so the query text is the same for all tables.
         """
         table_filter_query = ""
         if filter_names is not None:
-            for table_name in filter_names:
-                query = f"{info_schema_table}.table_name = '{table_name}'"
-                if table_filter_query != "":
-                    table_filter_query = table_filter_query + " OR " + query
-                else:
-                    table_filter_query = query
-            table_filter_query = "(" + table_filter_query + ") "
+            table_filter_query = (
+                f"{info_schema_table}.table_name IN UNNEST(@filter_names) "
+            )
             if append_query:
                 table_filter_query = table_filter_query + " AND "
 
         return table_filter_query
 
+    def _get_reflection_params(self, schema, filter_names):
+        """
+        Returns the query parameters and parameter types for the
+        schema and table filters of a reflection query.
+        """
+        params = {"table_schema": schema or ""}
+        types = {"table_schema": param_types.STRING}
+        if filter_names is not None:
+            params["filter_names"] = list(filter_names)
+            types["filter_names"] = param_types.Array(param_types.STRING)
+        return params, types
+
     def create_connect_args(self, url):
         """Parse connection args from the given URL.
 
@@ -1001,11 +2321,67 @@ class SpannerDialect(DefaultDialect):
                     ),
                 )
                 options["client"] = client
+        for arg in _database_registry.SESSION_POOL_ARGS:
+            if arg in url.query:
+                options[arg] = url.query[arg]
+        if "share_across_engines" in url.query:
+            options["share_across_engines"] = url.query["share_across_engines"]
         return (
             [match.group("instance"), match.group("database"), match.group("project")],
             options,
         )
 
+    def connect(self, *cargs, **cparams):
+        """Create a DB API connection.
+
+        The connections of an engine share one Client, Database and session
+        pool if the ``session_pool``, ``session_pool_size``, ``num_channels``
+        or ``share_across_engines`` connection argument, or the
+        ``warmup_sessions`` engine option, is set. With
+        ``share_across_engines``, the engines in the process that connect to
+        the same database with the same arguments also share these objects.
+        """
+        share_across_engines = _to_bool(cparams.pop("share_across_engines", False))
+        if self.warmup_sessions:
+            cparams["warmup_sessions"] = self.warmup_sessions
+        elif not share_across_engines and not any(
+            cparams.get(arg) is not None for arg in _database_registry.SESSION_POOL_ARGS
+        ):
+            return self._instrument_connection(super().connect(*cargs, **cparams))
+        if share_across_engines:
+            registry = _database_registry.PROCESS_REGISTRY
+        else:
+            registry = self._database_registry
+        return self._instrument_connection(
+            self._connect_shared(registry, cargs, cparams)
+        )
+
+    def _instrument_connection(self, connection):
+        # Count the transaction retries of the DB API connection if metrics
+        # are recorded.
+        if get_metrics() is not None:
+            dbapi_connection = connection
+            if not isinstance(dbapi_connection, spanner_dbapi.Connection):
+                dbapi_connection = dbapi_connection.connection
+            instrument_retries(dbapi_connection)
+        return connection
+
+    def _connect_shared(self, registry, cargs, cparams):
+        return registry.connect(*cargs, **cparams)
+
+    def _run_reflection(self, connection, function, *args, **kwargs):
+        """Run a reflection method of the dialect.
+
+        Args:
+            connection (sqlalchemy.engine.base.Connection):
+                SQLAlchemy connection object.
+            function (Callable): The undecorated reflection method.
+
+        Returns:
+            The result of the reflection method.
+        """
+        return function(self, connection, *args, **kwargs)
+
     @engine_to_connection
     def get_view_names(self, connection, schema=None, **kw):
         """
@@ -1024,14 +2400,14 @@ class SpannerDialect(DefaultDialect):
         sql = """
             SELECT table_name
             FROM information_schema.views
-            WHERE TABLE_SCHEMA='{}'
-            """.format(
-            schema or ""
-        )
+            WHERE TABLE_SCHEMA=@table_schema
+            """
+        params = {"table_schema": schema or ""}
+        types = {"table_schema": param_types.STRING}
 
         all_views = []
         with connection.connection.database.snapshot() as snap:
-            rows = list(snap.execute_sql(sql))
+            rows = list(snap.execute_sql(sql, params=params, param_types=types))
             for view in rows:
                 all_views.append(view[0])
 
@@ -1055,13 +2431,13 @@ class SpannerDialect(DefaultDialect):
         sql = """
             SELECT name
             FROM information_schema.sequences
-            WHERE SCHEMA='{}'
-            """.format(
-            schema or ""
-        )
+            WHERE SCHEMA=@table_schema
+            """
+        params = {"table_schema": schema or ""}
+        types = {"table_schema": param_types.STRING}
         all_sequences = []
         with connection.connection.database.snapshot() as snap:
-            rows = list(snap.execute_sql(sql))
+            rows = list(snap.execute_sql(sql, params=params, param_types=types))
             for seq in rows:
                 all_sequences.append(seq[0])
 
@@ -1086,54 +2462,125 @@ class SpannerDialect(DefaultDialect):
         sql = """
             SELECT view_definition
             FROM information_schema.views
-            WHERE TABLE_SCHEMA='{schema_name}' AND TABLE_NAME='{view_name}'
-            """.format(
-            schema_name=schema or "", view_name=view_name
-        )
+            WHERE TABLE_SCHEMA=@schema_name AND TABLE_NAME=@view_name
+            """
+        params = {"schema_name": schema or "", "view_name": view_name}
+        types = {
+            "schema_name": param_types.STRING,
+            "view_name": param_types.STRING,
+        }
 
         with connection.connection.database.snapshot() as snap:
-            rows = list(snap.execute_sql(sql))
+            rows = list(snap.execute_sql(sql, params=params, param_types=types))
             if rows == []:
                 raise NoSuchTableError(f"{schema if schema else ''}.{view_name}")
             result = rows[0][0]
 
         return result
 
-    @engine_to_connection
-    def get_multi_columns(
-        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
+    def _get_reflection_rows(
+        self, connection, name, schema, filter_names, scope, kind, kw
     ):
         """
-        Return information about columns in all objects in the given
-        schema.
+        Execute the reflection query with the given name and return its rows.
 
-        The method is used by SQLAlchemy introspection systems.
+        In bulk reflection mode, the queries for columns, indexes, primary
+        keys and foreign keys are executed together the first time that one
+        of them is needed by an inspector. The rows are kept in the info
+        cache of the inspector for the other get_multi_* calls.
 
         Args:
             connection (sqlalchemy.engine.base.Connection):
-                SQLAlchemy connection or engine object.
-            schema (str): Optional. Schema name
-            filter_names (Sequence[str]): Optional. Optionally return information
-                only for the objects listed here.
-            scope (sqlalchemy.engine.reflection.ObjectScope): Optional. Specifies
-                if columns of default, temporary or any tables
-                should be reflected. Spanner does not support temporary.
-            kind (sqlalchemy.engine.reflection.ObjectKind): Optional. Specifies the
-                type of objects to reflect.
+                SQLAlchemy connection object.
+            name (str): The reflection query to execute, e.g. ``columns``.
+            schema (str): Schema name.
+            filter_names (Sequence[str]): The names of the objects to reflect.
+            scope (sqlalchemy.engine.reflection.ObjectScope): The scope of
+                the objects to reflect.
+            kind (sqlalchemy.engine.reflection.ObjectKind): The type of
+                objects to reflect.
+            kw (dict): The keyword arguments of the get_multi_* call.
 
         Returns:
-            dictionary: a dictionary where the keys are two-tuple schema,table-name
-                and the values are list of dictionaries, each representing the
-                definition of a database column.
-                The schema is ``None`` if no schema is provided.
+            list: The rows of the query.
         """
-        table_filter_query = self._get_table_filter_query(filter_names, "col", True)
-        schema_filter_query = " col.table_schema = '{schema}' AND ".format(
-            schema=schema or ""
+        queries = {
+            "columns": self._get_multi_columns_query,
+            "indexes": self._get_multi_indexes_query,
+            "pk_constraint": self._get_multi_pk_constraint_query,
+            "foreign_keys": self._get_multi_foreign_keys_query,
+        }
+        params, types = self._get_reflection_params(schema, filter_names)
+        info_cache = kw.get("info_cache")
+        if not self.bulk_reflection or info_cache is None:
+            sql = queries[name](schema, filter_names, kind)
+            with connection.connection.database.snapshot() as snap:
+                return list(snap.execute_sql(sql, params=params, param_types=types))
+
+        key = (
+            "spanner_bulk_reflection",
+            schema or "",
+            tuple(filter_names) if filter_names is not None else None,
+            scope,
+            kind,
         )
+        rows = info_cache.get(key)
+        if rows is None:
+            rows = self._execute_reflection_queries(
+                connection,
+                {
+                    query_name: query(schema, filter_names, kind)
+                    for query_name, query in queries.items()
+                },
+                params,
+                types,
+            )
+            info_cache[key] = rows
+        return rows[name]
+
+    def _execute_reflection_queries(self, connection, queries, params, types):
+        """
+        Execute reflection queries in parallel in one read-only transaction.
+
+        All queries read the schema at the same timestamp, and the latency of
+        the whole reflection is that of the slowest query.
+
+        Args:
+            connection (sqlalchemy.engine.base.Connection):
+                SQLAlchemy connection object.
+            queries (dict): The SQL strings to execute by name.
+            params (dict): The query parameters of the queries.
+            types (dict): The types of the query parameters.
+
+        Returns:
+            dict: The rows of each query by name.
+        """
+        with connection.connection.database.snapshot(multi_use=True) as snap:
+            # Begin the transaction before the queries are sent, as parallel
+            # queries cannot all begin the same transaction inline.
+            snap.begin()
+            with ThreadPoolExecutor(
+                max_workers=len(queries),
+                thread_name_prefix="sqlalchemy-spanner-reflection",
+            ) as executor:
+                futures = {
+                    name: executor.submit(
+                        lambda sql: list(
+                            snap.execute_sql(sql, params=params, param_types=types)
+                        ),
+                        sql,
+                    )
+                    for name, sql in queries.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+
+    def _get_multi_columns_query(self, schema, filter_names, kind):
+        """Generates the query that reflects the columns of tables."""
+        table_filter_query = self._get_table_filter_query(filter_names, "col", True)
+        schema_filter_query = " col.table_schema = @table_schema AND "
         table_type_query = self._get_table_type_query(kind, True)
 
-        sql = """
+        return """
             SELECT col.table_schema, col.table_name, col.column_name,
                 col.spanner_type, col.is_nullable, col.generation_expression,
                 col.column_default
@@ -1155,27 +2602,58 @@ class SpannerDialect(DefaultDialect):
             table_type_query=table_type_query,
             schema_filter_query=schema_filter_query,
         )
-        with connection.connection.database.snapshot() as snap:
-            columns = list(snap.execute_sql(sql))
-            result_dict = {}
-
-            for col in columns:
-                column_info = {
-                    "name": col[2],
-                    "type": self._designate_type(col[3]),
-                    "nullable": col[4] == "YES",
-                    "default": col[6] if col[6] is not None else None,
-                }
 
-                if col[5] is not None:
-                    column_info["computed"] = {
-                        "persisted": True,
-                        "sqltext": col[5],
-                    }
-                col[0] = col[0] or None
-                table_info = result_dict.get((col[0], col[1]), [])
-                table_info.append(column_info)
-                result_dict[(col[0], col[1])] = table_info
+    @engine_to_connection
+    @cache_reflection
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
+    ):
+        """
+        Return information about columns in all objects in the given
+        schema.
+
+        The method is used by SQLAlchemy introspection systems.
+
+        Args:
+            connection (sqlalchemy.engine.base.Connection):
+                SQLAlchemy connection or engine object.
+            schema (str): Optional. Schema name
+            filter_names (Sequence[str]): Optional. Optionally return information
+                only for the objects listed here.
+            scope (sqlalchemy.engine.reflection.ObjectScope): Optional. Specifies
+                if columns of default, temporary or any tables
+                should be reflected. Spanner does not support temporary.
+            kind (sqlalchemy.engine.reflection.ObjectKind): Optional. Specifies the
+                type of objects to reflect.
+
+        Returns:
+            dictionary: a dictionary where the keys are two-tuple schema,table-name
+                and the values are list of dictionaries, each representing the
+                definition of a database column.
+                The schema is ``None`` if no schema is provided.
+        """
+        rows = self._get_reflection_rows(
+            connection, "columns", schema, filter_names, scope, kind, kw
+        )
+        result_dict = {}
+
+        for col in rows:
+            column_info = {
+                "name": col[2],
+                "type": self._designate_type(col[3]),
+                "nullable": col[4] == "YES",
+                "default": col[6] if col[6] is not None else None,
+            }
+
+            if col[5] is not None:
+                column_info["computed"] = {
+                    "persisted": True,
+                    "sqltext": col[5],
+                }
+            col[0] = col[0] or None
+            table_info = result_dict.get((col[0], col[1]), [])
+            table_info.append(column_info)
+            result_dict[(col[0], col[1])] = table_info
 
         return result_dict
 
@@ -1228,41 +2706,13 @@ class SpannerDialect(DefaultDialect):
         else:
             return _type_map[str_repr]
 
-    @engine_to_connection
-    def get_multi_indexes(
-        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
-    ):
-        """
-        Return information about indexes in all objects
-        in the given schema.
-
-        The method is used by SQLAlchemy introspection systems.
-
-        Args:
-            connection (sqlalchemy.engine.base.Connection):
-                SQLAlchemy connection or engine object.
-            schema (str): Optional. Schema name.
-            filter_names (Sequence[str]): Optional. Optionally return information
-                only for the objects listed here.
-            scope (sqlalchemy.engine.reflection.ObjectScope): Optional. Specifies
-                if columns of default, temporary or any tables
-                should be reflected. Spanner does not support temporary.
-            kind (sqlalchemy.engine.reflection.ObjectKind): Optional. Specifies the
-                type of objects to reflect.
-
-        Returns:
-            dictionary: a dictionary where the keys are two-tuple schema,table-name
-                and the values are list of dictionaries, each representing the
-                definition of an index.
-                The schema is ``None`` if no schema is provided.
-        """
+    def _get_multi_indexes_query(self, schema, filter_names, kind):
+        """Generates the query that reflects the indexes of tables."""
         table_filter_query = self._get_table_filter_query(filter_names, "i", True)
-        schema_filter_query = " i.table_schema = '{schema}' AND ".format(
-            schema=schema or ""
-        )
+        schema_filter_query = " i.table_schema = @table_schema AND "
         table_type_query = self._get_table_type_query(kind, True)
 
-        sql = """
+        return """
             SELECT
                i.table_schema,
                i.table_name,
@@ -1318,29 +2768,59 @@ class SpannerDialect(DefaultDialect):
             schema_filter_query=schema_filter_query,
         )
 
-        with connection.connection.database.snapshot() as snap:
-            rows = list(snap.execute_sql(sql))
-            result_dict = {}
+    @engine_to_connection
+    @cache_reflection
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
+    ):
+        """
+        Return information about indexes in all objects
+        in the given schema.
 
-            for row in rows:
-                dialect_options = {}
-                include_columns = row[6]
-                if include_columns:
-                    dialect_options["spanner_storing"] = include_columns
-                index_info = {
-                    "name": row[2],
-                    "column_names": row[3],
-                    "unique": row[4],
-                    "column_sorting": {
-                        col: order.lower() for col, order in zip(row[3], row[5])
-                    },
-                    "include_columns": include_columns if include_columns else [],
-                    "dialect_options": dialect_options,
-                }
-                row[0] = row[0] or None
-                table_info = result_dict.get((row[0], row[1]), [])
-                table_info.append(index_info)
-                result_dict[(row[0], row[1])] = table_info
+        The method is used by SQLAlchemy introspection systems.
+
+        Args:
+            connection (sqlalchemy.engine.base.Connection):
+                SQLAlchemy connection or engine object.
+            schema (str): Optional. Schema name.
+            filter_names (Sequence[str]): Optional. Optionally return information
+                only for the objects listed here.
+            scope (sqlalchemy.engine.reflection.ObjectScope): Optional. Specifies
+                if columns of default, temporary or any tables
+                should be reflected. Spanner does not support temporary.
+            kind (sqlalchemy.engine.reflection.ObjectKind): Optional. Specifies the
+                type of objects to reflect.
+
+        Returns:
+            dictionary: a dictionary where the keys are two-tuple schema,table-name
+                and the values are list of dictionaries, each representing the
+                definition of an index.
+                The schema is ``None`` if no schema is provided.
+        """
+        rows = self._get_reflection_rows(
+            connection, "indexes", schema, filter_names, scope, kind, kw
+        )
+        result_dict = {}
+
+        for row in rows:
+            dialect_options = {}
+            include_columns = row[6]
+            if include_columns:
+                dialect_options["spanner_storing"] = include_columns
+            index_info = {
+                "name": row[2],
+                "column_names": row[3],
+                "unique": row[4],
+                "column_sorting": {
+                    col: order.lower() for col, order in zip(row[3], row[5])
+                },
+                "include_columns": include_columns if include_columns else [],
+                "dialect_options": dialect_options,
+            }
+            row[0] = row[0] or None
+            table_info = result_dict.get((row[0], row[1]), [])
+            table_info.append(index_info)
+            result_dict[(row[0], row[1])] = table_info
 
         return result_dict
 
@@ -1366,7 +2846,33 @@ class SpannerDialect(DefaultDialect):
         schema = schema or None
         return dict.get((schema, table_name), [])
 
+    def _get_multi_pk_constraint_query(self, schema, filter_names, kind):
+        """Generates the query that reflects the primary keys of tables."""
+        table_filter_query = self._get_table_filter_query(filter_names, "tc", True)
+        schema_filter_query = " tc.table_schema = @table_schema AND "
+        table_type_query = self._get_table_type_query(kind, True)
+
+        return """
+            SELECT tc.table_schema, tc.table_name, kcu.column_name
+            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS tc
+            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS kcu
+                USING (TABLE_CATALOG, TABLE_SCHEMA, CONSTRAINT_NAME)
+            JOIN information_schema.tables AS t
+                ON  tc.TABLE_CATALOG = t.TABLE_CATALOG
+                AND tc.TABLE_SCHEMA = t.TABLE_SCHEMA
+                AND tc.TABLE_NAME = t.TABLE_NAME
+            WHERE {table_filter_query} {table_type_query}
+            {schema_filter_query} tc.CONSTRAINT_TYPE = "PRIMARY KEY"
+            ORDER BY tc.table_catalog ASC, tc.table_schema ASC,
+                     tc.table_name ASC, kcu.ordinal_position ASC
+        """.format(
+            table_filter_query=table_filter_query,
+            table_type_query=table_type_query,
+            schema_filter_query=schema_filter_query,
+        )
+
     @engine_to_connection
+    @cache_reflection
     def get_multi_pk_constraint(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
@@ -1394,42 +2900,16 @@ class SpannerDialect(DefaultDialect):
                 definition of a primary key constraint.
                 The schema is ``None`` if no schema is provided.
         """
-        table_filter_query = self._get_table_filter_query(filter_names, "tc", True)
-        schema_filter_query = " tc.table_schema = '{schema}' AND ".format(
-            schema=schema or ""
-        )
-        table_type_query = self._get_table_type_query(kind, True)
-
-        sql = """
-            SELECT tc.table_schema, tc.table_name, kcu.column_name
-            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS tc
-            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS kcu
-                USING (TABLE_CATALOG, TABLE_SCHEMA, CONSTRAINT_NAME)
-            JOIN information_schema.tables AS t
-                ON  tc.TABLE_CATALOG = t.TABLE_CATALOG
-                AND tc.TABLE_SCHEMA = t.TABLE_SCHEMA
-                AND tc.TABLE_NAME = t.TABLE_NAME
-            WHERE {table_filter_query} {table_type_query}
-            {schema_filter_query} tc.CONSTRAINT_TYPE = "PRIMARY KEY"
-            ORDER BY tc.table_catalog ASC, tc.table_schema ASC,
-                     tc.table_name ASC, kcu.ordinal_position ASC
-        """.format(
-            table_filter_query=table_filter_query,
-            table_type_query=table_type_query,
-            schema_filter_query=schema_filter_query,
+        rows = self._get_reflection_rows(
+            connection, "pk_constraint", schema, filter_names, scope, kind, kw
         )
+        result_dict = {}
 
-        with connection.connection.database.snapshot() as snap:
-            rows = list(snap.execute_sql(sql))
-            result_dict = {}
-
-            for row in rows:
-                row[0] = row[0] or None
-                table_info = result_dict.get(
-                    (row[0], row[1]), {"constrained_columns": []}
-                )
-                table_info["constrained_columns"].append(row[2])
-                result_dict[(row[0], row[1])] = table_info
+        for row in rows:
+            row[0] = row[0] or None
+            table_info = result_dict.get((row[0], row[1]), {"constrained_columns": []})
+            table_info["constrained_columns"].append(row[2])
+            result_dict[(row[0], row[1])] = table_info
 
         return result_dict
 
@@ -1477,41 +2957,13 @@ class SpannerDialect(DefaultDialect):
 
         return schemas
 
-    @engine_to_connection
-    def get_multi_foreign_keys(
-        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
-    ):
-        """
-        Return information about foreign_keys in all tables
-        in the given schema.
-
-        The method is used by SQLAlchemy introspection systems.
-
-        Args:
-            connection (sqlalchemy.engine.base.Connection):
-                SQLAlchemy connection or engine object.
-            schema (str): Optional. Schema name
-            filter_names (Sequence[str]): Optional. Optionally return information
-                only for the objects listed here.
-            scope (sqlalchemy.engine.reflection.ObjectScope): Optional. Specifies
-                if columns of default, temporary or any tables
-                should be reflected. Spanner does not support temporary.
-            kind (sqlalchemy.engine.reflection.ObjectKind): Optional. Specifies the
-                type of objects to reflect.
-
-        Returns:
-            dictionary: a dictionary where the keys are two-tuple schema,table-name
-                and the values are list of dictionaries, each representing
-                a foreign key definition.
-                The schema is ``None`` if no schema is provided.
-        """
+    def _get_multi_foreign_keys_query(self, schema, filter_names, kind):
+        """Generates the query that reflects the foreign keys of tables."""
         table_filter_query = self._get_table_filter_query(filter_names, "tc", True)
-        schema_filter_query = " tc.table_schema = '{schema}' AND".format(
-            schema=schema or ""
-        )
+        schema_filter_query = " tc.table_schema = @table_schema AND"
         table_type_query = self._get_table_type_query(kind, True)
 
-        sql = """
+        return """
         SELECT
             tc.table_schema,
             tc.table_name,
@@ -1561,25 +3013,55 @@ class SpannerDialect(DefaultDialect):
             schema_filter_query=schema_filter_query,
         )
 
-        with connection.connection.database.snapshot() as snap:
-            rows = list(snap.execute_sql(sql))
-            result_dict = {}
+    @engine_to_connection
+    @cache_reflection
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
+    ):
+        """
+        Return information about foreign_keys in all tables
+        in the given schema.
 
-            for row in rows:
-                row[0] = row[0] or None
-                table_info = result_dict.get((row[0], row[1]), [])
-
-                constrained_columns, referred_columns = zip(*row[5])
-                fk_info = {
-                    "name": row[2],
-                    "referred_table": row[3],
-                    "referred_schema": row[4] or None,
-                    "referred_columns": list(referred_columns),
-                    "constrained_columns": list(constrained_columns),
-                }
+        The method is used by SQLAlchemy introspection systems.
+
+        Args:
+            connection (sqlalchemy.engine.base.Connection):
+                SQLAlchemy connection or engine object.
+            schema (str): Optional. Schema name
+            filter_names (Sequence[str]): Optional. Optionally return information
+                only for the objects listed here.
+            scope (sqlalchemy.engine.reflection.ObjectScope): Optional. Specifies
+                if columns of default, temporary or any tables
+                should be reflected. Spanner does not support temporary.
+            kind (sqlalchemy.engine.reflection.ObjectKind): Optional. Specifies the
+                type of objects to reflect.
+
+        Returns:
+            dictionary: a dictionary where the keys are two-tuple schema,table-name
+                and the values are list of dictionaries, each representing
+                a foreign key definition.
+                The schema is ``None`` if no schema is provided.
+        """
+        rows = self._get_reflection_rows(
+            connection, "foreign_keys", schema, filter_names, scope, kind, kw
+        )
+        result_dict = {}
+
+        for row in rows:
+            row[0] = row[0] or None
+            table_info = result_dict.get((row[0], row[1]), [])
+
+            constrained_columns, referred_columns = zip(*row[5])
+            fk_info = {
+                "name": row[2],
+                "referred_table": row[3],
+                "referred_schema": row[4] or None,
+                "referred_columns": list(referred_columns),
+                "constrained_columns": list(constrained_columns),
+            }
 
-                table_info.append(fk_info)
-                result_dict[(row[0], row[1])] = table_info
+            table_info.append(fk_info)
+            result_dict[(row[0], row[1])] = table_info
 
         return result_dict
 
@@ -1622,14 +3104,14 @@ class SpannerDialect(DefaultDialect):
         sql = """
 SELECT table_name
 FROM information_schema.tables
-WHERE table_type = 'BASE TABLE' AND table_schema = '{schema}'
-""".format(
-            schema=schema or ""
-        )
+WHERE table_type = 'BASE TABLE' AND table_schema = @table_schema
+"""
+        params = {"table_schema": schema or ""}
+        types = {"table_schema": param_types.STRING}
 
         table_names = []
         with connection.connection.database.snapshot() as snap:
-            rows = snap.execute_sql(sql)
+            rows = snap.execute_sql(sql, params=params, param_types=types)
 
             for row in rows:
                 table_names.append(row[0])
@@ -1657,17 +3139,20 @@ FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS tc
 JOIN INFORMATION_SCHEMA.CONSTRAINT_COLUMN_USAGE AS ccu
     USING (TABLE_CATALOG, TABLE_SCHEMA, CONSTRAINT_NAME)
 WHERE
-    tc.TABLE_NAME="{table_name}"
-    AND tc.TABLE_SCHEMA="{table_schema}"
+    tc.TABLE_NAME=@table_name
+    AND tc.TABLE_SCHEMA=@table_schema
     AND tc.CONSTRAINT_TYPE = "UNIQUE"
     AND tc.CONSTRAINT_NAME IS NOT NULL
-""".format(
-            table_schema=schema or "", table_name=table_name
-        )
+"""
+        params = {"table_schema": schema or "", "table_name": table_name}
+        types = {
+            "table_schema": param_types.STRING,
+            "table_name": param_types.STRING,
+        }
 
         cols = []
         with connection.connection.database.snapshot() as snap:
-            rows = snap.execute_sql(sql)
+            rows = snap.execute_sql(sql, params=params, param_types=types)
 
             for row in rows:
                 cols.append({"name": row[0], "column_names": [row[1]]})
@@ -1694,11 +3179,14 @@ WHERE
                 """
 SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="{table_schema}" AND TABLE_NAME="{table_name}"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
-""".format(
-                    table_schema=schema or "", table_name=table_name
-                )
+""",
+                params={"table_schema": schema or "", "table_name": table_name},
+                param_types={
+                    "table_schema": param_types.STRING,
+                    "table_name": param_types.STRING,
+                },
             )
 
             for _ in rows:
@@ -1720,12 +3208,15 @@ LIMIT 1
                 """
                 SELECT true
                 FROM INFORMATION_SCHEMA.SEQUENCES
-                WHERE NAME="{sequence_name}"
-                AND SCHEMA="{schema}"
+                WHERE NAME=@sequence_name
+                AND SCHEMA=@schema
                 LIMIT 1
-                """.format(
-                    sequence_name=sequence_name, schema=schema or ""
-                )
+                """,
+                params={"sequence_name": sequence_name, "schema": schema or ""},
+                param_types={
+                    "sequence_name": param_types.STRING,
+                    "schema": param_types.STRING,
+                },
             )
 
             for _ in rows:
@@ -1810,6 +3301,7 @@ LIMIT 1
         To prevent rollback exception, don't rollback
         committed/rolled back transactions.
         """
+        self._abort_dml_batch(dbapi_connection)
         if not isinstance(dbapi_connection, spanner_dbapi.Connection):
             dbapi_connection = dbapi_connection.connection
 
@@ -1824,17 +3316,58 @@ LIMIT 1
                 if dbapi_connection.database
                 else ""
             }
+            started = dbapi_connection._spanner_transaction_started
             with trace_call("SpannerSqlAlchemy.Rollback", trace_attributes):
                 dbapi_connection.rollback()
+            if started:
+                record_rollback()
 
     def do_commit(self, dbapi_connection):
+        # DDL statements in a transaction are executed when it is committed.
+        if getattr(dbapi_connection, "_ddl_statements", None):
+            self.clear_reflection_cache()
+        if getattr(dbapi_connection, "_batch_mode", None) is BatchMode.DML:
+            self._run_dml_batch(dbapi_connection)
         trace_attributes = {
             "db.instance": dbapi_connection.database.name
             if dbapi_connection.database
             else ""
         }
         with trace_call("SpannerSqlAlchemy.Commit", trace_attributes):
-            dbapi_connection.commit()
+            with measure_commit():
+                dbapi_connection.commit()
+        setattr(dbapi_connection, _LAST_USED, time.monotonic())
+
+    def do_ping(self, dbapi_connection):
+        """Check that a connection can be used, for ``pool_pre_ping``.
+
+        A connection that executed a statement or committed a transaction less
+        than ``ping_idle_threshold`` seconds ago is not checked. Other
+        connections execute ``SELECT 1`` in a single-use read-only snapshot,
+        so the check never starts a read/write transaction.
+
+        Returns:
+            bool: False if the connection is closed, True otherwise.
+        """
+        if dbapi_connection.is_closed:
+            return False
+        last_used = getattr(dbapi_connection, _LAST_USED, None)
+        if (
+            last_used is not None
+            and time.monotonic() - last_used < self.ping_idle_threshold
+        ):
+            return True
+        if dbapi_connection.database is not None:
+            with trace_call(
+                "SpannerSqlAlchemy.Ping",
+                {"db.instance": dbapi_connection.database.name},
+            ):
+                self._validate_connection(dbapi_connection)
+        setattr(dbapi_connection, _LAST_USED, time.monotonic())
+        return True
+
+    def _validate_connection(self, dbapi_connection):
+        dbapi_connection.validate()
 
     def do_close(self, dbapi_connection):
         trace_attributes = {
@@ -1845,31 +3378,559 @@ LIMIT 1
         with trace_call("SpannerSqlAlchemy.Close", trace_attributes):
             dbapi_connection.close()
 
+    def _start_ddl_batch(self, connection, ddl_runner=None):
+        """Start a DDL batch, or a nested batch if a batch is active.
+
+        Args:
+            connection (sqlalchemy.pool.PoolProxiedConnection):
+                The connection to start the batch on.
+            ddl_runner (sqlalchemy.sql.ddl.InvokeDDLBase): Optional. The DDL
+                runner of the MetaData.create_all() or drop_all() call that
+                starts the batch.
+        """
+        self._discard_failed_metadata_ddl_batches(connection)
+        if ddl_runner is not None:
+            connection.info.setdefault(_METADATA_DDL_RUNNERS, []).append(ddl_runner)
+        connection.info[_DDL_BATCH] = connection.info.get(_DDL_BATCH, 0) + 1
+
+    def _end_ddl_batch(self, connection, ddl_runner=None):
+        """Finish a DDL batch, and execute it if it is the outermost batch.
+
+        Args:
+            connection (sqlalchemy.pool.PoolProxiedConnection):
+                The connection that has an active DDL batch.
+            ddl_runner (sqlalchemy.sql.ddl.InvokeDDLBase): Optional. The DDL
+                runner of the MetaData.create_all() or drop_all() call that
+                started the batch.
+        """
+        if ddl_runner is not None:
+            runners = connection.info.get(_METADATA_DDL_RUNNERS, [])
+            if ddl_runner in runners:
+                runners.remove(ddl_runner)
+        self._discard_failed_metadata_ddl_batches(connection)
+        depth = connection.info.get(_DDL_BATCH, 0) - 1
+        if depth > 0:
+            connection.info[_DDL_BATCH] = depth
+            return
+        connection.info.pop(_DDL_BATCH, None)
+        # DDL statements in a transaction are executed when the transaction
+        # is committed, together with any other DDL statements that are
+        # executed in the transaction.
+        if not connection._client_transaction_started:
+            self._run_ddl_batch(connection)
+
+    def _abort_ddl_batch(self, connection):
+        connection.info.pop(_METADATA_DDL_RUNNERS, None)
+        if connection.info.pop(_DDL_BATCH, None):
+            connection._ddl_statements.clear()
+
+    def _discard_failed_metadata_ddl_batches(self, connection):
+        """Finish the DDL batches of failed create_all() and drop_all() calls.
+
+        The batch of a MetaData.create_all() or drop_all() call is finished
+        by its after_create or after_drop event, which is not fired if the
+        call fails. The batch of a call that is no longer running is
+        therefore finished without executing its statements, so the next
+        DDL statement on the connection is not buffered in it.
+
+        Args:
+            connection (sqlalchemy.pool.PoolProxiedConnection):
+                The connection that has an active DDL batch.
+        """
+        runners = connection.info.get(_METADATA_DDL_RUNNERS)
+        if not runners:
+            return
+        running = _running_ddl_runners()
+        failed = [runner for runner in runners if id(runner) not in running]
+        if not failed:
+            return
+        for runner in failed:
+            runners.remove(runner)
+        depth = connection.info.get(_DDL_BATCH, 0) - len(failed)
+        if depth > 0:
+            connection.info[_DDL_BATCH] = depth
+        else:
+            self._abort_ddl_batch(connection)
+
+    def _run_ddl_batch(self, connection):
+        if not connection._ddl_statements:
+            return
+        self.clear_reflection_cache()
+        trace_attributes = {
+            "db.instance": connection.database.name,
+            "num_statements": len(connection._ddl_statements),
+        }
+        with trace_call("SpannerSqlAlchemy.RunBatchDdl", trace_attributes):
+            connection.run_prior_DDL_statements()
+
+    def _is_ddl(self, statement, context):
+        """Return True if the statement is a DDL statement.
+
+        DDL statements that are generated by SQLAlchemy are marked as DDL.
+        Textual statements are classified by the DB API.
+        """
+        if context.isddl:
+            return True
+        compiled = context.compiled
+        if compiled is not None and not isinstance(
+            compiled.statement, expression.TextClause
+        ):
+            return False
+        # Classifying a statement parses it, so it is only done for
+        # statements that contain a DDL keyword.
+        if not _DDL_KEYWORDS.search(statement):
+            return False
+        parsed = spanner_dbapi.parse_utils.classify_statement(statement)
+        return parsed is not None and parsed.statement_type is StatementType.DDL
+
+    def _add_to_ddl_batch(self, cursor, statement, context):
+        """Buffer a DDL statement in the DDL batch of the connection.
+
+        Returns:
+            bool: True if the statement was added to the batch.
+        """
+        if not context._dbapi_connection.info.get(_DDL_BATCH):
+            return False
+        self._discard_failed_metadata_ddl_batches(context._dbapi_connection)
+        if not context._dbapi_connection.info.get(_DDL_BATCH):
+            return False
+        # A statement can contain multiple DDL statements that are separated
+        # by semicolons, for example the DROP INDEX statements that are
+        # generated for a DROP TABLE statement.
+        cursor.connection._ddl_statements.extend(
+            ddl.rstrip(";") for ddl in sqlparse.split(statement) if ddl
+        )
+        return True
+
+    def _execute_insert_as_mutations(self, cursor, context):
+        """Execute an INSERT statement as one or more mutation batches.
+
+        Mutations are only used in autocommit mode, as each batch is committed
+        on its own. The rows are split into batches that stay below
+        ``max_mutations_per_commit``.
+
+        Returns:
+            bool: True if the statement was executed as mutations, False if
+                it must be executed as DML.
+        """
+        if not context.execution_options.get("use_mutations"):
+            return False
+        dbapi_connection = cursor.connection
+        if dbapi_connection._client_transaction_started or dbapi_connection.read_only:
+            return False
+        mutation = context.get_insert_mutation()
+        if mutation is None:
+            return False
+
+        method, table, columns, rows = mutation
+        rows_per_batch = max(1, self.max_mutations_per_commit // max(1, len(columns)))
+        trace_attributes = {
+            "db.statement": context.statement,
+            "db.instance": dbapi_connection.database.name,
+            "db.table": table,
+            "num_rows": len(rows),
+        }
+        with trace_call("SpannerSqlAlchemy.InsertMutations", trace_attributes):
+            for start in range(0, len(rows), rows_per_batch):
+                end = start + rows_per_batch
+                with dbapi_connection.database.batch(
+                    request_options=dbapi_connection.request_options
+                ) as batch:
+                    getattr(batch, method)(
+                        table=table,
+                        columns=columns,
+                        values=rows[start:end],
+                    )
+        context._rowcount = len(rows)
+        return True
+
+    def _execute_partitioned_query(self, cursor, statement, parameters, context):
+        """Execute a query with the ``partitioned`` execution option.
+
+        The query is split into partitions with a PartitionQuery request in a
+        batch read-only transaction. The partitions are executed in parallel
+        on a thread pool, optionally with Data Boost, and the rows of all
+        partitions are returned by the cursor in no particular order.
+
+        Returns:
+            bool: True if the statement was executed as a partitioned query.
+        """
+        options = context.execution_options
+        if not options.get("partitioned"):
+            return False
+        if context.isinsert or context.isupdate or context.isdelete or context.isddl:
+            return False
+        dbapi_connection = cursor.connection
+        if (
+            dbapi_connection._client_transaction_started
+            and not dbapi_connection.read_only
+        ):
+            raise spanner_dbapi.exceptions.ProgrammingError(
+                "Partitioned queries are not supported in read/write transactions."
+            )
+
+        sql, params = spanner_dbapi.parse_utils.sql_pyformat_args_to_spanner(
+            statement, parameters
+        )
+        trace_attributes = {
+            "db.statement": statement,
+            "db.instance": dbapi_connection.database.name,
+            "data_boost_enabled": bool(options.get("data_boost_enabled")),
+        }
+        batch_snapshot = dbapi_connection.database.batch_snapshot()
+        try:
+            with trace_call("SpannerSqlAlchemy.PartitionQuery", trace_attributes):
+                partitions = list(
+                    batch_snapshot.generate_query_batches(
+                        sql,
+                        params,
+                        spanner_dbapi.parse_utils.get_param_types(params),
+                        partition_size_bytes=options.get("partition_size_bytes"),
+                        max_partitions=options.get("max_partitions"),
+                        data_boost_enabled=bool(options.get("data_boost_enabled")),
+                    )
+                )
+        except BaseException:
+            batch_snapshot.close()
+            raise
+        if not partitions:
+            batch_snapshot.close()
+            return False
+
+        result_set = MergedResultSet(
+            batch_snapshot, partitions, options.get("max_parallelism", 0)
+        )
+        cursor._result_set = result_set
+        cursor._itr = _partitioned_query_rows(result_set, batch_snapshot)
+        cursor._row_count = None
+        return True
+
+    def _execute_point_read(self, cursor, context):
+        """Execute a primary key lookup with the ``point_reads`` option.
+
+        A query that only selects rows of one table by their primary key,
+        such as the queries of ``Session.get()`` and of many-to-one lazy
+        loads, is executed with a StreamingRead request with the keys of the
+        rows, instead of as SQL. This skips the parsing and planning of the
+        query. Queries that are not pure primary key lookups, and queries in
+        read/write transactions, are executed as SQL.
+
+        Returns:
+            bool: True if the query was executed as a read.
+        """
+        if not context.execution_options.get("point_reads"):
+            return False
+        if context.compiled is None:
+            return False
+        dbapi_connection = cursor.connection
+        in_transaction = dbapi_connection._client_transaction_started
+        if in_transaction and not dbapi_connection.read_only:
+            return False
+        point_read = _point_read(context.compiled)
+        if point_read is None:
+            return False
+        keys = point_read.keys(context)
+        if keys is None:
+            return False
+
+        trace_attributes = {
+            "db.table": point_read.table.name,
+            "db.instance": dbapi_connection.database.name,
+            "db.keys": len(keys),
+        }
+        with trace_call("SpannerSqlAlchemy.Read", trace_attributes):
+            if in_transaction:
+                snapshot = dbapi_connection.snapshot_checkout()
+                self._read_keys(cursor, snapshot, point_read, keys)
+            else:
+                staleness = dbapi_connection.staleness or self.autocommit_staleness
+                with dbapi_connection.database.snapshot(
+                    **(staleness or {})
+                ) as snapshot:
+                    dbapi_connection._snapshot = snapshot
+                    dbapi_connection._transaction = None
+                    self._read_keys(cursor, snapshot, point_read, keys)
+        return True
+
+    def _read_keys(self, cursor, snapshot, point_read, keys):
+        result_set = snapshot.read(
+            point_read.table.name,
+            point_read.columns,
+            KeySet(keys=keys),
+            request_options=cursor.request_options,
+        )
+        cursor._result_set = result_set
+        # Read the first element, so the StreamedResultSet returns the
+        # metadata of the result.
+        cursor._itr = PeekIterator(result_set)
+        cursor._row_count = None
+
+    def _add_to_dml_batch(self, cursor, statement, parameters, context, many=False):
+        """Buffer an UPDATE or DELETE statement in a DML batch.
+
+        Statements that are executed with the ``batch_dml`` execution option
+        in a read/write transaction are buffered on the connection, and sent
+        to Spanner in one ExecuteBatchDml request when the next statement
+        that can't be batched is executed, or when the transaction is
+        committed. The row count of a buffered statement is -1 until the
+        batch has been executed.
+
+        Returns:
+            bool: True if the statement was added to the batch.
+        """
+        if not context.execution_options.get("batch_dml"):
+            return False
+        if not (context.isupdate or context.isdelete) or (
+            context.compiled is None or context.compiled.effective_returning
+        ):
+            return False
+        dbapi_connection = cursor.connection
+        if (
+            not dbapi_connection._client_transaction_started
+            or dbapi_connection.read_only
+        ):
+            return False
+
+        info = context._dbapi_connection.info
+        pending = info.get(_PENDING_DML_BATCH)
+        if pending is None:
+            if dbapi_connection._batch_mode is not BatchMode.NONE:
+                # A batch that was started directly on the DB API connection.
+                return False
+            dbapi_connection.start_batch_dml(cursor)
+            pending = info[_PENDING_DML_BATCH] = []
+
+        parameters = parameters if many else [parameters]
+        for params in parameters:
+            self._cursor_execute(cursor, statement, params, context)
+        pending.append((context, len(parameters)))
+        context._rowcount = -1
+        return True
+
+    def _run_dml_batch(self, connection):
+        """Execute the DML statements that are buffered on the connection.
+
+        The row count of each statement in the batch is set on the execution
+        context of the statement.
+
+        Args:
+            connection (sqlalchemy.pool.PoolProxiedConnection):
+                The connection that has a pending DML batch.
+        """
+        pending = connection.info.pop(_PENDING_DML_BATCH, None)
+        if not pending:
+            return
+        trace_attributes = {
+            "db.instance": connection.database.name,
+            "num_statements": sum(count for _, count in pending),
+        }
+        with trace_call("SpannerSqlAlchemy.RunBatchDml", trace_attributes):
+            result = connection.run_batch()
+        # The result contains one list with the row counts of all statements.
+        row_counts = [count for counts in result._iterators for count in counts]
+        end = 0
+        for context, count in pending:
+            start, end = end, end + count
+            context._rowcount = sum(row_counts[start:end])
+
+    def _abort_dml_batch(self, connection):
+        if getattr(connection, "_batch_mode", None) is BatchMode.DML:
+            connection.info.pop(_PENDING_DML_BATCH, None)
+            connection.abort_batch()
+
     def do_executemany(self, cursor, statement, parameters, context=None):
+        with measure_execute(context, cursor, len(parameters)):
+            self._do_executemany(cursor, statement, parameters, context)
+
+    def _do_executemany(self, cursor, statement, parameters, context):
+        if context is not None:
+            if self._add_to_dml_batch(cursor, statement, parameters, context, True):
+                return
+            self._run_dml_batch(context._dbapi_connection)
+            if self._execute_insert_as_mutations(cursor, context):
+                return
         trace_attributes = {
             "db.statement": statement,
             "db.params": parameters,
             "db.instance": cursor.connection.database.name,
         }
         with trace_call("SpannerSqlAlchemy.ExecuteMany", trace_attributes):
+            self._cursor_executemany(cursor, statement, parameters, context)
+
+    def _cursor_execute(self, cursor, statement, parameters, context):
+        """Execute a statement on a DB API cursor.
+
+        A compiled query or DML statement is executed with the statement
+        type of the compiled statement, so the DB API does not parse the SQL
+        string to determine the type of the statement.
+        """
+        args = (statement,) if parameters is None else (statement, parameters)
+        statement_type = _known_statement_type(statement, context)
+        if statement_type is None:
+            cursor.execute(*args)
+        else:
+            _execute_with_statement_type(cursor.execute, statement_type, *args)
+
+    def _cursor_executemany(self, cursor, statement, parameters, context):
+        """Execute a statement for each set of parameters on a DB API cursor.
+
+        See :meth:`_cursor_execute`. Only DML statements are executed as a
+        batch by the DB API, so queries are classified by the DB API.
+        """
+        statement_type = _known_statement_type(statement, context)
+        if statement_type in (StatementType.INSERT, StatementType.UPDATE):
+            _execute_with_statement_type(
+                cursor.executemany, statement_type, statement, parameters
+            )
+        else:
             cursor.executemany(statement, parameters)
 
+    def _execute_single_use_query(self, cursor, statement, parameters, context):
+        """Execute a compiled query in autocommit mode.
+
+        A compiled SELECT statement that is executed outside of a
+        transaction is executed with a single-use read-only snapshot, which
+        takes no locks and does not need to be committed. The DB API
+        classifies statements by their SQL, and does not recognize all
+        queries, for example queries that start with a statement hint.
+
+        The snapshot reads at the ``autocommit_staleness`` of the dialect,
+        unless the connection has a ``staleness``.
+
+        Returns:
+            bool: True if the statement was executed by this method.
+        """
+        if not context._is_query:
+            return False
+        dbapi_connection = cursor.connection
+        if dbapi_connection._client_transaction_started or dbapi_connection.read_only:
+            return False
+        staleness = None
+        if self.autocommit_staleness and not dbapi_connection.staleness:
+            staleness = self.autocommit_staleness
+        trace_attributes = {
+            "db.statement": statement,
+            "db.params": parameters,
+            "db.instance": dbapi_connection.database.name,
+        }
+        dbapi_connection.read_only = True
+        if staleness:
+            dbapi_connection.staleness = staleness
+        try:
+            with trace_call("SpannerSqlAlchemy.Execute", trace_attributes):
+                self._cursor_execute(cursor, statement, parameters, context)
+        finally:
+            dbapi_connection.read_only = False
+            if staleness:
+                dbapi_connection.staleness = None
+        return True
+
     def do_execute(self, cursor, statement, parameters, context=None):
+        with measure_execute(context, cursor):
+            self._do_execute(cursor, statement, parameters, context)
+
+    def _do_execute(self, cursor, statement, parameters, context):
+        if context is not None:
+            if self._is_ddl(statement, context):
+                self.clear_reflection_cache()
+                if self._add_to_ddl_batch(cursor, statement, context):
+                    return
+            if self._add_to_dml_batch(cursor, statement, parameters, context):
+                return
+            self._run_dml_batch(context._dbapi_connection)
+            if self._execute_insert_as_mutations(cursor, context):
+                return
+            if self._execute_partitioned_query(cursor, statement, parameters, context):
+                return
+            if self._execute_point_read(cursor, context):
+                return
+            if self._execute_single_use_query(cursor, statement, parameters, context):
+                return
         trace_attributes = {
             "db.statement": statement,
             "db.params": parameters,
             "db.instance": cursor.connection.database.name,
         }
         with trace_call("SpannerSqlAlchemy.Execute", trace_attributes):
-            cursor.execute(statement, parameters)
+            self._cursor_execute(cursor, statement, parameters, context)
 
     def do_execute_no_params(self, cursor, statement, context=None):
+        with measure_execute(context, cursor):
+            self._do_execute_no_params(cursor, statement, context)
+
+    def _do_execute_no_params(self, cursor, statement, context):
+        if context is not None:
+            if self._is_ddl(statement, context):
+                self.clear_reflection_cache()
+                if self._add_to_ddl_batch(cursor, statement, context):
+                    return
+            self._run_dml_batch(context._dbapi_connection)
+            if self._execute_partitioned_query(cursor, statement, None, context):
+                return
+            if self._execute_single_use_query(cursor, statement, None, context):
+                return
         trace_attributes = {
             "db.statement": statement,
             "db.instance": cursor.connection.database.name,
         }
         with trace_call("SpannerSqlAlchemy.ExecuteNoParams", trace_attributes):
-            cursor.execute(statement)
+            self._cursor_execute(cursor, statement, None, context)
+
+
+class SpannerImpl(DefaultImpl):
+    """Alembic implementation for Cloud Spanner.
+
+    The DDL statements of a migration step are buffered and executed as one
+    batch, as each schema change in Spanner can take several seconds. The
+    batch is executed before the next statement that is not a DDL statement,
+    which is at the latest the statement that updates the version table at
+    the end of the migration step. A data migration in a migration step
+    therefore sees the schema changes that precede it.
+
+    Alembic selects the implementation of a dialect by the ``__dialect__``
+    attribute, and the implementation that is registered last wins. A
+    ``DefaultImpl`` subclass with ``__dialect__ = "spanner+spanner"`` in the
+    ``env.py`` of a migration environment therefore replaces this one, and
+    disables the batching. Remove such a class, or subclass this one.
+    """
+
+    __dialect__ = "spanner+spanner"
+
+    # Set while this migration has started a DDL batch on the connection.
+    _ddl_batch_started = False
+
+    def _exec(self, construct, *args, **kwargs):
+        if self.as_sql or self.connection is None:
+            return super()._exec(construct, *args, **kwargs)
+        if self._is_ddl(construct):
+            if not self._ddl_batch_started:
+                self.dialect._start_ddl_batch(self.connection.connection)
+                self._ddl_batch_started = True
+        else:
+            self.flush_ddl()
+        return super()._exec(construct, *args, **kwargs)
+
+    def flush_ddl(self):
+        """Execute the DDL statements that have been buffered by this migration."""
+        if not self._ddl_batch_started:
+            return
+        self._ddl_batch_started = False
+        dbapi_connection = self.connection.connection
+        self.dialect._end_ddl_batch(dbapi_connection)
+        # DDL statements in a transaction are normally executed on commit,
+        # but the next statement could depend on the new schema.
+        self.dialect._run_ddl_batch(dbapi_connection)
+
+    @staticmethod
+    def _is_ddl(construct):
+        if isinstance(construct, DDLElement):
+            return True
+        if isinstance(construct, expression.TextClause):
+            construct = construct.text
+        if isinstance(construct, str):
+            parsed = spanner_dbapi.parse_utils.classify_statement(construct)
+            return parsed is not None and parsed.statement_type is StatementType.DDL
+        return False
 
 
 # Alembic ALTER operation override
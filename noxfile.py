@@ -271,7 +271,7 @@ def mockserver(session):
     session.install("pytest")
     session.install("mock")
     session.install(".")
-    session.install("sqlalchemy>=2.0")
+    session.install("sqlalchemy[asyncio]>=2.0")
     session.run(
         "python",
         "create_test_config.py",
@@ -288,6 +288,37 @@ def mockserver(session):
     )
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION_FOR_SQLALCHEMY_20)
+def mockserver_benchmark(session):
+    """Run the dialect benchmarks against an in-mem mocked Spanner server.
+
+    The results are reported and compared with
+    test/benchmarks/baseline.json. A CPU time regression fails the session.
+    Latency and allocation increases are only reported. Set the
+    SPANNER_BENCHMARK_UPDATE_BASELINE=1 environment variable to update the
+    baseline instead.
+    """
+    session.install("setuptools")
+    session.install("pytest")
+    session.install("mock")
+    session.install(".")
+    session.install("sqlalchemy>=2.0")
+    session.run(
+        "python",
+        "create_test_config.py",
+        "my-project",
+        "my-instance",
+        "my-database",
+        "none",
+        "AnonymousCredentials",
+        "localhost",
+        "9999",
+    )
+    session.run(
+        "py.test", "--quiet", os.path.join("test", "benchmarks"), *session.posargs
+    )
+
+
 @nox.session(python=UNIT_TEST_PYTHON_VERSIONS[0])
 def migration_test(session):
     """Test migrations with SQLAlchemy v1.4 and Alembic"""
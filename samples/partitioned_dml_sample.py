@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
 from sqlalchemy import create_engine, text
 
 from sample_helper import run_sample
@@ -30,13 +29,13 @@ def partitioned_dml_sample():
     # Partitioned DML can only be executed in auto-commit mode, as each
     # Partitioned DML transaction can only consist of one statement.
     with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
-        # Set the DML mode to PARTITIONED_NON_ATOMIC.
-        connection.connection.set_autocommit_dml_mode(
-            AutocommitDmlMode.PARTITIONED_NON_ATOMIC
-        )
-        # Use a bulk update statement to back-fill a column.
+        # Use a bulk update statement to back-fill a column. The
+        # partitioned_dml execution option executes the statement as a
+        # Partitioned DML transaction. Other statements on the same
+        # connection are not affected.
         lower_bound_rowcount = connection.execute(
-            text("update venues set active=true where active is null")
+            text("update venues set active=true where active is null"),
+            execution_options={"partitioned_dml": True},
         ).rowcount
         # Partitioned DML returns the lower-bound update count.
         print("Updated at least ", lower_bound_rowcount, " venue records")
@@ -24,15 +24,16 @@ name = "sqlalchemy-spanner"
 description = "SQLAlchemy dialect integrated into Cloud Spanner database"
 dependencies = [
     "sqlalchemy>=1.1.13",
-    "google-cloud-spanner>=3.55.0",
+    "google-cloud-spanner>=3.55.0,<4.0.0",
     "alembic",
 ]
 extras = {
+    "asyncio": ["sqlalchemy[asyncio]>=2.0"],
     "tracing": [
         "opentelemetry-api >= 1.1.0",
         "opentelemetry-sdk >= 1.1.0",
         "opentelemetry-instrumentation >= 0.20b0",
-    ]
+    ],
 }
 
 BASE_DIR = os.path.dirname(__file__)
@@ -73,7 +74,9 @@ setuptools.setup(
     long_description=readme,
     entry_points={
         "sqlalchemy.dialects": [
-            "spanner.spanner = google.cloud.sqlalchemy_spanner:SpannerDialect"
+            "spanner.spanner = google.cloud.sqlalchemy_spanner:SpannerDialect",
+            "spanner.spanner_async = "
+            "google.cloud.sqlalchemy_spanner.async_dialect:SpannerAsyncDialect",
         ]
     },
     install_requires=dependencies,
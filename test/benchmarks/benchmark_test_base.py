@@ -0,0 +1,124 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.cloud.spanner_v1 import ExecuteBatchDmlRequest, ExecuteSqlRequest
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+from test.benchmarks import harness
+from test.mockserver_tests.mock_server_test_base import MockServerTestBase, add_result
+
+
+def create_result_set(fields, rows):
+    """Creates a result set with the given columns and rows.
+
+    Args:
+        fields (Sequence[Tuple[str, spanner_type.TypeCode]]): The name and
+            type of each column.
+        rows (Sequence[Sequence]): The rows of the result set. Values must
+            be given in their protobuf string representation.
+
+    Returns:
+        result_set.ResultSet: A result set that can be registered with the
+            mock server.
+    """
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(
+                                        name=name,
+                                        type=spanner_type.Type(dict(code=code)),
+                                    )
+                                )
+                                for name, code in fields
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend(rows)
+    return result
+
+
+def create_update_count(count):
+    return result_set.ResultSet(
+        dict(stats=result_set.ResultSetStats(dict(row_count_exact=count)))
+    )
+
+
+class BenchmarkTestBase(MockServerTestBase):
+    def run_benchmark(self, name, operation, iterations=200, warmup=20):
+        """Measures the given operation and compares it with the baseline.
+
+        A CPU time regression fails the benchmark, unless
+        ``SPANNER_BENCHMARK_REPORT_ONLY`` is set. Latency and allocation
+        increases are only reported at the end of the run.
+        """
+        result = harness.measure(name, operation, iterations, warmup)
+        harness.RESULTS.append(result)
+        if harness.update_baseline_requested():
+            return result
+        baseline = harness.load_baseline().get(name)
+        if baseline is not None:
+            harness.WARNINGS.extend(result.warnings(baseline))
+            problems = result.regressions(baseline)
+            harness.REGRESSIONS.extend(problems)
+            if not harness.report_only_requested():
+                assert not problems, "\n".join(problems)
+        return result
+
+    def prime_results(self, operation, result_for_sql, max_statements=20):
+        """Registers results for all statements that the operation executes.
+
+        The SQL strings that the dialect generates are not repeated in the
+        benchmarks. Instead, the operation is executed until it succeeds, and
+        each statement that the mock server did not know is registered with
+        the result that ``result_for_sql`` returns for it.
+
+        Args:
+            operation (Callable[[], Any]): The operation to prime.
+            result_for_sql (Callable[[str], result_set.ResultSet]): Returns the
+                result that the mock server should return for a statement.
+            max_statements (int): The maximum number of unknown statements.
+        """
+        for _ in range(max_statements):
+            self.spanner_service.clear_requests()
+            try:
+                operation()
+                return
+            except Exception:
+                statements = []
+                for request in self.spanner_service.requests:
+                    if isinstance(request, ExecuteSqlRequest):
+                        statements.append(request.sql)
+                    elif isinstance(request, ExecuteBatchDmlRequest):
+                        statements.extend(s.sql for s in request.statements)
+                unknown = [
+                    sql
+                    for sql in statements
+                    if sql.lower().strip()
+                    not in self.spanner_service.mock_spanner.results
+                ]
+                if not unknown:
+                    raise
+                for sql in unknown:
+                    add_result(sql, result_for_sql(sql))
+        raise AssertionError("Too many statements without a result")
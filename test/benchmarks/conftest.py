@@ -0,0 +1,34 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from test.benchmarks import harness
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not harness.RESULTS:
+        return
+    terminalreporter.section("Spanner dialect benchmarks")
+    terminalreporter.write_line(harness.format_report(harness.RESULTS))
+    for title, problems in (
+        ("CPU time regressions compared with the baseline:", harness.REGRESSIONS),
+        ("Latency and allocation increases (not failed):", harness.WARNINGS),
+    ):
+        if problems:
+            terminalreporter.write_line("")
+            terminalreporter.write_line(title)
+            for problem in problems:
+                terminalreporter.write_line(f"  {problem}")
+    if harness.update_baseline_requested():
+        harness.save_baseline(harness.RESULTS)
+        terminalreporter.write_line(f"Baseline written to {harness.BASELINE_FILE}")
@@ -0,0 +1,299 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A small harness for measuring the overhead that the Spanner dialect adds on
+top of the Spanner client library.
+
+Every benchmark case is a callable that executes one operation. The harness
+runs the operation a number of times and records the p50 and p99 latency, the
+p50 CPU time of the calling thread and the number of bytes that are allocated
+per operation. The CPU time does not include the work of the mock server and
+of the gRPC threads, so it shows the client-side cost of an operation that is
+hidden by the noise of the round trips in its latency. Latencies are also
+stored relative to a fixed pure-Python calibration workload, so a baseline
+that is recorded on one machine can be compared with a run on another one.
+
+The results are compared with the baseline in ``baseline.json``. A benchmark
+fails if its CPU time, relative to the CPU time of the calibration workload,
+exceeds the baseline by more than the CPU tolerance. The latency and the
+allocations that are traced by ``tracemalloc`` both depend on the load of the
+machine and on the threads of the mock server, so an increase of these is only
+reported. Set the environment variable ``SPANNER_BENCHMARK_REPORT_ONLY=1`` to
+also only report CPU time regressions, and
+``SPANNER_BENCHMARK_UPDATE_BASELINE=1`` to write the results of a run to the
+baseline file instead.
+"""
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# The relative amount that a benchmark may use more CPU time / be slower /
+# allocate more than the baseline before it is marked as a regression. The
+# defaults are lenient, as shared CI machines are noisy. They can be
+# overridden with environment variables.
+DEFAULT_CPU_TOLERANCE = 0.5
+DEFAULT_LATENCY_TOLERANCE = 0.5
+DEFAULT_ALLOCATION_TOLERANCE = 0.25
+# CPU time differences below this number of microseconds are ignored, as the
+# CPU time of the shortest benchmarks is close to the resolution of the clock.
+CPU_SLACK_US = 10
+# Allocation differences below this number of bytes are ignored.
+ALLOCATION_SLACK_BYTES = 1024
+
+# All results of the benchmarks that have been executed in this run. These are
+# reported and optionally written to the baseline file at the end of the run.
+RESULTS = []
+# The CPU time regressions of this run compared with the baseline. These fail
+# the benchmark and are reported at the end of the run.
+REGRESSIONS = []
+# The latency and allocation increases of this run compared with the baseline.
+# These are only reported at the end of the run.
+WARNINGS = []
+
+
+class BenchmarkResult:
+    """The measurements for a single benchmark case."""
+
+    def __init__(
+        self,
+        name,
+        iterations,
+        latencies_ns,
+        allocated_bytes,
+        calibration_ns,
+        cpu_times_ns=None,
+        calibration_cpu_ns=None,
+    ):
+        self.name = name
+        self.iterations = iterations
+        latencies_ns = sorted(latencies_ns)
+        self.p50_us = _percentile(latencies_ns, 50) / 1000
+        self.p99_us = _percentile(latencies_ns, 99) / 1000
+        self.cpu_p50_us = _percentile(sorted(cpu_times_ns or [0]), 50) / 1000
+        self.allocated_bytes = allocated_bytes
+        self.relative_p50 = _percentile(latencies_ns, 50) / calibration_ns
+        self.calibration_cpu_us = (calibration_cpu_ns or calibration_ns) / 1000
+        self.relative_cpu_p50 = self.cpu_p50_us / self.calibration_cpu_us
+
+    def to_baseline(self):
+        return {
+            "relative_p50": round(self.relative_p50, 4),
+            "relative_cpu_p50": round(self.relative_cpu_p50, 4),
+            "allocated_bytes": round(self.allocated_bytes),
+        }
+
+    def regressions(self, baseline):
+        """Returns a list with the CPU time regressions compared to the baseline.
+
+        The CPU time of the calling thread does not include the work of the
+        mock server, so it is stable enough to fail a benchmark on.
+
+        Args:
+            baseline (dict): The baseline entry for this benchmark case.
+
+        Returns:
+            list: Human-readable descriptions of the regressions. The list
+                is empty if the result is within the configured tolerance.
+        """
+        if "relative_cpu_p50" not in baseline:
+            return []
+        cpu_tolerance = float(
+            os.environ.get("SPANNER_BENCHMARK_CPU_TOLERANCE", DEFAULT_CPU_TOLERANCE)
+        )
+        max_cpu = baseline["relative_cpu_p50"] * (1 + cpu_tolerance)
+        slack = CPU_SLACK_US / self.calibration_cpu_us
+        if self.relative_cpu_p50 > max_cpu + slack:
+            return [
+                f"{self.name}: relative p50 CPU time {self.relative_cpu_p50:.4f} "
+                f"exceeds baseline {baseline['relative_cpu_p50']:.4f}"
+            ]
+        return []
+
+    def warnings(self, baseline):
+        """Returns a list with the latency and allocation increases.
+
+        Args:
+            baseline (dict): The baseline entry for this benchmark case.
+
+        Returns:
+            list: Human-readable descriptions of the increases. The list is
+                empty if the result is within the configured tolerances.
+        """
+        latency_tolerance = float(
+            os.environ.get(
+                "SPANNER_BENCHMARK_LATENCY_TOLERANCE", DEFAULT_LATENCY_TOLERANCE
+            )
+        )
+        allocation_tolerance = float(
+            os.environ.get(
+                "SPANNER_BENCHMARK_ALLOCATION_TOLERANCE",
+                DEFAULT_ALLOCATION_TOLERANCE,
+            )
+        )
+        problems = []
+        max_latency = baseline["relative_p50"] * (1 + latency_tolerance)
+        if self.relative_p50 > max_latency:
+            problems.append(
+                f"{self.name}: relative p50 latency {self.relative_p50:.4f} "
+                f"exceeds baseline {baseline['relative_p50']:.4f}"
+            )
+        max_allocated = (
+            baseline["allocated_bytes"] * (1 + allocation_tolerance)
+            + ALLOCATION_SLACK_BYTES
+        )
+        if self.allocated_bytes > max_allocated:
+            problems.append(
+                f"{self.name}: {self.allocated_bytes:.0f} bytes allocated per "
+                f"operation exceeds baseline {baseline['allocated_bytes']}"
+            )
+        return problems
+
+    def __str__(self):
+        return "%-40s %10.1f %10.1f %10.1f %12.0f" % (
+            self.name,
+            self.p50_us,
+            self.p99_us,
+            self.cpu_p50_us,
+            self.allocated_bytes,
+        )
+
+
+def _percentile(sorted_values, percentile):
+    index = round((len(sorted_values) - 1) * percentile / 100)
+    return sorted_values[index]
+
+
+def _calibration_workload():
+    total = 0
+    for i in range(20000):
+        total += i * i
+    return total
+
+
+def calibration_ns(clock=time.perf_counter_ns):
+    """Returns the median duration of a fixed pure-Python workload.
+
+    The value is used to normalize latencies and CPU times, so that baselines
+    that are recorded on a fast machine can be compared with runs on a slow
+    machine. It is measured again for every benchmark case, as the speed of a
+    shared machine can change during a run.
+
+    Args:
+        clock (Callable[[], int]): The clock that measures the duration.
+            Defaults to the wall clock.
+    """
+    durations = []
+    for _ in range(50):
+        start = clock()
+        _calibration_workload()
+        durations.append(clock() - start)
+    return statistics.median(durations)
+
+
+def measure(name, operation, iterations=200, warmup=20):
+    """Measures the latency and allocations of the given operation.
+
+    The operation is first executed ``warmup`` times to fill any caches.
+    The latency is then measured over ``iterations`` executions, after which
+    the allocations are measured in a separate pass, as tracing allocations
+    slows down the execution.
+
+    Args:
+        name (str): The name of the benchmark case.
+        operation (Callable[[], Any]): The operation to measure.
+        iterations (int): The number of measured executions.
+        warmup (int): The number of unmeasured executions before measuring.
+
+    Returns:
+        BenchmarkResult: The measurements for the operation.
+    """
+    for _ in range(warmup):
+        operation()
+
+    calibration = calibration_ns()
+    calibration_cpu = calibration_ns(time.thread_time_ns)
+    latencies_ns = []
+    cpu_times_ns = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns()
+        operation()
+        cpu_times_ns.append(time.thread_time_ns() - cpu_start)
+        latencies_ns.append(time.perf_counter_ns() - start)
+
+    allocation_iterations = max(1, iterations // 10)
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for _ in range(allocation_iterations):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - current
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name,
+        iterations,
+        latencies_ns,
+        allocated / allocation_iterations,
+        calibration,
+        cpu_times_ns,
+        calibration_cpu,
+    )
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+def save_baseline(results):
+    baseline = load_baseline()
+    for result in results:
+        baseline[result.name] = result.to_baseline()
+    with open(BASELINE_FILE, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _env_flag(name):
+    return os.environ.get(name, "") not in ("", "0", "false")
+
+
+def update_baseline_requested():
+    return _env_flag("SPANNER_BENCHMARK_UPDATE_BASELINE")
+
+
+def report_only_requested():
+    return _env_flag("SPANNER_BENCHMARK_REPORT_ONLY")
+
+
+def format_report(results):
+    lines = [
+        "%-40s %10s %10s %10s %12s"
+        % ("benchmark", "p50 (us)", "p99 (us)", "cpu (us)", "bytes/op")
+    ]
+    lines.extend(str(result) for result in results)
+    return "\n".join(lines)
@@ -0,0 +1,339 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from sqlalchemy import delete, insert, inspect, select, update
+from sqlalchemy.orm import Session
+from google.cloud.spanner_v1 import ExecuteSqlRequest, TypeCode
+
+from google.cloud.sqlalchemy_spanner import SpannerDialect, _opentelemetry_tracing
+from test.benchmarks.benchmark_test_base import (
+    BenchmarkTestBase,
+    create_result_set,
+    create_update_count,
+)
+from test.mockserver_tests.mock_server_test_base import add_result
+
+REFLECTED_TABLES = 20
+REFLECTED_COLUMNS = 5
+STREAMED_ROWS_SMALL = 500
+STREAMED_ROWS_LARGE = 5000
+STREAMED_BATCH_SIZE = 100
+IN_LIST_SIZES = (10, 1000)
+TRACED_ROWS = 10000
+
+
+class _StubDatabase:
+    name = "projects/p/instances/i/databases/d"
+
+
+class _StubConnection:
+    database = _StubDatabase()
+
+
+class _StubCursor:
+    """A cursor that does not execute anything.
+
+    Used to measure the overhead of the dialect itself in do_execute and
+    do_executemany without any network round trips.
+    """
+
+    connection = _StubConnection()
+
+    def execute(self, sql, params=None):
+        pass
+
+    def executemany(self, sql, seq_of_params):
+        pass
+
+
+def _reflection_result(sql):
+    sql = sql.lower()
+    if "information_schema.columns" in sql:
+        return create_result_set(
+            [
+                ("table_schema", TypeCode.STRING),
+                ("table_name", TypeCode.STRING),
+                ("column_name", TypeCode.STRING),
+                ("spanner_type", TypeCode.STRING),
+                ("is_nullable", TypeCode.STRING),
+                ("generation_expression", TypeCode.STRING),
+                ("column_default", TypeCode.STRING),
+            ],
+            [
+                ("", f"table{t}", f"col{c}", "STRING(100)", "YES", None, None)
+                for t in range(REFLECTED_TABLES)
+                for c in range(REFLECTED_COLUMNS)
+            ],
+        )
+    if "key_column_usage" in sql and "primary key" in sql:
+        return create_result_set(
+            [
+                ("table_schema", TypeCode.STRING),
+                ("table_name", TypeCode.STRING),
+                ("column_name", TypeCode.STRING),
+            ],
+            [("", f"table{t}", "col0") for t in range(REFLECTED_TABLES)],
+        )
+    # Indexes and foreign keys.
+    return create_result_set([("table_schema", TypeCode.STRING)], [])
+
+
+class TestDialectBenchmarks(BenchmarkTestBase):
+    def test_compile_select(self):
+        from test.benchmarks.benchmark_model import Album, Singer
+
+        dialect = SpannerDialect()
+        statement = (
+            select(Singer.id, Singer.name, Album.title)
+            .join(Album, Album.singer_id == Singer.id)
+            .where(Singer.name == "Alice", Album.title.like("A%"))
+            .order_by(Singer.name)
+            .limit(10)
+        )
+        self.run_benchmark("compile_select", lambda: statement.compile(dialect=dialect))
+
+    def test_compile_update_delete(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        dialect = SpannerDialect()
+        update_statement = update(Singer).where(Singer.id == 1).values(name="Alice")
+        delete_statement = delete(Singer).where(Singer.id == 1)
+
+        def compile_statements():
+            update_statement.compile(dialect=dialect)
+            delete_statement.compile(dialect=dialect)
+
+        self.run_benchmark("compile_update_delete", compile_statements)
+
+    def test_compile_named_schema(self):
+        from test.benchmarks.benchmark_model import SchemaSinger, Singer
+
+        dialect = SpannerDialect()
+        # Tables in a named schema are aliased in SELECT, UPDATE and DELETE
+        # statements. Compare the cost with the same statements for a table
+        # in the default schema.
+        for name, model in (("default", Singer), ("named", SchemaSinger)):
+            statements = [
+                select(model.id, model.name).where(model.id == 1),
+                update(model).where(model.id == 1).values(name="Alice"),
+                delete(model).where(model.id == 1),
+            ]
+
+            def compile_statements():
+                for statement in statements:
+                    statement.compile(dialect=dialect)
+
+            self.run_benchmark(f"compile_crud_{name}_schema", compile_statements)
+
+    def test_compile_in(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        dialect = SpannerDialect()
+        statement = select(Singer.id, Singer.name).where(Singer.id.in_([1]))
+        compiled = statement.compile(dialect=dialect)
+
+        # Compiling the statement and processing the parameters for the
+        # execution does not depend on the number of values in the list.
+        for size in IN_LIST_SIZES:
+            values = list(range(size))
+
+            def compile_in():
+                statement.compile(dialect=dialect)
+                compiled._process_parameters_for_postcompile(
+                    compiled.construct_params({"id_1": values})
+                )
+
+            self.run_benchmark(f"compile_in_{size}_values", compile_in)
+
+    def test_select_in(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        engine = self.create_engine().execution_options(isolation_level="AUTOCOMMIT")
+        request_sizes = []
+        for size in IN_LIST_SIZES:
+            statement = select(Singer.id, Singer.name).where(Singer.id.in_(range(size)))
+
+            def select_in():
+                with engine.connect() as connection:
+                    connection.execute(statement).all()
+
+            self.prime_results(
+                select_in,
+                lambda sql: create_result_set(
+                    [("id", TypeCode.INT64), ("name", TypeCode.STRING)], []
+                ),
+            )
+            self.run_benchmark(f"select_in_{size}_values", select_in, 50, 5)
+            request = next(
+                r
+                for r in self.spanner_service.requests
+                if isinstance(r, ExecuteSqlRequest)
+            )
+            request_sizes.append(ExecuteSqlRequest.pb(request).ByteSize())
+
+        # The values are sent as one array parameter, so the size of the
+        # request only grows with the size of the values.
+        small, large = request_sizes
+        bytes_per_value = (large - small) / (IN_LIST_SIZES[1] - IN_LIST_SIZES[0])
+        assert bytes_per_value < 16, (
+            f"{IN_LIST_SIZES[0]} values: {small} bytes, "
+            f"{IN_LIST_SIZES[1]} values: {large} bytes"
+        )
+
+    def test_do_execute(self):
+        dialect = SpannerDialect()
+        cursor = _StubCursor()
+        sql = "SELECT singers.id, singers.name FROM singers WHERE singers.id = %s"
+
+        # A single call is too fast to measure reliably, so each operation
+        # executes a fixed number of statements.
+        def execute_statements():
+            for _ in range(100):
+                dialect.do_execute(cursor, sql, [1])
+
+        self.run_benchmark("do_execute_100_statements", execute_statements)
+
+    def test_do_executemany(self):
+        dialect = SpannerDialect()
+        cursor = _StubCursor()
+        sql = "INSERT INTO singers (id, name) VALUES (%s, %s)"
+        parameters = [[i, f"Singer {i}"] for i in range(1000)]
+        self.run_benchmark(
+            "do_executemany_1000_rows",
+            lambda: dialect.do_executemany(cursor, sql, parameters),
+        )
+
+    def test_do_executemany_tracing(self):
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON
+
+        dialect = SpannerDialect()
+        cursor = _StubCursor()
+        sql = "INSERT INTO singers (id, name) VALUES (%s, %s)"
+        parameters = [[i, f"Singer {i}"] for i in range(TRACED_ROWS)]
+
+        def executemany():
+            dialect.do_executemany(cursor, sql, parameters)
+
+        # Without a tracer provider, tracing adds no work. With a tracer
+        # provider, the parameters are only converted to strings for spans
+        # that are sampled, and at most MAX_TRACED_PARAMS rows are converted.
+        self.run_benchmark(f"do_executemany_{TRACED_ROWS}_rows_untraced", executemany)
+        for name, sampler in (("not_sampled", ALWAYS_OFF), ("sampled", ALWAYS_ON)):
+            tracer = TracerProvider(sampler=sampler).get_tracer(__name__)
+            with mock.patch.object(
+                _opentelemetry_tracing, "_tracing_enabled", True
+            ), mock.patch.object(_opentelemetry_tracing, "tracer", tracer):
+                self.run_benchmark(
+                    f"do_executemany_{TRACED_ROWS}_rows_{name}", executemany
+                )
+
+    def test_orm_flush(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        engine = self.create_engine()
+
+        def flush():
+            with Session(engine) as session:
+                session.add_all([Singer(id=i, name=f"Singer {i}") for i in range(10)])
+                session.commit()
+
+        self.prime_results(flush, lambda sql: create_update_count(1))
+        self.run_benchmark("orm_flush_10_rows", flush, 50, 5)
+
+    def test_orm_flush_statements(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        engine = self.create_engine()
+
+        # Each flush executes one INSERT statement. The CPU time of the
+        # operation divided by the number of statements is the client-side
+        # cost of each statement, which includes the classification of the
+        # statement.
+        def flush():
+            with Session(engine) as session:
+                for i in range(10):
+                    session.add(Singer(id=i, name=f"Singer {i}"))
+                    session.flush()
+                session.commit()
+
+        self.prime_results(flush, lambda sql: create_update_count(1))
+        self.run_benchmark("orm_flush_10_statements", flush, 50, 5)
+
+    def test_insertmanyvalues(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        engine = self.create_engine()
+        rows = [{"id": i, "name": f"Singer {i}"} for i in range(100)]
+        statement = insert(Singer).returning(Singer.id)
+
+        def insert_rows():
+            with engine.begin() as connection:
+                connection.execute(statement, rows).all()
+
+        self.prime_results(
+            insert_rows,
+            lambda sql: create_result_set(
+                [("id", TypeCode.INT64)], [(str(row["id"]),) for row in rows]
+            ),
+        )
+        self.run_benchmark("insertmanyvalues_100_rows", insert_rows, 50, 5)
+
+    def test_reflection(self):
+        engine = self.create_engine()
+
+        def reflect():
+            inspector = inspect(engine)
+            inspector.get_multi_columns()
+            inspector.get_multi_pk_constraint()
+            inspector.get_multi_indexes()
+            inspector.get_multi_foreign_keys()
+
+        self.prime_results(reflect, _reflection_result)
+        self.run_benchmark("reflect_20_tables", reflect, 50, 5)
+
+    def test_stream_results(self):
+        from test.benchmarks.benchmark_model import Singer
+
+        engine = self.create_engine().execution_options(isolation_level="AUTOCOMMIT")
+        statement = select(Singer.id, Singer.name).execution_options(
+            yield_per=STREAMED_BATCH_SIZE
+        )
+
+        def stream():
+            with engine.connect() as connection:
+                for _ in connection.execute(statement):
+                    pass
+
+        results = []
+        for num_rows in (STREAMED_ROWS_SMALL, STREAMED_ROWS_LARGE):
+            add_result(
+                str(statement.compile(dialect=engine.dialect)),
+                create_result_set(
+                    [("id", TypeCode.INT64), ("name", TypeCode.STRING)],
+                    [(str(i), f"Singer {i}") for i in range(num_rows)],
+                ),
+            )
+            results.append(self.run_benchmark(f"stream_{num_rows}_rows", stream, 5, 1))
+
+        # Rows are fetched in batches of STREAMED_BATCH_SIZE rows, so the
+        # memory that is needed must not grow with the size of the result.
+        small, large = results
+        assert large.allocated_bytes < 1.5 * small.allocated_bytes, (
+            f"streaming {STREAMED_ROWS_LARGE} rows allocated "
+            f"{large.allocated_bytes:.0f} bytes, {STREAMED_ROWS_SMALL} rows "
+            f"allocated {small.allocated_bytes:.0f} bytes"
+        )
@@ -51,6 +51,11 @@ for module_name in modules_to_patch:
         pass
 
 registry.register("spanner", "google.cloud.sqlalchemy_spanner", "SpannerDialect")
+registry.register(
+    "spanner.spanner_async",
+    "google.cloud.sqlalchemy_spanner.async_dialect",
+    "SpannerAsyncDialect",
+)
 
 pytest.register_assert_rewrite("sqlalchemy.testing.assertions")
 
@@ -0,0 +1,58 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import enum
+
+from sqlalchemy import BigInteger, Enum, ForeignKeyConstraint, String
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Genre(enum.Enum):
+    POP = "pop"
+    ROCK = "rock"
+
+
+class Singer(Base):
+    __tablename__ = "singers"
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+    genre: Mapped[Genre] = mapped_column(Enum(Genre, native_enum=False))
+
+
+class Album(Base):
+    __tablename__ = "albums"
+    singer_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    title: Mapped[str] = mapped_column(String)
+    tracks: Mapped[list["Track"]] = relationship()
+
+
+class Track(Base):
+    __tablename__ = "tracks"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["singer_id", "album_id"], ["albums.singer_id", "albums.id"]
+        ),
+    )
+    singer_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    album_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    title: Mapped[str] = mapped_column(String)
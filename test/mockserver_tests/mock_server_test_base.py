@@ -38,6 +38,14 @@ def add_result(sql: str, result: ResultSet):
     MockServerTestBase.spanner_service.mock_spanner.add_result(sql, result)
 
 
+def add_read_result(table: str, result: ResultSet):
+    MockServerTestBase.spanner_service.mock_spanner.add_read_result(table, result)
+
+
+def add_partitioned_result(sql: str, results: [ResultSet]):
+    MockServerTestBase.spanner_service.mock_spanner.add_partitioned_result(sql, results)
+
+
 def add_update_count(
     sql: str, count: int, dml_mode: AutocommitDmlMode = AutocommitDmlMode.TRANSACTIONAL
 ):
@@ -26,6 +26,7 @@ import google.cloud.spanner_v1.types.transaction as transaction
 import google.cloud.spanner_v1.types.commit_response as commit
 import google.cloud.spanner_v1.types.spanner as spanner
 from concurrent import futures
+from typing import Iterator
 import grpc
 import base64
 
@@ -33,37 +34,79 @@ import base64
 class MockSpanner:
     def __init__(self):
         self.results = {}
+        self.partitioned_results = {}
+        self.read_results = {}
 
     def add_result(self, sql: str, result: result_set.ResultSet):
         self.results[sql.lower().strip()] = result
 
-    def get_result(self, sql: str) -> result_set.ResultSet:
+    def add_partitioned_result(self, sql: str, results: [result_set.ResultSet]):
+        """Registers the results of each partition of a partitioned query."""
+        self.partitioned_results[sql.lower().strip()] = results
+
+    def add_read_result(self, table: str, result: result_set.ResultSet):
+        """Registers the result of a Read request for the given table."""
+        self.read_results[table.lower()] = result
+
+    def get_read_result(self, table: str) -> result_set.ResultSet:
+        result = self.read_results.get(table.lower())
+        if result is None:
+            raise ValueError(f"No read result found for {table}")
+        return result
+
+    def get_partitions(self, sql: str) -> [spanner.Partition]:
+        results = self.partitioned_results.get(sql.lower().strip(), [])
+        return [
+            spanner.Partition(dict(partition_token=str(index).encode()))
+            for index in range(len(results))
+        ]
+
+    def get_result(
+        self, sql: str, partition_token: bytes = b""
+    ) -> result_set.ResultSet:
+        if partition_token:
+            results = self.partitioned_results.get(sql.lower().strip())
+            if results is None:
+                raise ValueError(f"No partitioned result found for {sql}")
+            return results[int(partition_token)]
         result = self.results.get(sql.lower().strip())
         if result is None:
             raise ValueError(f"No result found for {sql}")
         return result
 
     def get_result_as_partial_result_sets(
-        self, sql: str, started_transaction: transaction.Transaction
-    ) -> [result_set.PartialResultSet]:
-        result: result_set.ResultSet = self.get_result(sql)
-        partials = []
-        first = True
-        if len(result.rows) == 0:
+        self,
+        sql: str,
+        started_transaction: transaction.Transaction,
+        partition_token: bytes = b"",
+    ) -> Iterator[result_set.PartialResultSet]:
+        return self.as_partial_result_sets(
+            self.get_result(sql, partition_token), started_transaction
+        )
+
+    def as_partial_result_sets(
+        self,
+        result: result_set.ResultSet,
+        started_transaction: transaction.Transaction,
+    ) -> Iterator[result_set.PartialResultSet]:
+        # The partial result sets are created while the stream is consumed,
+        # so a large result does not need to be copied in memory first.
+        rows = result.rows if len(result.rows) > 0 else [None]
+        last = len(rows) - 1
+        for index, row in enumerate(rows):
             partial = result_set.PartialResultSet()
-            partial.metadata = ResultSetMetadata(result.metadata)
-            partials.append(partial)
-        else:
-            for row in result.rows:
-                partial = result_set.PartialResultSet()
-                if first:
-                    partial.metadata = ResultSetMetadata(result.metadata)
+            if index == 0:
+                partial.metadata = ResultSetMetadata(result.metadata)
+                if started_transaction:
+                    partial.metadata.transaction = started_transaction
+            if row is not None:
                 partial.values.extend(row)
-                partials.append(partial)
-        partials[len(partials) - 1].stats = result.stats
-        if started_transaction:
-            partials[0].metadata.transaction = started_transaction
-        return partials
+                # Spanner returns resume tokens while streaming. The client
+                # buffers all partial result sets until it sees one.
+                partial.resume_token = str(index + 1).encode()
+            if index == last:
+                partial.stats = result.stats
+            yield partial
 
 
 # An in-memory mock Spanner server that can be used for testing.
@@ -134,7 +177,7 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
                 request.session, request.transaction.begin
             )
         partials = self.mock_spanner.get_result_as_partial_result_sets(
-            request.sql, started_transaction
+            request.sql, started_transaction, request.partition_token
         )
         for result in partials:
             yield result
@@ -165,7 +208,15 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def StreamingRead(self, request, context):
         self._requests.append(request)
-        for result in [result_set.PartialResultSet(), result_set.PartialResultSet()]:
+        started_transaction = None
+        if not request.transaction.begin == TransactionOptions():
+            started_transaction = self.__create_transaction(
+                request.session, request.transaction.begin
+            )
+        partials = self.mock_spanner.as_partial_result_sets(
+            self.mock_spanner.get_read_result(request.table), started_transaction
+        )
+        for result in partials:
             yield result
 
     def BeginTransaction(self, request, context):
@@ -188,6 +239,9 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def Commit(self, request, context):
         self._requests.append(request)
+        if not request.transaction_id:
+            # Single-use read/write transaction, e.g. a batch of mutations.
+            return commit.CommitResponse()
         tx = self.transactions[request.transaction_id]
         if tx is None:
             raise ValueError(f"Transaction not found: {request.transaction_id}")
@@ -200,7 +254,9 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def PartitionQuery(self, request, context):
         self._requests.append(request)
-        return spanner.PartitionResponse()
+        return spanner.PartitionResponse(
+            dict(partitions=self.mock_spanner.get_partitions(request.sql))
+        )
 
     def PartitionRead(self, request, context):
         self._requests.append(request)
@@ -0,0 +1,165 @@
+# Copyright 2024 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import textwrap
+
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+from google.cloud.spanner_admin_database_v1 import UpdateDatabaseDdlRequest
+from sqlalchemy import Column, Integer, text
+from sqlalchemy.testing import eq_, is_, is_instance_of
+from google.cloud.spanner_v1 import ExecuteSqlRequest, ResultSet
+
+from google.cloud.sqlalchemy_spanner.sqlalchemy_spanner import SpannerImpl
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_result,
+    add_update_count,
+)
+
+MIGRATION = """
+from alembic import op
+import sqlalchemy as sa
+
+revision = "{revision}"
+down_revision = {down_revision}
+
+
+def upgrade():
+    op.add_column("singers", sa.Column("{column}", sa.String(100)))
+    op.create_index("idx_singers_{column}", "singers", ["{column}"])
+"""
+
+
+class TestAlembicDdlBatch(MockServerTestBase):
+    def create_script_directory(self, directory):
+        os.makedirs(os.path.join(directory, "versions"))
+        for revision, down_revision, column in (
+            ("a1", None, "first_name"),
+            ("a2", '"a1"', "last_name"),
+        ):
+            with open(os.path.join(directory, "versions", f"{revision}.py"), "w") as f:
+                f.write(
+                    textwrap.dedent(
+                        MIGRATION.format(
+                            revision=revision,
+                            down_revision=down_revision,
+                            column=column,
+                        )
+                    )
+                )
+        config = Config()
+        config.set_main_option("script_location", directory)
+        return ScriptDirectory.from_config(config)
+
+    def test_batch_per_migration_step(self):
+        add_result(
+            "SELECT true\nFROM INFORMATION_SCHEMA.TABLES\n"
+            "WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name\n"
+            "LIMIT 1",
+            ResultSet(),
+        )
+        add_result(
+            "SELECT alembic_version.version_num \nFROM alembic_version", ResultSet()
+        )
+        add_update_count("INSERT INTO alembic_version (version_num) VALUES ('a1')", 1)
+        add_update_count(
+            "UPDATE alembic_version SET version_num='a2' "
+            "WHERE alembic_version.version_num = 'a1'",
+            1,
+        )
+        engine = self.create_engine()
+        with tempfile.TemporaryDirectory() as directory:
+            script = self.create_script_directory(directory)
+            with engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as connection:
+                context = MigrationContext.configure(
+                    connection,
+                    opts={
+                        "script": script,
+                        "fn": lambda rev, ctx: script._upgrade_revs("head", rev),
+                        "version_table_pk": False,
+                    },
+                )
+                is_instance_of(context.impl, SpannerImpl)
+                with Operations.context(context):
+                    context.run_migrations()
+
+        requests = self.database_admin_service.requests
+        is_instance_of(requests[0], UpdateDatabaseDdlRequest)
+        # The version table is created before the migrations are executed.
+        eq_(3, len(requests))
+        eq_(1, len(requests[0].statements))
+        # Each migration step is executed as one batch.
+        eq_(
+            [
+                "ALTER TABLE singers ADD COLUMN first_name STRING(100)",
+                "CREATE INDEX idx_singers_first_name ON singers (first_name)",
+            ],
+            list(requests[1].statements),
+        )
+        eq_(
+            [
+                "ALTER TABLE singers ADD COLUMN last_name STRING(100)",
+                "CREATE INDEX idx_singers_last_name ON singers (last_name)",
+            ],
+            list(requests[2].statements),
+        )
+
+    def test_flush_before_data_migration(self):
+        sql = "UPDATE singers SET age=0 WHERE age IS NULL"
+        add_update_count(sql, 10)
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            context = MigrationContext.configure(connection)
+            op = Operations(context)
+            op.add_column("singers", Column("age", Integer))
+            op.create_index("idx_singers_age", "singers", ["age"])
+            eq_(0, len(self.database_admin_service.requests))
+            eq_(
+                0,
+                len(
+                    [
+                        r
+                        for r in self.spanner_service.requests
+                        if isinstance(r, ExecuteSqlRequest)
+                    ]
+                ),
+            )
+
+            op.execute(text(sql))
+            requests = self.database_admin_service.requests
+            eq_(1, len(requests))
+            eq_(2, len(requests[0].statements))
+
+            op.execute("ALTER TABLE singers ADD COLUMN name STRING(MAX)")
+            context.impl.flush_ddl()
+            eq_(2, len(self.database_admin_service.requests))
+
+    def test_execute_comment(self):
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            context = MigrationContext.configure(connection)
+            is_(False, context.impl._is_ddl("-- comment"))
+            is_(False, context.impl._is_ddl(text("")))
+            is_(True, context.impl._is_ddl(text("DROP INDEX idx_singers_age")))
@@ -0,0 +1,345 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from unittest import mock
+
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.testing import eq_, is_, is_instance_of, is_true
+from google.cloud.spanner_v1 import (
+    BatchCreateSessionsRequest,
+    BeginTransactionRequest,
+    CommitRequest,
+    CreateSessionRequest,
+    ExecuteBatchDmlRequest,
+    ExecuteSqlRequest,
+    PartitionQueryRequest,
+    ReadRequest,
+    RollbackRequest,
+    TypeCode,
+)
+from google.cloud.spanner_v1.database import Database
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_partitioned_result,
+    add_read_result,
+    add_select1_result,
+    add_single_result,
+    add_singer_query_result,
+    add_update_count,
+)
+
+
+class TestAsyncio(MockServerTestBase):
+    def create_async_engine(self):
+        return create_async_engine(
+            "spanner+spanner_async:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+        )
+
+    def test_select1(self):
+        add_select1_result()
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                result = await connection.execute(text("select 1"))
+                rows = result.all()
+            await engine.dispose()
+            return rows
+
+        eq_([(1,)], asyncio.run(run()))
+        requests = self.spanner_service.requests
+        eq_(4, len(requests))
+        is_instance_of(requests[0], CreateSessionRequest)
+        is_instance_of(requests[1], BeginTransactionRequest)
+        is_instance_of(requests[2], ExecuteSqlRequest)
+        is_instance_of(requests[3], RollbackRequest)
+
+    def test_autocommit_read_only(self):
+        add_select1_result()
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                connection = await connection.execution_options(
+                    isolation_level="AUTOCOMMIT", read_only=True
+                )
+                result = await connection.execute(text("select 1"))
+                rows = result.all()
+            await engine.dispose()
+            return rows
+
+        eq_([(1,)], asyncio.run(run()))
+        requests = self.spanner_service.requests
+        eq_(2, len(requests))
+        is_instance_of(requests[0], CreateSessionRequest)
+        is_instance_of(requests[1], ExecuteSqlRequest)
+        eq_(True, requests[1].transaction.single_use.read_only.strong)
+
+    def test_stream_results(self):
+        from test.mockserver_tests.asyncio_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\nFROM singers ORDER BY singers.id"
+        )
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                result = await connection.stream(
+                    select(Singer.id, Singer.name).order_by(Singer.id)
+                )
+                rows = [row async for row in result]
+            await engine.dispose()
+            return rows
+
+        eq_([(1, "Jane Doe"), (2, "John Doe")], asyncio.run(run()))
+
+    def test_partitioned_query(self):
+        from test.mockserver_tests.asyncio_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name \nFROM singers")
+        sql = "SELECT singers.id, singers.name \nFROM singers"
+        result = self.spanner_service.mock_spanner.get_result(sql)
+        add_partitioned_result(sql, [result, result])
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                connection = await connection.execution_options(
+                    isolation_level="AUTOCOMMIT", partitioned=True
+                )
+                result = await connection.execute(select(Singer.id, Singer.name))
+                rows = result.all()
+            await engine.dispose()
+            return rows
+
+        eq_(
+            [(1, "Jane Doe"), (1, "Jane Doe"), (2, "John Doe"), (2, "John Doe")],
+            sorted(asyncio.run(run())),
+        )
+        requests = self.spanner_service.requests
+        eq_(1, len([r for r in requests if isinstance(r, PartitionQueryRequest)]))
+        eq_(2, len([r for r in requests if isinstance(r, ExecuteSqlRequest)]))
+
+    def test_point_read(self):
+        from test.mockserver_tests.asyncio_model import Singer
+
+        sql = "SELECT singers.id, singers.name \nFROM singers"
+        add_singer_query_result(sql)
+        add_read_result("singers", self.spanner_service.mock_spanner.get_result(sql))
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                connection = await connection.execution_options(
+                    isolation_level="AUTOCOMMIT", point_reads=True
+                )
+                result = await connection.execute(
+                    select(Singer.id, Singer.name).where(Singer.id.in_([1, 2]))
+                )
+                rows = result.all()
+            await engine.dispose()
+            return rows
+
+        eq_([(1, "Jane Doe"), (2, "John Doe")], asyncio.run(run()))
+        requests = self.spanner_service.requests
+        reads = [r for r in requests if isinstance(r, ReadRequest)]
+        eq_(1, len(reads))
+        eq_(2, len(reads[0].key_set.keys))
+        eq_(0, len([r for r in requests if isinstance(r, ExecuteSqlRequest)]))
+
+    def test_async_session(self):
+        from test.mockserver_tests.asyncio_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\nFROM singers\nWHERE singers.id = @a0"
+        )
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id = @a1", 1)
+
+        async def run():
+            engine = self.create_async_engine()
+            async with AsyncSession(engine) as session:
+                singer = await session.scalar(select(Singer).where(Singer.id == 1))
+                singer.name = "New Name"
+                await session.commit()
+            await engine.dispose()
+
+        asyncio.run(run())
+        requests = self.spanner_service.requests
+        eq_(5, len(requests))
+        is_instance_of(requests[0], CreateSessionRequest)
+        is_instance_of(requests[1], BeginTransactionRequest)
+        is_instance_of(requests[2], ExecuteSqlRequest)
+        is_instance_of(requests[3], ExecuteSqlRequest)
+        is_instance_of(requests[4], CommitRequest)
+
+    def test_batch_dml(self):
+        from test.mockserver_tests.asyncio_model import Singer
+
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id = @a1", 1)
+
+        async def run():
+            engine = self.create_async_engine().execution_options(batch_dml=True)
+            async with engine.begin() as connection:
+                for i in range(2):
+                    await connection.execute(
+                        update(Singer).where(Singer.id == i).values(name="Name")
+                    )
+            await engine.dispose()
+
+        asyncio.run(run())
+        requests = self.spanner_service.requests
+        eq_(4, len(requests))
+        is_instance_of(requests[2], ExecuteBatchDmlRequest)
+        eq_(2, len(requests[2].statements))
+        is_instance_of(requests[3], CommitRequest)
+
+    def test_rollback_discards_batch_dml(self):
+        from test.mockserver_tests.asyncio_model import Singer
+
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id = @a1", 1)
+
+        async def run():
+            engine = self.create_async_engine().execution_options(batch_dml=True)
+            async with engine.connect() as connection:
+                await connection.execute(
+                    update(Singer).where(Singer.id == 1).values(name="Name")
+                )
+                await connection.rollback()
+                await connection.execute(
+                    update(Singer).where(Singer.id == 2).values(name="Name")
+                )
+                await connection.commit()
+            await engine.dispose()
+
+        asyncio.run(run())
+        # The statement that was rolled back is not sent with the next batch.
+        batches = [
+            r
+            for r in self.spanner_service.requests
+            if isinstance(r, ExecuteBatchDmlRequest)
+        ]
+        eq_(1, len(batches))
+        eq_(1, len(batches[0].statements))
+        eq_("2", batches[0].statements[0].params["a1"])
+
+    def test_create_all(self):
+        from test.mockserver_tests.asyncio_model import Base
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                connection = await connection.execution_options(
+                    isolation_level="AUTOCOMMIT"
+                )
+                await connection.run_sync(Base.metadata.create_all, checkfirst=False)
+            await engine.dispose()
+
+        asyncio.run(run())
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(1, len(requests[0].statements))
+
+    def test_reflection_runs_on_worker_thread(self):
+        add_single_result(
+            """
+SELECT table_name
+FROM information_schema.tables
+WHERE table_type = 'BASE TABLE' AND table_schema = @table_schema
+""",
+            "table_name",
+            TypeCode.STRING,
+            [("singers",)],
+        )
+        threads = []
+        snapshot = Database.snapshot
+
+        def record_snapshot(database, *args, **kwargs):
+            threads.append(threading.current_thread())
+            return snapshot(database, *args, **kwargs)
+
+        async def run():
+            engine = self.create_async_engine()
+            async with engine.connect() as connection:
+                names = await connection.run_sync(
+                    lambda sync_connection: inspect(sync_connection).get_table_names()
+                )
+            await engine.dispose()
+            return names
+
+        with mock.patch.object(Database, "snapshot", record_snapshot):
+            eq_(["singers"], asyncio.run(run()))
+        eq_(1, len(threads))
+        is_true(threads[0].name.startswith("sqlalchemy-spanner"))
+
+    def test_shared_session_pool(self):
+        add_select1_result()
+
+        async def run():
+            engine = create_async_engine(
+                "spanner+spanner_async:///projects/p/instances/i/databases/d",
+                connect_args={
+                    "client": self.client,
+                    "logger": MockServerTestBase.logger,
+                    "session_pool": "fixed",
+                    "session_pool_size": 2,
+                },
+            )
+            async with engine.connect() as conn1, engine.connect() as conn2:
+                await conn1.execute(text("select 1"))
+                await conn2.execute(text("select 1"))
+                raw1 = await conn1.get_raw_connection()
+                raw2 = await conn2.get_raw_connection()
+                databases = (
+                    raw1.dbapi_connection.connection.database,
+                    raw2.dbapi_connection.connection.database,
+                )
+            await engine.dispose()
+            return databases
+
+        database1, database2 = asyncio.run(run())
+        is_(database1, database2)
+        requests = self.spanner_service.requests
+        eq_(1, len([r for r in requests if isinstance(r, BatchCreateSessionsRequest)]))
+
+    def test_pre_ping(self):
+        add_select1_result()
+
+        async def run():
+            engine = create_async_engine(
+                "spanner+spanner_async:///projects/p/instances/i/databases/d",
+                connect_args={
+                    "client": self.client,
+                    "logger": MockServerTestBase.logger,
+                },
+                pool_pre_ping=True,
+                pool_size=1,
+                ping_idle_threshold=0,
+            )
+            async with engine.connect():
+                pass
+            async with engine.connect():
+                pass
+            await engine.dispose()
+
+        asyncio.run(run())
+        requests = [
+            r for r in self.spanner_service.requests if isinstance(r, ExecuteSqlRequest)
+        ]
+        eq_(1, len(requests))
+        eq_("SELECT 1", requests[0].sql)
@@ -38,7 +38,7 @@ class TestAutoIncrement(MockServerTestBase):
         add_result(
             """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="" AND TABLE_NAME="singers"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
             ResultSet(),
@@ -64,7 +64,7 @@ LIMIT 1
         add_result(
             """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="" AND TABLE_NAME="singers"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
             ResultSet(),
@@ -90,7 +90,7 @@ LIMIT 1
         add_result(
             """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="" AND TABLE_NAME="singers"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
             ResultSet(),
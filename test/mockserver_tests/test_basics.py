@@ -13,11 +13,15 @@
 # limitations under the License.
 
 import datetime
+import gc
+import pickle
+import weakref
 
 from google.cloud.spanner_admin_database_v1 import UpdateDatabaseDdlRequest
 from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
 from sqlalchemy import (
     create_engine,
+    inspect,
     select,
     MetaData,
     Table,
@@ -31,8 +35,9 @@ from sqlalchemy import (
     Enum,
 )
 from sqlalchemy.orm import Session, DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.testing import eq_, is_instance_of
+from sqlalchemy.testing import eq_, is_, is_instance_of, is_true
 from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
     CreateSessionRequest,
     ExecuteSqlRequest,
     ResultSet,
@@ -99,7 +104,7 @@ class TestBasics(MockServerTestBase):
         add_result(
             """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="" AND TABLE_NAME="users"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
             ResultSet(),
@@ -133,7 +138,7 @@ LIMIT 1
         add_result(
             """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="schema" AND TABLE_NAME="users"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
             ResultSet(),
@@ -168,15 +173,14 @@ LIMIT 1
         )
 
     def test_create_multiple_tables(self):
-        for i in range(2):
-            add_result(
-                f"""SELECT true
+        add_result(
+            """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="" AND TABLE_NAME="table{i}"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
-                ResultSet(),
-            )
+            ResultSet(),
+        )
         engine = self.create_engine()
         metadata = MetaData()
         for i in range(2):
@@ -201,6 +205,77 @@ LIMIT 1
                 requests[0].statements[i],
             )
 
+    def test_has_table_uses_query_parameters(self):
+        add_result(
+            """SELECT true
+FROM INFORMATION_SCHEMA.TABLES
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
+LIMIT 1
+""",
+            ResultSet(),
+        )
+        engine = self.create_engine()
+        inspector = inspect(engine)
+        eq_(False, inspector.has_table("singers"))
+        eq_(False, inspector.has_table("albums", schema="music"))
+        requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+        eq_(2, len(requests))
+        # Both checks use the same SQL string, so Spanner can reuse the plan.
+        eq_(requests[0].sql, requests[1].sql)
+        eq_({"table_schema": "", "table_name": "singers"}, dict(requests[0].params))
+        eq_({"table_schema": "music", "table_name": "albums"}, dict(requests[1].params))
+        eq_(TypeCode.STRING, requests[0].param_types["table_name"].code)
+
+    def test_object_names_use_query_parameters(self):
+        add_single_result(
+            """
+SELECT table_name
+FROM information_schema.tables
+WHERE table_type = 'BASE TABLE' AND table_schema = @table_schema
+""",
+            "table_name",
+            TypeCode.STRING,
+            [("singers",)],
+        )
+        add_single_result(
+            """
+            SELECT table_name
+            FROM information_schema.views
+            WHERE TABLE_SCHEMA=@table_schema
+            """,
+            "table_name",
+            TypeCode.STRING,
+            [("singer_names",)],
+        )
+        add_single_result(
+            """
+            SELECT name
+            FROM information_schema.sequences
+            WHERE SCHEMA=@table_schema
+            """,
+            "name",
+            TypeCode.STRING,
+            [("singer_ids",)],
+        )
+        engine = self.create_engine()
+        inspector = inspect(engine)
+        eq_(["singers"], inspector.get_table_names(schema="music"))
+        eq_(["singer_names"], inspector.get_view_names(schema="music"))
+        eq_(["singer_ids"], inspector.get_sequence_names(schema="music"))
+        requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+        eq_(3, len(requests))
+        for request in requests:
+            eq_({"table_schema": "music"}, dict(request.params))
+            eq_(TypeCode.STRING, request.param_types["table_schema"].code)
+
     def test_partitioned_dml(self):
         sql = "UPDATE singers SET checked=true WHERE active = true"
         add_update_count(sql, 100, AutocommitDmlMode.PARTITIONED_NON_ATOMIC)
@@ -212,8 +287,6 @@ LIMIT 1
                 "ignore_transaction_warnings": True,
             },
         )
-        # TODO: Support autocommit_dml_mode as a connection variable in execution
-        #       options.
         with engine.connect().execution_options(
             isolation_level="AUTOCOMMIT"
         ) as connection:
@@ -223,6 +296,57 @@ LIMIT 1
             results = connection.execute(text(sql)).rowcount
             eq_(100, results)
 
+    def test_partitioned_dml_execution_option(self):
+        sql = "UPDATE singers SET checked=true WHERE active = true"
+        add_update_count(sql, 100, AutocommitDmlMode.PARTITIONED_NON_ATOMIC)
+        add_update_count("UPDATE singers SET checked=false WHERE id = 1", 1)
+        engine = create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            pool_size=1,
+        )
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            result = connection.execute(
+                text(sql).execution_options(partitioned_dml=True)
+            )
+            # Partitioned DML returns a lower bound for the update count.
+            eq_(100, result.rowcount)
+            # The DML mode is only used for the statement with the option.
+            eq_(
+                AutocommitDmlMode.TRANSACTIONAL,
+                connection.connection.autocommit_dml_mode,
+            )
+            connection.execute(text("UPDATE singers SET checked=false WHERE id = 1"))
+
+        requests = self.spanner_service.requests
+        begin_requests = [r for r in requests if isinstance(r, BeginTransactionRequest)]
+        eq_(1, len(begin_requests))
+        is_true("partitioned_dml" in begin_requests[0].options)
+        execute_requests = [r for r in requests if isinstance(r, ExecuteSqlRequest)]
+        eq_(2, len(execute_requests))
+        eq_(begin_requests[0].session, execute_requests[0].session)
+        is_true("read_write" in execute_requests[1].transaction.begin)
+
+    def test_partitioned_dml_reset_on_return_to_pool(self):
+        engine = create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            pool_size=1,
+        )
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.connection.set_autocommit_dml_mode(
+                AutocommitDmlMode.PARTITIONED_NON_ATOMIC
+            )
+        with engine.connect() as connection:
+            eq_(
+                AutocommitDmlMode.TRANSACTIONAL,
+                connection.connection.autocommit_dml_mode,
+            )
+
     def test_select_for_update(self):
         class Base(DeclarativeBase):
             pass
@@ -317,3 +441,71 @@ LIMIT 1
             singer = session.query(Singer).filter(Singer.id == 1).first()
             session.delete(singer)
             session.commit()
+
+    def test_schema_aliases_are_cached_on_table(self):
+        metadata = MetaData()
+        singers = Table(
+            "singers",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String),
+            schema="my_schema",
+        )
+        dialect = self.create_engine().dialect
+        statements = [
+            select(singers).where(singers.c.id == 1),
+            singers.update().where(singers.c.id == 1).values(name="Name"),
+            singers.delete().where(singers.c.id == 1),
+        ]
+        first = [str(s.compile(dialect=dialect)) for s in statements]
+        schema_alias = singers._spanner_schema_alias
+        second = [str(s.compile(dialect=dialect)) for s in statements]
+
+        # Later compilations reuse the alias and give the same SQL.
+        eq_(first, second)
+        is_(schema_alias, singers._spanner_schema_alias)
+        eq_(
+            "SELECT singers_1.id, singers_1.name \n"
+            "FROM my_schema.singers AS singers_1 \n"
+            "WHERE singers_1.id = %s",
+            first[0],
+        )
+
+    def test_schema_alias_after_append_column(self):
+        metadata = MetaData()
+        singers = Table(
+            "singers",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            schema="my_schema",
+        )
+        dialect = self.create_engine().dialect
+        str(select(singers).compile(dialect=dialect))
+        singers.append_column(Column("name", String))
+
+        # The alias is created again with the new column.
+        eq_(
+            "SELECT singers_1.id, singers_1.name \n"
+            "FROM my_schema.singers AS singers_1 \n"
+            "WHERE singers_1.name = %s",
+            str(
+                select(singers).where(singers.c.name == "Name").compile(dialect=dialect)
+            ),
+        )
+
+    def test_schema_aliases_do_not_keep_tables_alive(self):
+        dialect = self.create_engine().dialect
+        metadata = MetaData()
+        singers = Table(
+            "singers",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            schema="my_schema",
+        )
+        str(select(singers).compile(dialect=dialect))
+        # A metadata object with a cached alias can still be pickled.
+        pickle.loads(pickle.dumps(metadata))
+        singers_ref = weakref.ref(singers)
+        del metadata, singers
+        gc.collect()
+        is_(None, singers_ref())
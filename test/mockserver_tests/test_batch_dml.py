@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import delete, text, update
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.testing import eq_, is_instance_of
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    CommitRequest,
+    CreateSessionRequest,
+    ExecuteBatchDmlRequest,
+    ExecuteSqlRequest,
+)
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_select1_result,
+    add_update_count,
+)
+
+
+class TestBatchDml(MockServerTestBase):
+    def test_orm_flush(self):
+        from test.mockserver_tests.batch_dml_model import Album, Singer
+
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id = @a1", 1)
+        add_update_count("DELETE FROM albums WHERE albums.id = @a0", 1)
+        engine = self.create_engine().execution_options(batch_dml=True)
+
+        with Session(engine) as session:
+            singer = Singer(id=1, name="Old Name")
+            album = Album(id=1, title="Title")
+            make_transient_to_detached(singer)
+            make_transient_to_detached(album)
+            session.add_all([singer, album])
+            singer.name = "New Name"
+            session.delete(album)
+            session.commit()
+
+        requests = self.spanner_service.requests
+        eq_(4, len(requests))
+        is_instance_of(requests[0], CreateSessionRequest)
+        is_instance_of(requests[1], BeginTransactionRequest)
+        is_instance_of(requests[2], ExecuteBatchDmlRequest)
+        is_instance_of(requests[3], CommitRequest)
+        batch: ExecuteBatchDmlRequest = requests[2]
+        eq_(
+            [
+                "UPDATE singers SET name=@a0 WHERE singers.id = @a1",
+                "DELETE FROM albums WHERE albums.id = @a0",
+            ],
+            [statement.sql for statement in batch.statements],
+        )
+
+    def test_row_counts(self):
+        from test.mockserver_tests.batch_dml_model import Album, Singer
+
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id > @a1", 3)
+        add_update_count("DELETE FROM albums WHERE albums.id > @a0", 5)
+        add_select1_result()
+        engine = self.create_engine().execution_options(batch_dml=True)
+
+        with engine.begin() as connection:
+            update_result = connection.execute(
+                update(Singer).where(Singer.id > 1).values(name="Name")
+            )
+            delete_result = connection.execute(delete(Album).where(Album.id > 1))
+            # Executing a query sends the batch to Spanner.
+            connection.execute(text("select 1")).all()
+            eq_(3, update_result.rowcount)
+            eq_(5, delete_result.rowcount)
+
+        requests = self.spanner_service.requests
+        eq_(5, len(requests))
+        is_instance_of(requests[2], ExecuteBatchDmlRequest)
+        eq_(2, len(requests[2].statements))
+        is_instance_of(requests[3], ExecuteSqlRequest)
+        is_instance_of(requests[4], CommitRequest)
+
+    def test_rollback_discards_batch(self):
+        from test.mockserver_tests.batch_dml_model import Singer
+
+        engine = self.create_engine().execution_options(batch_dml=True)
+
+        with engine.connect() as connection:
+            connection.execute(update(Singer).values(name="Name"))
+            connection.rollback()
+
+        # The buffered statement is never sent to Spanner.
+        eq_(
+            [],
+            [
+                r
+                for r in self.spanner_service.requests
+                if not isinstance(r, CreateSessionRequest)
+            ],
+        )
@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.testing import eq_, is_true
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    ExecuteSqlRequest,
+    ResultSet,
+    TypeCode,
+)
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_result,
+)
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+
+def create_result(fields, rows):
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(name=name, type=spanner_type.Type(code=code))
+                                )
+                                for name, code in fields
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend(rows)
+    return result
+
+
+class TestBulkReflection(MockServerTestBase):
+    def create_engine(self, **kwargs):
+        return create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            **kwargs,
+        )
+
+    def add_reflection_results(self, engine):
+        dialect = engine.dialect
+        add_result(
+            dialect._get_multi_columns_query(None, None, None),
+            create_result(
+                [
+                    ("table_schema", TypeCode.STRING),
+                    ("table_name", TypeCode.STRING),
+                    ("column_name", TypeCode.STRING),
+                    ("spanner_type", TypeCode.STRING),
+                    ("is_nullable", TypeCode.STRING),
+                    ("generation_expression", TypeCode.STRING),
+                    ("column_default", TypeCode.STRING),
+                ],
+                [
+                    ("", "singers", "id", "INT64", "NO", None, None),
+                    ("", "singers", "name", "STRING(MAX)", "YES", None, None),
+                ],
+            ),
+        )
+        add_result(
+            dialect._get_multi_pk_constraint_query(None, None, None),
+            create_result(
+                [
+                    ("table_schema", TypeCode.STRING),
+                    ("table_name", TypeCode.STRING),
+                    ("column_name", TypeCode.STRING),
+                ],
+                [("", "singers", "id")],
+            ),
+        )
+        add_result(dialect._get_multi_indexes_query(None, None, None), ResultSet())
+        add_result(dialect._get_multi_foreign_keys_query(None, None, None), ResultSet())
+
+    def reflect(self, inspector):
+        return (
+            inspector.get_multi_columns(),
+            inspector.get_multi_pk_constraint(),
+            inspector.get_multi_indexes(),
+            inspector.get_multi_foreign_keys(),
+        )
+
+    def test_bulk_reflection(self):
+        engine = self.create_engine(bulk_reflection=True)
+        self.add_reflection_results(engine)
+
+        columns, pk_constraints, indexes, foreign_keys = self.reflect(inspect(engine))
+        eq_(["id", "name"], [c["name"] for c in columns[(None, "singers")]])
+        eq_(["id"], pk_constraints[(None, "singers")]["constrained_columns"])
+        eq_({}, indexes)
+        eq_({}, foreign_keys)
+
+        requests = self.spanner_service.requests
+        begin_requests = [r for r in requests if isinstance(r, BeginTransactionRequest)]
+        eq_(1, len(begin_requests))
+        is_true("read_only" in begin_requests[0].options)
+        execute_requests = [r for r in requests if isinstance(r, ExecuteSqlRequest)]
+        eq_(4, len(execute_requests))
+        transaction_ids = {r.transaction.id for r in execute_requests}
+        eq_(1, len(transaction_ids))
+        is_true(transaction_ids.pop())
+
+    def test_bulk_reflection_per_inspector(self):
+        engine = self.create_engine(bulk_reflection=True)
+        self.add_reflection_results(engine)
+
+        self.reflect(inspect(engine))
+        self.reflect(inspect(engine))
+        requests = self.spanner_service.requests
+        eq_(2, len([r for r in requests if isinstance(r, BeginTransactionRequest)]))
+        eq_(8, len([r for r in requests if isinstance(r, ExecuteSqlRequest)]))
+
+    def test_bulk_reflection_disabled_by_default(self):
+        engine = self.create_engine()
+        self.add_reflection_results(engine)
+
+        self.reflect(inspect(engine))
+        requests = self.spanner_service.requests
+        eq_(0, len([r for r in requests if isinstance(r, BeginTransactionRequest)]))
+        eq_(4, len([r for r in requests if isinstance(r, ExecuteSqlRequest)]))
@@ -28,7 +28,7 @@ class TestCommitTimestamp(MockServerTestBase):
         add_result(
             """SELECT true
 FROM INFORMATION_SCHEMA.TABLES
-WHERE TABLE_SCHEMA="" AND TABLE_NAME="singers"
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
 LIMIT 1
 """,
             ResultSet(),
@@ -36,8 +36,8 @@ LIMIT 1
         add_result(
             """SELECT true
                 FROM INFORMATION_SCHEMA.SEQUENCES
-                WHERE NAME="singer_id"
-                AND SCHEMA=""
+                WHERE NAME=@sequence_name
+                AND SCHEMA=@schema
                 LIMIT 1""",
             ResultSet(),
         )
@@ -0,0 +1,203 @@
+# Copyright 2024 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from google.cloud.spanner_admin_database_v1 import UpdateDatabaseDdlRequest
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    event,
+    text,
+)
+from sqlalchemy.testing import eq_, is_instance_of
+
+from google.cloud.sqlalchemy_spanner import begin_ddl_batch
+from test.mockserver_tests.mock_server_test_base import MockServerTestBase
+
+
+def create_metadata():
+    metadata = MetaData()
+    Table(
+        "singers",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(100), nullable=False),
+        Index("idx_singers_name", "name"),
+    )
+    Table(
+        "albums",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column(
+            "singer_id",
+            Integer,
+            ForeignKey("singers.id", name="fk_albums_singers"),
+        ),
+        Column("title", String(100)),
+    )
+    return metadata
+
+
+class TestDdlBatch(MockServerTestBase):
+    def test_create_all(self):
+        metadata = create_metadata()
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            metadata.create_all(connection, checkfirst=False)
+
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        is_instance_of(requests[0], UpdateDatabaseDdlRequest)
+        # The statements are sent in dependency order.
+        eq_(
+            [
+                "CREATE TABLE singers",
+                "CREATE INDEX idx_singers_name",
+                "CREATE TABLE albums",
+            ],
+            [" ".join(statement.split()[:3]) for statement in requests[0].statements],
+        )
+
+    def test_drop_all(self):
+        metadata = create_metadata()
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            metadata.drop_all(connection, checkfirst=False)
+
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(
+            [
+                "ALTER TABLE albums DROP CONSTRAINT fk_albums_singers",
+                "DROP TABLE albums",
+                "DROP INDEX idx_singers_name",
+                "DROP TABLE singers",
+            ],
+            list(requests[0].statements),
+        )
+
+    def test_begin_ddl_batch(self):
+        metadata = create_metadata()
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            with begin_ddl_batch(connection):
+                metadata.create_all(connection, checkfirst=False)
+                connection.execute(
+                    text("CREATE INDEX idx_albums_title ON albums (title)")
+                )
+                eq_(0, len(self.database_admin_service.requests))
+
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(4, len(requests[0].statements))
+        eq_(
+            "CREATE INDEX idx_albums_title ON albums (title)",
+            requests[0].statements[3],
+        )
+
+    def test_begin_ddl_batch_in_transaction(self):
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            with begin_ddl_batch(connection):
+                connection.execute(text("CREATE TABLE t1 (id INT64) PRIMARY KEY (id)"))
+                connection.execute(text("CREATE TABLE t2 (id INT64) PRIMARY KEY (id)"))
+            # DDL statements in a transaction are executed on commit.
+            eq_(0, len(self.database_admin_service.requests))
+            connection.commit()
+
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(2, len(requests[0].statements))
+
+    def test_begin_ddl_batch_error(self):
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            with pytest.raises(ValueError):
+                with begin_ddl_batch(connection):
+                    connection.execute(
+                        text("CREATE TABLE t1 (id INT64) PRIMARY KEY (id)")
+                    )
+                    raise ValueError("test")
+            connection.execute(text("CREATE TABLE t2 (id INT64) PRIMARY KEY (id)"))
+
+        # The statements in the failed batch are discarded.
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(
+            ["CREATE TABLE t2 (id INT64) PRIMARY KEY (id)"],
+            list(requests[0].statements),
+        )
+
+    def test_create_all_error(self):
+        metadata = create_metadata()
+
+        def fail(target, connection, **kw):
+            raise ValueError("test")
+
+        event.listen(metadata.tables["albums"], "before_create", fail)
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            with pytest.raises(ValueError):
+                metadata.create_all(connection, checkfirst=False)
+            # The batch of the failed create_all call is discarded, and the
+            # connection executes DDL statements directly again.
+            connection.execute(text("CREATE TABLE t1 (id INT64) PRIMARY KEY (id)"))
+            eq_(1, len(self.database_admin_service.requests))
+
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(
+            ["CREATE TABLE t1 (id INT64) PRIMARY KEY (id)"],
+            list(requests[0].statements),
+        )
+
+    def test_create_all_error_in_ddl_batch(self):
+        metadata = create_metadata()
+
+        def fail(target, connection, **kw):
+            raise ValueError("test")
+
+        event.listen(metadata.tables["albums"], "before_create", fail)
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            with begin_ddl_batch(connection):
+                with pytest.raises(ValueError):
+                    metadata.create_all(connection, checkfirst=False)
+                connection.execute(text("CREATE TABLE t1 (id INT64) PRIMARY KEY (id)"))
+                eq_(0, len(self.database_admin_service.requests))
+
+        # The outer batch is still executed at the end of its block.
+        requests = self.database_admin_service.requests
+        eq_(1, len(requests))
+        eq_(
+            "CREATE TABLE t1 (id INT64) PRIMARY KEY (id)",
+            requests[0].statements[-1],
+        )
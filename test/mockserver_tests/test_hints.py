@@ -0,0 +1,223 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.testing import eq_, is_true
+from google.cloud.spanner_v1 import ExecuteSqlRequest, TypeCode
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_result,
+    add_singer_query_result,
+)
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+from google.cloud.sqlalchemy_spanner import (
+    install_index_hints,
+    spanner_hints,
+    with_index,
+)
+
+
+def add_album_query_result(sql):
+    fields = [
+        ("albums_id", TypeCode.INT64),
+        ("albums_title", TypeCode.STRING),
+        ("albums_singer_id", TypeCode.INT64),
+    ]
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(name=name, type=spanner_type.Type(code=code))
+                                )
+                                for name, code in fields
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend([("10", "Blue", "1")])
+    add_result(sql, result)
+
+
+class TestHints(MockServerTestBase):
+    def execute_requests(self):
+        return [
+            r for r in self.spanner_service.requests if isinstance(r, ExecuteSqlRequest)
+        ]
+
+    def test_statement_and_join_hints(self):
+        from test.mockserver_tests.hints_model import Album, Singer
+
+        sql = (
+            "@{USE_ADDITIONAL_PARALLELISM=TRUE, OPTIMIZER_VERSION=6} "
+            "SELECT singers.id, singers.name\n"
+            "FROM singers JOIN@{JOIN_METHOD=HASH_JOIN} albums "
+            "ON singers.id = albums.singer_id\n"
+            "WHERE albums.title = @a0"
+        )
+        add_singer_query_result(sql)
+        engine = self.create_engine()
+        statement = spanner_hints(
+            select(Singer.id, Singer.name)
+            .join(Singer.albums)
+            .where(Album.title == "Blue"),
+            statement={"USE_ADDITIONAL_PARALLELISM": True, "OPTIMIZER_VERSION": 6},
+            join={"JOIN_METHOD": "HASH_JOIN"},
+        )
+        with engine.connect() as connection:
+            eq_(
+                [(1, "Jane Doe"), (2, "John Doe")],
+                connection.execute(statement).all(),
+            )
+        eq_(sql, self.execute_requests()[0].sql)
+
+    def test_join_hints_only(self):
+        from test.mockserver_tests.hints_model import Album, Singer
+
+        sql = (
+            "SELECT singers.id, singers.name\n"
+            "FROM singers LEFT OUTER JOIN@{JOIN_METHOD=APPLY_JOIN} albums "
+            "ON singers.id = albums.singer_id\n"
+            "WHERE albums.title = @a0"
+        )
+        add_singer_query_result(sql)
+        engine = self.create_engine()
+        # A join hint can also be added with a JOIN@{...} statement hint.
+        statement = (
+            select(Singer.id, Singer.name)
+            .outerjoin(Singer.albums)
+            .where(Album.title == "Blue")
+            .with_statement_hint(
+                "JOIN@{JOIN_METHOD=APPLY_JOIN}", dialect_name="spanner+spanner"
+            )
+        )
+        with engine.connect() as connection:
+            eq_(2, len(connection.execute(statement).all()))
+        eq_(sql, self.execute_requests()[0].sql)
+
+    def test_table_hints(self):
+        from test.mockserver_tests.hints_model import Singer
+
+        sql = (
+            "SELECT singers.id, singers.name\n"
+            "FROM singers @{FORCE_INDEX=idx_singers_name}\n"
+            "WHERE singers.name = @a0"
+        )
+        add_singer_query_result(sql)
+        engine = self.create_engine()
+        statement = spanner_hints(
+            select(Singer.id, Singer.name).where(Singer.name == "Jane Doe"),
+            tables={Singer: {"FORCE_INDEX": "idx_singers_name"}},
+        )
+        with engine.connect() as connection:
+            eq_(2, len(connection.execute(statement).all()))
+        eq_(sql, self.execute_requests()[0].sql)
+
+    def test_statement_hint_in_autocommit(self):
+        from test.mockserver_tests.hints_model import Singer
+
+        # The DB API does not recognize a statement that starts with a hint
+        # as a query. The dialect executes it with a single-use read-only
+        # transaction instead of as DML.
+        add_singer_query_result(
+            "@{OPTIMIZER_VERSION=6} SELECT singers.id, singers.name \n" "FROM singers"
+        )
+        engine = self.create_engine().execution_options(isolation_level="AUTOCOMMIT")
+        statement = spanner_hints(
+            select(Singer.id, Singer.name), statement={"OPTIMIZER_VERSION": 6}
+        )
+        with engine.connect() as connection:
+            eq_(2, len(connection.execute(statement).all()))
+            eq_(False, connection.connection.dbapi_connection.read_only)
+        request = self.execute_requests()[0]
+        is_true(request.transaction.single_use.read_only)
+
+    def test_with_index(self):
+        from test.mockserver_tests.hints_model import Album, Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\n"
+            "FROM singers @{FORCE_INDEX=idx_singers_name}\n"
+            "WHERE singers.name = @a0"
+        )
+        add_album_query_result(
+            "SELECT albums.id AS albums_id, albums.title AS albums_title, "
+            "albums.singer_id AS albums_singer_id\n"
+            "FROM albums @{FORCE_INDEX=idx_albums_singer_id}\n"
+            "WHERE @a0 = albums.singer_id"
+        )
+        session_factory = sessionmaker(self.create_engine())
+        install_index_hints(session_factory)
+        with session_factory() as session:
+            singers = session.scalars(
+                select(Singer)
+                .where(Singer.name == "Jane Doe")
+                .options(
+                    with_index(Singer, "idx_singers_name"),
+                    with_index(Album, "idx_albums_singer_id"),
+                )
+            ).all()
+            # The option is also applied to the lazy load of the albums.
+            eq_(["Blue"], [album.title for album in singers[0].albums])
+        requests = self.execute_requests()
+        eq_(2, len(requests))
+
+    def test_with_index_not_installed(self):
+        from test.mockserver_tests.hints_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\n"
+            "FROM singers\n"
+            "WHERE singers.name = @a0"
+        )
+        # Other sessions do not apply the option.
+        install_index_hints(sessionmaker())
+        with Session(self.create_engine()) as session:
+            session.scalars(
+                select(Singer)
+                .where(Singer.name == "Jane Doe")
+                .options(with_index(Singer, "idx_singers_name"))
+            ).all()
+        eq_(1, len(self.execute_requests()))
+
+    def test_import_does_not_register_listeners(self):
+        code = """
+from sqlalchemy import MetaData, event
+from sqlalchemy.orm import Session
+from google.cloud.sqlalchemy_spanner import sqlalchemy_spanner
+
+assert not event.contains(
+    Session, "do_orm_execute", sqlalchemy_spanner._add_index_hints
+)
+assert not event.contains(
+    MetaData, "before_create", sqlalchemy_spanner._start_metadata_ddl_batch
+)
+sqlalchemy_spanner.SpannerDialect()
+assert event.contains(
+    MetaData, "before_create", sqlalchemy_spanner._start_metadata_ddl_batch
+)
+"""
+        subprocess.check_call([sys.executable, "-c", code])
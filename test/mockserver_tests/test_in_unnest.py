@@ -0,0 +1,250 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import create_engine, select, tuple_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.testing import eq_
+from google.cloud.spanner_v1 import ExecuteSqlRequest, TypeCode
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_result,
+    add_singer_query_result,
+)
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+
+def create_result(fields, rows):
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(name=name, type=spanner_type.Type(code=code))
+                                )
+                                for name, code in fields
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend(rows)
+    return result
+
+
+def array_type(element_type):
+    return spanner_type.Type(code=TypeCode.ARRAY, array_element_type=element_type)
+
+
+def struct_type(*codes):
+    return spanner_type.Type(
+        code=TypeCode.STRUCT,
+        struct_type=spanner_type.StructType(
+            fields=[
+                spanner_type.StructType.Field(
+                    name="", type=spanner_type.Type(code=code)
+                )
+                for code in codes
+            ]
+        ),
+    )
+
+
+class TestInUnnest(MockServerTestBase):
+    def execute_requests(self):
+        return [
+            r for r in self.spanner_service.requests if isinstance(r, ExecuteSqlRequest)
+        ]
+
+    def test_in_list(self):
+        from test.mockserver_tests.in_unnest_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\n"
+            "FROM singers\n"
+            "WHERE singers.id IN UNNEST(@a0)"
+        )
+        engine = self.create_engine()
+        statement = select(Singer.id, Singer.name).where(Singer.id.in_([1, 2]))
+        with engine.connect() as connection:
+            eq_(
+                [(1, "Jane Doe"), (2, "John Doe")],
+                connection.execute(statement).all(),
+            )
+            # A list with a different length uses the same SQL string.
+            connection.execute(
+                select(Singer.id, Singer.name).where(Singer.id.in_(range(1000)))
+            ).all()
+
+        requests = self.execute_requests()
+        eq_(2, len(requests))
+        eq_(requests[0].sql, requests[1].sql)
+        eq_(["a0"], list(requests[0].params.keys()))
+        eq_(["1", "2"], [v for v in requests[0].params["a0"]])
+        eq_(1000, len(requests[1].params["a0"]))
+        for request in requests:
+            eq_(
+                array_type(spanner_type.Type(code=TypeCode.INT64)),
+                request.param_types["a0"],
+            )
+
+    def test_not_in_list(self):
+        from test.mockserver_tests.in_unnest_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\n"
+            "FROM singers\n"
+            "WHERE (singers.name NOT IN UNNEST(@a0))"
+        )
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            connection.execute(
+                select(Singer.id, Singer.name).where(
+                    Singer.name.not_in(["Alice", "Bob"])
+                )
+            ).all()
+
+        requests = self.execute_requests()
+        eq_(1, len(requests))
+        eq_(["Alice", "Bob"], [v for v in requests[0].params["a0"]])
+        eq_(
+            array_type(spanner_type.Type(code=TypeCode.STRING)),
+            requests[0].param_types["a0"],
+        )
+
+    def test_in_list_bind_processor(self):
+        from test.mockserver_tests.in_unnest_model import Genre, Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\n"
+            "FROM singers\n"
+            "WHERE singers.genre IN UNNEST(@a0)"
+        )
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            connection.execute(
+                select(Singer.id, Singer.name).where(
+                    Singer.genre.in_([Genre.POP, Genre.ROCK])
+                )
+            ).all()
+
+        # The bind processor of the Enum type is applied to each element.
+        requests = self.execute_requests()
+        eq_(["POP", "ROCK"], [v for v in requests[0].params["a0"]])
+
+    def test_tuple_in_list(self):
+        from test.mockserver_tests.in_unnest_model import Album
+
+        add_result(
+            "SELECT albums.title\n"
+            "FROM albums\n"
+            "WHERE STRUCT(albums.singer_id, albums.id) "
+            "IN UNNEST(@a0)",
+            create_result([("title", TypeCode.STRING)], [("Title 1",)]),
+        )
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            rows = connection.execute(
+                select(Album.title).where(
+                    tuple_(Album.singer_id, Album.id).in_([(1, 1), (1, 2)])
+                )
+            ).all()
+            eq_([("Title 1",)], rows)
+
+        requests = self.execute_requests()
+        eq_(["a0"], list(requests[0].params.keys()))
+        eq_(
+            [["1", "1"], ["1", "2"]],
+            [list(key) for key in requests[0].params["a0"]],
+        )
+        eq_(
+            array_type(struct_type(TypeCode.INT64, TypeCode.INT64)),
+            requests[0].param_types["a0"],
+        )
+
+    def test_selectinload_composite_key(self):
+        from test.mockserver_tests.in_unnest_model import Album
+
+        add_result(
+            "SELECT albums.singer_id, albums.id, albums.title\nFROM albums",
+            create_result(
+                [
+                    ("singer_id", TypeCode.INT64),
+                    ("id", TypeCode.INT64),
+                    ("title", TypeCode.STRING),
+                ],
+                [("1", "1", "Title 1"), ("1", "2", "Title 2")],
+            ),
+        )
+        add_result(
+            "SELECT tracks.singer_id AS tracks_singer_id, "
+            "tracks.album_id AS tracks_album_id, tracks.id AS tracks_id, "
+            "tracks.title AS tracks_title\n"
+            "FROM tracks\n"
+            "WHERE STRUCT(tracks.singer_id, tracks.album_id) "
+            "IN UNNEST(@a0)",
+            create_result(
+                [
+                    ("singer_id", TypeCode.INT64),
+                    ("album_id", TypeCode.INT64),
+                    ("id", TypeCode.INT64),
+                    ("title", TypeCode.STRING),
+                ],
+                [("1", "2", "1", "Track 1")],
+            ),
+        )
+        engine = self.create_engine()
+        with Session(engine) as session:
+            albums = session.scalars(
+                select(Album).options(selectinload(Album.tracks))
+            ).all()
+            eq_([[], ["Track 1"]], [[t.title for t in a.tracks] for a in albums])
+
+        requests = self.execute_requests()
+        eq_(2, len(requests))
+        eq_(
+            [["1", "1"], ["1", "2"]],
+            [list(key) for key in requests[1].params["a0"]],
+        )
+        eq_(
+            array_type(struct_type(TypeCode.INT64, TypeCode.INT64)),
+            requests[1].param_types["a0"],
+        )
+
+    def test_unnest_in_lists_disabled(self):
+        from test.mockserver_tests.in_unnest_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name\n"
+            "FROM singers\n"
+            "WHERE singers.id IN (@a0, @a1)"
+        )
+        engine = create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            unnest_in_lists=False,
+        )
+        with engine.connect() as connection:
+            connection.execute(
+                select(Singer.id, Singer.name).where(Singer.id.in_([1, 2]))
+            ).all()
+
+        requests = self.execute_requests()
+        eq_(1, len(requests))
+        eq_(["a0", "a1"], sorted(requests[0].params.keys()))
@@ -0,0 +1,144 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_, expect_raises
+from opentelemetry.metrics._internal import _ProxyMeterProvider
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from google.cloud.sqlalchemy_spanner import _opentelemetry_metrics, sqlalchemy_spanner
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+    add_update_count,
+)
+
+
+class TestMetrics(MockServerTestBase):
+    def setup_method(self):
+        super().setup_method()
+        self.reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[self.reader]).get_meter("test")
+        self.patcher = mock.patch.object(
+            _opentelemetry_metrics,
+            "_metrics",
+            _opentelemetry_metrics.DialectMetrics(meter),
+        )
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        super().teardown_method()
+
+    def data_points(self, name):
+        data = self.reader.get_metrics_data()
+        for resource_metrics in data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    if metric.name == name:
+                        return {
+                            tuple(sorted(point.attributes.items())): point
+                            for point in metric.data.data_points
+                        }
+        return {}
+
+    def test_execute_and_commit(self):
+        from test.mockserver_tests.metrics_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name\nFROM singers")
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id = @a1", 1)
+        engine = self.create_engine()
+        with engine.begin() as connection:
+            eq_(2, len(connection.execute(select(Singer)).all()))
+            connection.execute(update(Singer).where(Singer.id == 1).values(name="a"))
+
+        select_attributes = (("db.executemany", False), ("db.operation", "select"))
+        update_attributes = (("db.executemany", False), ("db.operation", "update"))
+        durations = self.data_points("spanner.sqlalchemy.execute.duration")
+        eq_(1, durations[select_attributes].count)
+        eq_(1, durations[update_attributes].count)
+        rows_returned = self.data_points("spanner.sqlalchemy.rows_returned")
+        eq_(2, rows_returned[(("db.operation", "select"),)].sum)
+        rows_affected = self.data_points("spanner.sqlalchemy.rows_affected")
+        eq_(1, rows_affected[update_attributes].sum)
+        commits = self.data_points("spanner.sqlalchemy.commit.duration")
+        eq_(1, commits[()].count)
+        checkouts = self.data_points("spanner.sqlalchemy.pool.checkout.duration")
+        eq_(1, checkouts[()].count)
+
+    def test_executemany(self):
+        from test.mockserver_tests.metrics_model import Singer
+
+        add_update_count("INSERT INTO singers (id, name) VALUES (@a0, @a1)", 1)
+        engine = self.create_engine()
+        with Session(engine) as session:
+            session.add_all([Singer(id=1, name="Jane"), Singer(id=2, name="John")])
+            session.commit()
+
+        attributes = (("db.executemany", True), ("db.operation", "insert"))
+        batch_sizes = self.data_points("spanner.sqlalchemy.executemany.batch_size")
+        eq_(2, batch_sizes[attributes].sum)
+        rows_affected = self.data_points("spanner.sqlalchemy.rows_affected")
+        eq_(2, rows_affected[attributes].sum)
+
+    def test_rollback(self):
+        from test.mockserver_tests.metrics_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name\nFROM singers")
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            connection.execute(select(Singer)).all()
+            connection.rollback()
+
+        # Rolling back a connection without a transaction is not counted.
+        rollbacks = self.data_points("spanner.sqlalchemy.rollbacks")
+        eq_(1, rollbacks[()].value)
+
+    def test_error(self):
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            with expect_raises(Exception):
+                connection.exec_driver_sql("SELECT unknown")
+
+        durations = self.data_points("spanner.sqlalchemy.execute.duration")
+        error_types = [dict(key).get("error.type") for key in durations]
+        eq_(["Unknown"], error_types)
+
+    def test_no_meter_provider(self):
+        from test.mockserver_tests.metrics_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name\nFROM singers")
+        add_update_count("UPDATE singers SET name=@a0 WHERE singers.id = @a1", 1)
+        engine = self.create_engine()
+        # The global meter provider is a proxy until a meter provider is set.
+        with mock.patch.object(_opentelemetry_metrics, "_metrics", None), mock.patch(
+            "opentelemetry.metrics.get_meter_provider",
+            return_value=_ProxyMeterProvider(),
+        ), mock.patch.object(
+            _opentelemetry_metrics, "DialectMetrics"
+        ) as dialect_metrics, mock.patch.object(
+            sqlalchemy_spanner, "_RowCountingFetchStrategy"
+        ) as fetch_strategy:
+            with engine.begin() as connection:
+                eq_(2, len(connection.execute(select(Singer)).all()))
+                connection.execute(
+                    update(Singer).where(Singer.id == 1).values(name="a")
+                )
+
+        dialect_metrics.assert_not_called()
+        fetch_strategy.assert_not_called()
@@ -0,0 +1,154 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_, is_instance_of
+from google.cloud.spanner_v1 import (
+    CreateSessionRequest,
+    BeginTransactionRequest,
+    CommitRequest,
+    ExecuteBatchDmlRequest,
+    ExecuteSqlRequest,
+)
+from google.cloud.sqlalchemy_spanner.dml import insert_or_ignore, insert_or_update
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_update_count,
+)
+
+
+class TestMutations(MockServerTestBase):
+    def test_insert_mutations(self):
+        from test.mockserver_tests.mutations_model import Singer
+
+        engine = self.create_engine().execution_options(
+            isolation_level="AUTOCOMMIT", use_mutations=True
+        )
+        with engine.connect() as connection:
+            result = connection.execute(
+                insert(Singer),
+                [{"id": i, "name": f"Singer {i}"} for i in range(3)],
+            )
+            eq_(3, result.rowcount)
+
+        requests = self.spanner_service.requests
+        eq_(2, len(requests))
+        is_instance_of(requests[0], CreateSessionRequest)
+        is_instance_of(requests[1], CommitRequest)
+        commit: CommitRequest = requests[1]
+        is_instance_of(commit.single_use_transaction.read_write, object)
+        eq_(1, len(commit.mutations))
+        mutation = commit.mutations[0]
+        eq_("singers", mutation.insert.table)
+        eq_(["id", "name"], list(mutation.insert.columns))
+        eq_(
+            [["0", "Singer 0"], ["1", "Singer 1"], ["2", "Singer 2"]],
+            [list(row) for row in mutation.insert.values],
+        )
+
+    def test_bulk_insert_mappings(self):
+        from test.mockserver_tests.mutations_model import Singer
+
+        engine = self.create_engine().execution_options(
+            isolation_level="AUTOCOMMIT", use_mutations=True
+        )
+        with Session(engine) as session:
+            session.bulk_insert_mappings(
+                Singer, [{"id": i, "name": f"Singer {i}"} for i in range(3)]
+            )
+            session.commit()
+
+        commits = self.commit_requests()
+        eq_(1, len(commits))
+        eq_(3, len(commits[0].mutations[0].insert.values))
+
+    def test_insert_or_update_mutations_multi_values(self):
+        from test.mockserver_tests.mutations_model import Singer
+
+        engine = self.create_engine().execution_options(
+            isolation_level="AUTOCOMMIT", use_mutations=True
+        )
+        with engine.connect() as connection:
+            connection.execute(
+                insert_or_update(Singer).values(
+                    [{"id": 1, "name": "One"}, {"id": 2, "name": "Two"}]
+                )
+            )
+
+        commits = self.commit_requests()
+        eq_(1, len(commits))
+        mutation = commits[0].mutations[0]
+        eq_("singers", mutation.insert_or_update.table)
+        eq_(["id", "name"], list(mutation.insert_or_update.columns))
+        eq_(
+            [["1", "One"], ["2", "Two"]],
+            [list(row) for row in mutation.insert_or_update.values],
+        )
+
+    def test_insert_mutations_split_in_batches(self):
+        from test.mockserver_tests.mutations_model import Singer
+
+        engine = self.create_engine().execution_options(
+            isolation_level="AUTOCOMMIT", use_mutations=True
+        )
+        engine.dialect.max_mutations_per_commit = 4
+        with engine.connect() as connection:
+            connection.execute(
+                insert(Singer),
+                [{"id": i, "name": f"Singer {i}"} for i in range(5)],
+            )
+
+        # Two columns per row means two rows per commit.
+        commits = self.commit_requests()
+        eq_([2, 2, 1], [len(c.mutations[0].insert.values) for c in commits])
+
+    def test_insert_or_ignore_falls_back_to_dml(self):
+        from test.mockserver_tests.mutations_model import Singer
+
+        add_update_count(
+            "INSERT OR IGNORE INTO singers (id, name) VALUES (@a0, @a1)", 1
+        )
+        engine = self.create_engine().execution_options(
+            isolation_level="AUTOCOMMIT", use_mutations=True
+        )
+        with engine.connect() as connection:
+            connection.execute(insert_or_ignore(Singer), {"id": 1, "name": "One"})
+
+        requests = self.spanner_service.requests
+        is_instance_of(requests[1], ExecuteSqlRequest)
+        eq_([], [len(c.mutations) for c in self.commit_requests() if c.mutations])
+
+    def test_insert_in_transaction_uses_dml(self):
+        from test.mockserver_tests.mutations_model import Singer
+
+        add_update_count("INSERT INTO singers (id, name) VALUES (@a0, @a1)", 1)
+        engine = self.create_engine().execution_options(use_mutations=True)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(Singer),
+                [{"id": i, "name": f"Singer {i}"} for i in range(2)],
+            )
+
+        requests = self.spanner_service.requests
+        eq_(4, len(requests))
+        is_instance_of(requests[1], BeginTransactionRequest)
+        is_instance_of(requests[2], ExecuteBatchDmlRequest)
+        is_instance_of(requests[3], CommitRequest)
+        eq_(0, len(requests[3].mutations))
+
+    def commit_requests(self):
+        return [
+            r for r in self.spanner_service.requests if isinstance(r, CommitRequest)
+        ]
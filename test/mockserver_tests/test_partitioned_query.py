@@ -0,0 +1,184 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_, is_true
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    ExecuteSqlRequest,
+    PartitionQueryRequest,
+)
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_partitioned_result,
+    add_singer_query_result,
+)
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+
+def create_singer_result(rows):
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(
+                                        name="singers_id",
+                                        type=spanner_type.Type(
+                                            dict(code=spanner_type.TypeCode.INT64)
+                                        ),
+                                    )
+                                ),
+                                spanner_type.StructType.Field(
+                                    dict(
+                                        name="singers_name",
+                                        type=spanner_type.Type(
+                                            dict(code=spanner_type.TypeCode.STRING)
+                                        ),
+                                    )
+                                ),
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend(rows)
+    return result
+
+
+class TestPartitionedQuery(MockServerTestBase):
+    def add_partitioned_singer_result(self, sql):
+        add_partitioned_result(
+            sql,
+            [
+                create_singer_result([("1", "Jane Doe"), ("2", "John Doe")]),
+                create_singer_result([("3", "Alice Doe")]),
+            ],
+        )
+
+    def test_partitioned_query(self):
+        from test.mockserver_tests.partitioned_query_model import Singer
+
+        self.add_partitioned_singer_result(
+            "SELECT singers.id, singers.name \nFROM singers"
+        )
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            rows = connection.execution_options(partitioned=True).execute(
+                select(Singer.id, Singer.name)
+            )
+            eq_(
+                [(1, "Jane Doe"), (2, "John Doe"), (3, "Alice Doe")],
+                sorted(rows.all()),
+            )
+
+        requests = self.spanner_service.requests
+        begin_requests = [r for r in requests if isinstance(r, BeginTransactionRequest)]
+        eq_(1, len(begin_requests))
+        is_true("read_only" in begin_requests[0].options)
+        partition_requests = [
+            r for r in requests if isinstance(r, PartitionQueryRequest)
+        ]
+        eq_(1, len(partition_requests))
+        execute_requests = [r for r in requests if isinstance(r, ExecuteSqlRequest)]
+        eq_(2, len(execute_requests))
+        eq_({b"0", b"1"}, {r.partition_token for r in execute_requests})
+        for request in execute_requests:
+            eq_(begin_requests[0].session, request.session)
+            is_true(not request.data_boost_enabled)
+
+    def test_partitioned_query_with_data_boost(self):
+        from test.mockserver_tests.partitioned_query_model import Singer
+
+        self.add_partitioned_singer_result(
+            "SELECT singers.id, singers.name\nFROM singers"
+        )
+        engine = self.create_engine().execution_options(read_only=True)
+        with Session(engine) as session:
+            singers = session.scalars(
+                select(Singer).execution_options(
+                    partitioned=True,
+                    data_boost_enabled=True,
+                    max_parallelism=1,
+                    max_partitions=10,
+                )
+            )
+            eq_(
+                ["Alice Doe", "Jane Doe", "John Doe"],
+                sorted(singer.name for singer in singers),
+            )
+
+        requests = self.spanner_service.requests
+        partition_requests = [
+            r for r in requests if isinstance(r, PartitionQueryRequest)
+        ]
+        eq_(1, len(partition_requests))
+        eq_(10, partition_requests[0].partition_options.max_partitions)
+        execute_requests = [r for r in requests if isinstance(r, ExecuteSqlRequest)]
+        eq_(2, len(execute_requests))
+        for request in execute_requests:
+            is_true(request.data_boost_enabled)
+
+    def test_partitioned_query_without_partitions(self):
+        from test.mockserver_tests.partitioned_query_model import Singer
+
+        add_singer_query_result(
+            "SELECT singers.id, singers.name \nFROM singers \nWHERE singers.id = @a0"
+        )
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            rows = connection.execution_options(partitioned=True).execute(
+                select(Singer.id, Singer.name).where(Singer.id == 1)
+            )
+            eq_([(1, "Jane Doe"), (2, "John Doe")], rows.all())
+
+        requests = self.spanner_service.requests
+        partition_requests = [
+            r for r in requests if isinstance(r, PartitionQueryRequest)
+        ]
+        eq_(1, len(partition_requests))
+        execute_requests = [r for r in requests if isinstance(r, ExecuteSqlRequest)]
+        eq_(1, len(execute_requests))
+        eq_(b"", execute_requests[0].partition_token)
+
+    def test_partitioned_query_in_read_write_transaction(self):
+        from test.mockserver_tests.partitioned_query_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name\nFROM singers")
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            connection.execute(select(Singer.id, Singer.name)).all()
+            with pytest.raises(ProgrammingError):
+                connection.execution_options(partitioned=True).execute(
+                    select(Singer.id, Singer.name)
+                )
+
+        requests = self.spanner_service.requests
+        partition_requests = [
+            r for r in requests if isinstance(r, PartitionQueryRequest)
+        ]
+        eq_(0, len(partition_requests))
@@ -0,0 +1,177 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.testing import eq_, is_true
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    ExecuteSqlRequest,
+    ReadRequest,
+    TypeCode,
+)
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_read_result,
+    add_result,
+    add_singer_query_result,
+)
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+
+def create_result(fields, rows):
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(name=name, type=spanner_type.Type(code=code))
+                                )
+                                for name, code in fields
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend(rows)
+    return result
+
+
+def add_singer_read_result(rows):
+    add_read_result(
+        "singers",
+        create_result([("id", TypeCode.INT64), ("name", TypeCode.STRING)], rows),
+    )
+
+
+class TestPointReads(MockServerTestBase):
+    def requests(self, request_type):
+        return [r for r in self.spanner_service.requests if isinstance(r, request_type)]
+
+    def create_point_reads_engine(self, **options):
+        return self.create_engine().execution_options(point_reads=True, **options)
+
+    def test_get_in_autocommit(self):
+        from test.mockserver_tests.point_reads_model import Singer
+
+        add_singer_read_result([("1", "Jane Doe")])
+        engine = self.create_point_reads_engine(isolation_level="AUTOCOMMIT")
+        with Session(engine) as session:
+            singer = session.get(Singer, 1)
+            eq_("Jane Doe", singer.name)
+
+        eq_([], self.requests(ExecuteSqlRequest))
+        reads = self.requests(ReadRequest)
+        eq_(1, len(reads))
+        eq_("singers", reads[0].table)
+        eq_(["id", "name"], list(reads[0].columns))
+        eq_([["1"]], [list(key) for key in reads[0].key_set.keys])
+        is_true(reads[0].transaction.single_use.read_only.strong)
+
+    def test_get_composite_key_in_read_only_transaction(self):
+        from test.mockserver_tests.point_reads_model import Album
+
+        add_read_result(
+            "albums",
+            create_result(
+                [
+                    ("singer_id", TypeCode.INT64),
+                    ("id", TypeCode.INT64),
+                    ("title", TypeCode.STRING),
+                ],
+                [("1", "2", "Blue")],
+            ),
+        )
+        engine = self.create_point_reads_engine(read_only=True)
+        with Session(engine) as session:
+            album = session.get(Album, (1, 2))
+            eq_("Blue", album.title)
+            session.commit()
+
+        reads = self.requests(ReadRequest)
+        eq_(1, len(reads))
+        eq_([["1", "2"]], [list(key) for key in reads[0].key_set.keys])
+        # The read uses the multi-use snapshot of the read-only transaction.
+        eq_(1, len(self.requests(BeginTransactionRequest)))
+        is_true(reads[0].transaction.id)
+
+    def test_many_to_one_loads(self):
+        from test.mockserver_tests.point_reads_model import Album
+
+        add_result(
+            "SELECT albums.singer_id, albums.id, albums.title \nFROM albums",
+            create_result(
+                [
+                    ("singer_id", TypeCode.INT64),
+                    ("id", TypeCode.INT64),
+                    ("title", TypeCode.STRING),
+                ],
+                [("1", "1", "Blue"), ("2", "1", "Red")],
+            ),
+        )
+        engine = self.create_point_reads_engine(isolation_level="AUTOCOMMIT")
+        add_singer_read_result([("1", "Jane Doe")])
+        with Session(engine) as session:
+            albums = session.scalars(select(Album)).all()
+            eq_("Jane Doe", albums[0].singer.name)
+        add_singer_read_result([("1", "Jane Doe"), ("2", "John Doe")])
+        with Session(engine) as session:
+            albums = session.scalars(
+                select(Album).options(selectinload(Album.singer))
+            ).all()
+            eq_(["Jane Doe", "John Doe"], [album.singer.name for album in albums])
+
+        # The query of the albums is executed as SQL. The lazy load and the
+        # selectin load of the singers are executed as reads.
+        eq_(2, len(self.requests(ExecuteSqlRequest)))
+        reads = self.requests(ReadRequest)
+        eq_(2, len(reads))
+        eq_([["1"]], [list(key) for key in reads[0].key_set.keys])
+        eq_([["1"], ["2"]], [list(key) for key in reads[1].key_set.keys])
+
+    def test_fallback_to_sql(self):
+        from test.mockserver_tests.point_reads_model import Singer
+
+        add_result(
+            "SELECT singers.id AS singers_id, singers.name AS singers_name\n"
+            "FROM singers\n"
+            "WHERE singers.id = @a0",
+            create_result(
+                [("singers_id", TypeCode.INT64), ("singers_name", TypeCode.STRING)],
+                [("1", "Jane Doe")],
+            ),
+        )
+        add_singer_query_result(
+            "SELECT singers.id, singers.name \n"
+            "FROM singers \n"
+            "WHERE singers.name = @a0"
+        )
+        # Reads are not used in read/write transactions.
+        engine = self.create_point_reads_engine()
+        with Session(engine) as session:
+            session.get(Singer, 1)
+            session.commit()
+        # Queries that are not primary key lookups are executed as SQL.
+        engine = self.create_point_reads_engine(isolation_level="AUTOCOMMIT")
+        with Session(engine) as session:
+            session.scalars(select(Singer).where(Singer.name == "Jane Doe")).all()
+
+        eq_(2, len(self.requests(ExecuteSqlRequest)))
+        eq_([], self.requests(ReadRequest))
@@ -0,0 +1,87 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.testing import eq_, is_not, is_true
+from google.cloud.spanner_v1 import BeginTransactionRequest, ExecuteSqlRequest
+
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_select1_result,
+)
+
+
+class TestPrePing(MockServerTestBase):
+    def create_engine(self, **kwargs):
+        return create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            pool_pre_ping=True,
+            pool_size=1,
+            **kwargs,
+        )
+
+    def execute_requests(self):
+        return [
+            r for r in self.spanner_service.requests if isinstance(r, ExecuteSqlRequest)
+        ]
+
+    def test_ping_skipped_for_recently_used_connection(self):
+        add_select1_result()
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            connection.execute(text("select 1")).all()
+            connection.commit()
+        with engine.connect() as connection:
+            connection.execute(text("select 1")).all()
+            connection.commit()
+        # The connection was used less than ping_idle_threshold seconds ago,
+        # so the checkout does not execute a query.
+        eq_(2, len(self.execute_requests()))
+
+    def test_ping_idle_connection(self):
+        add_select1_result()
+        engine = self.create_engine(ping_idle_threshold=0)
+        with engine.connect():
+            pass
+        with engine.connect():
+            pass
+
+        # The ping uses a single-use read-only transaction.
+        requests = self.execute_requests()
+        eq_(1, len(requests))
+        eq_("SELECT 1", requests[0].sql)
+        is_true(requests[0].transaction.single_use.read_only)
+        eq_(
+            0,
+            len(
+                [
+                    r
+                    for r in self.spanner_service.requests
+                    if isinstance(r, BeginTransactionRequest)
+                ]
+            ),
+        )
+
+    def test_ping_closed_connection(self):
+        engine = self.create_engine()
+        with engine.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+            connection.commit()
+        dbapi_connection.close()
+
+        # A closed connection is replaced without a request to Spanner.
+        with engine.connect() as connection:
+            is_not(dbapi_connection, connection.connection.dbapi_connection)
+        eq_(0, len(self.execute_requests()))
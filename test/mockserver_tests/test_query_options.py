@@ -0,0 +1,94 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import select, update
+from sqlalchemy.testing import eq_, is_true
+from google.cloud.spanner_v1 import ExecuteSqlRequest
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+    add_update_count,
+)
+
+from google.cloud.sqlalchemy_spanner import spanner_hints
+
+
+class TestQueryOptions(MockServerTestBase):
+    def execute_requests(self):
+        return [
+            r for r in self.spanner_service.requests if isinstance(r, ExecuteSqlRequest)
+        ]
+
+    def test_connection_options(self):
+        from test.mockserver_tests.query_options_model import Singer
+
+        sql = (
+            "@{OPTIMIZER_VERSION=6, OPTIMIZER_STATISTICS_PACKAGE=auto_20250101} "
+            "SELECT singers.id, singers.name\n"
+            "FROM singers"
+        )
+        add_singer_query_result(sql)
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            optimizer_version="6", optimizer_statistics_package="auto_20250101"
+        ) as connection:
+            eq_(2, len(connection.execute(select(Singer.id, Singer.name)).all()))
+        eq_(sql, self.execute_requests()[0].sql)
+
+    def test_statement_options_with_hints(self):
+        from test.mockserver_tests.query_options_model import Singer
+
+        # The hints in the statement take precedence over the options.
+        sql = (
+            "@{OPTIMIZER_VERSION=5, OPTIMIZER_STATISTICS_PACKAGE=latest} "
+            "SELECT singers.id, singers.name\n"
+            "FROM singers"
+        )
+        add_singer_query_result(sql)
+        engine = self.create_engine()
+        statement = spanner_hints(
+            select(Singer.id, Singer.name), statement={"OPTIMIZER_VERSION": 5}
+        ).execution_options(
+            optimizer_version="latest", optimizer_statistics_package="latest"
+        )
+        with engine.connect() as connection:
+            eq_(2, len(connection.execute(statement).all()))
+        eq_(sql, self.execute_requests()[0].sql)
+
+    def test_engine_options_in_autocommit(self):
+        from test.mockserver_tests.query_options_model import Singer
+
+        add_singer_query_result(
+            "@{OPTIMIZER_VERSION=latest_version} SELECT singers.id, singers.name \n"
+            "FROM singers"
+        )
+        engine = self.create_engine().execution_options(
+            isolation_level="AUTOCOMMIT", optimizer_version="latest"
+        )
+        with engine.connect() as connection:
+            eq_(2, len(connection.execute(select(Singer.id, Singer.name)).all()))
+        is_true(self.execute_requests()[0].transaction.single_use.read_only)
+
+    def test_dml_not_changed(self):
+        from test.mockserver_tests.query_options_model import Singer
+
+        sql = "UPDATE singers SET name=@a0 WHERE singers.id = @a1"
+        add_update_count(sql, 1)
+        engine = self.create_engine()
+        with engine.connect().execution_options(optimizer_version="6") as connection:
+            connection.execute(
+                update(Singer).where(Singer.id == 1).values(name="Jane Doe")
+            )
+            connection.commit()
+        eq_(sql, self.execute_requests()[0].sql)
@@ -0,0 +1,181 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    inspect,
+    text,
+)
+from sqlalchemy.engine import ObjectScope
+from sqlalchemy.testing import eq_
+from google.cloud.spanner_v1 import ExecuteSqlRequest, ResultSet, TypeCode
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_result,
+)
+import google.cloud.spanner_v1.types.result_set as result_set
+import google.cloud.spanner_v1.types.type as spanner_type
+
+
+def create_columns_result(tables):
+    fields = [
+        ("table_schema", TypeCode.STRING),
+        ("table_name", TypeCode.STRING),
+        ("column_name", TypeCode.STRING),
+        ("spanner_type", TypeCode.STRING),
+        ("is_nullable", TypeCode.STRING),
+        ("generation_expression", TypeCode.STRING),
+        ("column_default", TypeCode.STRING),
+    ]
+    result = result_set.ResultSet(
+        dict(
+            metadata=result_set.ResultSetMetadata(
+                dict(
+                    row_type=spanner_type.StructType(
+                        dict(
+                            fields=[
+                                spanner_type.StructType.Field(
+                                    dict(name=name, type=spanner_type.Type(code=code))
+                                )
+                                for name, code in fields
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+    )
+    result.rows.extend(
+        [("", table, "id", "INT64", "NO", None, None) for table in tables]
+    )
+    return result
+
+
+class TestReflectionCache(MockServerTestBase):
+    def create_engine(self, **kwargs):
+        return create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            **kwargs,
+        )
+
+    def add_columns_result(self, engine, reflect=None):
+        """Registers a result for the query that reflects all columns."""
+        if reflect is None:
+            reflect = inspect(engine).get_multi_columns
+        # The first attempt fails if the mock server does not know the query.
+        try:
+            reflect()
+        except Exception:
+            pass
+        sql = self.executed_sql()[-1]
+        add_result(sql, create_columns_result(["singers", "albums"]))
+        engine.dialect.clear_reflection_cache()
+        self.spanner_service.clear_requests()
+
+    def executed_sql(self):
+        return [
+            request.sql
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+
+    def test_cache_serves_all_tables(self):
+        engine = self.create_engine(reflection_cache_ttl=60)
+        self.add_columns_result(engine, lambda: inspect(engine).get_columns("singers"))
+
+        inspector = inspect(engine)
+        eq_(["id"], [c["name"] for c in inspector.get_columns("singers")])
+        eq_(["id"], [c["name"] for c in inspector.get_columns("albums")])
+        eq_([], inspector.get_columns("unknown"))
+        eq_(1, len(self.executed_sql()))
+
+    def test_cache_key_includes_keyword_arguments(self):
+        engine = self.create_engine(reflection_cache_ttl=60)
+        self.add_columns_result(engine)
+
+        inspector = inspect(engine)
+        inspector.get_multi_columns(scope=ObjectScope.DEFAULT)
+        inspector.get_multi_columns(scope=ObjectScope.DEFAULT)
+        eq_(1, len(self.executed_sql()))
+        inspector.get_multi_columns(scope=ObjectScope.ANY)
+        eq_(2, len(self.executed_sql()))
+
+    def test_cache_disabled_by_default(self):
+        engine = self.create_engine()
+        self.add_columns_result(engine)
+
+        inspect(engine).get_multi_columns()
+        inspect(engine).get_multi_columns()
+        eq_(2, len(self.executed_sql()))
+
+    def test_clear_reflection_cache(self):
+        engine = self.create_engine(reflection_cache_ttl=60)
+        self.add_columns_result(engine)
+
+        inspect(engine).get_multi_columns()
+        engine.dialect.clear_reflection_cache()
+        inspect(engine).get_multi_columns()
+        eq_(2, len(self.executed_sql()))
+
+    def test_ddl_invalidates_cache(self):
+        add_result(
+            """SELECT true
+FROM INFORMATION_SCHEMA.TABLES
+WHERE TABLE_SCHEMA=@table_schema AND TABLE_NAME=@table_name
+LIMIT 1
+""",
+            ResultSet(),
+        )
+        engine = self.create_engine(reflection_cache_ttl=60)
+        self.add_columns_result(engine)
+
+        inspect(engine).get_multi_columns()
+        metadata = MetaData()
+        Table("venues", metadata, Column("id", Integer, primary_key=True))
+        metadata.create_all(engine)
+        inspect(engine).get_multi_columns()
+        eq_(3, len(self.executed_sql()))
+
+    def test_textual_ddl_invalidates_cache(self):
+        engine = self.create_engine(reflection_cache_ttl=60)
+        self.add_columns_result(engine)
+
+        inspect(engine).get_multi_columns()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.execute(text("CREATE TABLE venues (id INT64) PRIMARY KEY (id)"))
+        inspect(engine).get_multi_columns()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.exec_driver_sql("DROP TABLE venues")
+        inspect(engine).get_multi_columns()
+        eq_(3, len(self.executed_sql()))
+
+    def test_cache_expires(self):
+        engine = self.create_engine(reflection_cache_ttl=60)
+        self.add_columns_result(engine)
+
+        inspect(engine).get_multi_columns()
+        engine.dialect.reflection_cache_ttl = 0.000001
+        engine.dialect.clear_reflection_cache()
+        inspect(engine).get_multi_columns()
+        inspect(engine).get_multi_columns()
+        eq_(3, len(self.executed_sql()))
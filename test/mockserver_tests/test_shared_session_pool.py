@@ -0,0 +1,229 @@
+# Copyright 2024 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+from unittest import mock
+import weakref
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import spanner_dbapi
+from sqlalchemy import create_engine, text
+from sqlalchemy.testing import eq_, is_, is_instance_of, is_not, is_true
+from google.cloud.spanner_v1 import BatchCreateSessionsRequest, CreateSessionRequest
+from google.cloud.spanner_v1.pool import BurstyPool, FixedSizePool, PingingPool
+
+from google.cloud.sqlalchemy_spanner import _database_registry
+
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_select1_result,
+)
+
+
+class TestSharedSessionPool(MockServerTestBase):
+    def create_engine(self, warmup_sessions=None, **connect_args):
+        return create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={
+                "client": self.client,
+                "logger": MockServerTestBase.logger,
+                **connect_args,
+            },
+            warmup_sessions=warmup_sessions,
+        )
+
+    def batch_create_sessions_requests(self):
+        return [
+            r
+            for r in self.spanner_service.requests
+            if isinstance(r, BatchCreateSessionsRequest)
+        ]
+
+    def test_shared_session_pool(self):
+        add_select1_result()
+        engine = self.create_engine(session_pool="fixed", session_pool_size=2)
+        with engine.connect() as conn1, engine.connect() as conn2:
+            database = conn1.connection.dbapi_connection.database
+            is_(database, conn2.connection.dbapi_connection.database)
+            is_instance_of(database._pool, FixedSizePool)
+            eq_(2, database._pool.size)
+            conn1.execute(text("select 1")).all()
+            conn2.execute(text("select 1")).all()
+
+        # The sessions of the fixed size pool are created once for the engine.
+        requests = self.spanner_service.requests
+        batch_requests = [
+            r for r in requests if isinstance(r, BatchCreateSessionsRequest)
+        ]
+        eq_(1, len(batch_requests))
+        eq_(2, batch_requests[0].session_count)
+
+        # Closing the connections does not clear the shared pool.
+        engine.dispose()
+        with engine.connect() as connection:
+            is_(database, connection.connection.dbapi_connection.database)
+            eq_(2, database._pool._sessions.qsize())
+
+    def test_close_does_not_clear_shared_pool(self):
+        registry = _database_registry.DatabaseRegistry()
+        connection = registry.connect(
+            "i", "d", project="p", client=self.client, session_pool="fixed"
+        )
+        with mock.patch.object(connection.database._pool, "clear") as clear:
+            connection.close()
+        clear.assert_not_called()
+
+        # The registry relies on the flag that the DB API uses for a session
+        # pool that is not owned by a connection.
+        connection = spanner_dbapi.connect("i", "d", project="p", client=self.client)
+        with mock.patch.object(connection.database._pool, "clear") as clear:
+            connection.close()
+        clear.assert_called_once()
+
+    def test_registry_keeps_key_objects_alive(self):
+        # The registry key contains the ids of these objects, which must not
+        # be reused by other objects while the shared database is registered.
+        registry = _database_registry.DatabaseRegistry()
+        credentials = AnonymousCredentials()
+        credentials_ref = weakref.ref(credentials)
+        registry.connect(
+            "i", "d", project="p", client=self.client, credentials=credentials
+        ).close()
+        del credentials
+        gc.collect()
+        is_not(None, credentials_ref())
+
+    def test_num_channels(self):
+        engine = self.create_engine(
+            session_pool="pinging", session_pool_size=4, num_channels=2
+        )
+        connections = [engine.connect() for _ in range(3)]
+        databases = [c.connection.dbapi_connection.database for c in connections]
+        # Each database has its own gRPC channel and session pool, and the
+        # connections are spread over the databases.
+        is_not(databases[0], databases[1])
+        is_not(databases[0].spanner_api, databases[1].spanner_api)
+        is_(databases[0], databases[2])
+        for database in databases[:2]:
+            is_instance_of(database._pool, PingingPool)
+            eq_(2, database._pool.size)
+        for connection in connections:
+            connection.close()
+
+    def test_not_shared_by_default(self):
+        engine = self.create_engine()
+        with engine.connect() as conn1, engine.connect() as conn2:
+            is_not(
+                conn1.connection.dbapi_connection.database,
+                conn2.connection.dbapi_connection.database,
+            )
+
+    def test_share_across_engines(self):
+        engine1 = self.create_engine(share_across_engines=True)
+        engine2 = self.create_engine(share_across_engines=True)
+        engine3 = self.create_engine(session_pool_size=5)
+        with engine1.connect() as conn1, engine2.connect() as conn2:
+            with engine3.connect() as conn3:
+                database = conn1.connection.dbapi_connection.database
+                is_(database, conn2.connection.dbapi_connection.database)
+                is_not(database, conn3.connection.dbapi_connection.database)
+
+    def test_url_query(self):
+        engine = create_engine(
+            "spanner://:AnonymousCredentials@localhost:"
+            f"{MockServerTestBase.port}/projects/p/instances/i/databases/d"
+            "?session_pool=fixed&session_pool_size=3&num_channels=1",
+            connect_args={"logger": MockServerTestBase.logger},
+        )
+        with engine.connect() as conn1, engine.connect() as conn2:
+            database = conn1.connection.dbapi_connection.database
+            is_(database, conn2.connection.dbapi_connection.database)
+            is_instance_of(database._pool, FixedSizePool)
+            eq_(3, database._pool.size)
+
+    def test_warmup_sessions(self):
+        engine = self.create_engine(warmup_sessions=3)
+        # The sessions are created when the engine is created.
+        batch_requests = self.batch_create_sessions_requests()
+        eq_(1, len(batch_requests))
+        eq_(3, batch_requests[0].session_count)
+        is_true(engine.dialect.warmup_duration > 0)
+        # The multiplexed session is also created.
+        create_requests = [
+            r
+            for r in self.spanner_service.requests
+            if isinstance(r, CreateSessionRequest)
+        ]
+        eq_(1, len(create_requests))
+        is_true(create_requests[0].session.multiplexed)
+
+        with engine.connect() as connection:
+            database = connection.connection.dbapi_connection.database
+            is_instance_of(database._pool, BurstyPool)
+            eq_(3, database._pool._sessions.qsize())
+        eq_(1, len(self.batch_create_sessions_requests()))
+
+    def test_warmup_sessions_without_batch_create_sessions(self):
+        # With an unsupported version of the client library, the sessions of
+        # a bursty pool are created one by one with the public Session API.
+        with mock.patch.object(
+            _database_registry, "_BATCH_CREATE_SESSIONS_SUPPORTED", False
+        ):
+            engine = self.create_engine(warmup_sessions=2)
+        eq_(0, len(self.batch_create_sessions_requests()))
+        create_requests = [
+            r
+            for r in self.spanner_service.requests
+            if isinstance(r, CreateSessionRequest)
+        ]
+        eq_(
+            [False, False, True],
+            sorted(r.session.multiplexed for r in create_requests),
+        )
+        with engine.connect() as connection:
+            database = connection.connection.dbapi_connection.database
+            eq_(2, database._pool._sessions.qsize())
+
+    def test_warmup_sessions_num_channels(self):
+        engine = self.create_engine(warmup_sessions=3, num_channels=2)
+        batch_requests = self.batch_create_sessions_requests()
+        eq_(2, len(batch_requests))
+        eq_([2, 2], [r.session_count for r in batch_requests])
+        with engine.connect() as conn1, engine.connect() as conn2:
+            databases = [c.connection.dbapi_connection.database for c in (conn1, conn2)]
+            is_not(databases[0].spanner_api, databases[1].spanner_api)
+
+    def test_warmup_sessions_fixed_size_pool(self):
+        # A fixed size pool creates all its sessions when it is created, and
+        # is not filled beyond its size.
+        self.create_engine(
+            warmup_sessions=10, session_pool="fixed", session_pool_size=4
+        )
+        batch_requests = self.batch_create_sessions_requests()
+        eq_(1, len(batch_requests))
+        eq_(4, batch_requests[0].session_count)
+
+    def test_warmup_sessions_after_fork(self):
+        engine = self.create_engine(warmup_sessions=2)
+        eq_(1, len(self.batch_create_sessions_requests()))
+
+        # Simulate the reset of the registries in a child process. The first
+        # connection in the child process warms up a new session pool.
+        _database_registry._reset_registries()
+        engine.dispose(close=False)
+        with engine.connect():
+            pass
+        batch_requests = self.batch_create_sessions_requests()
+        eq_(2, len(batch_requests))
+        eq_(2, batch_requests[1].session_count)
@@ -13,9 +13,9 @@
 # limitations under the License.
 
 import datetime
-from sqlalchemy import select
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session
-from sqlalchemy.testing import eq_, is_instance_of
+from sqlalchemy.testing import eq_, is_instance_of, is_true
 from google.cloud.spanner_v1 import (
     CreateSessionRequest,
     ExecuteSqlRequest,
@@ -112,3 +112,47 @@ class TestStaleReads(MockServerTestBase):
                 ),
                 execute_request.transaction.single_use,
             )
+
+    def test_autocommit_staleness(self):
+        from test.mockserver_tests.stale_read_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name \nFROM singers")
+        add_singer_query_result("SELECT singers.id, singers.name\nFROM singers")
+        engine = create_engine(
+            "spanner:///projects/p/instances/i/databases/d",
+            connect_args={"client": self.client, "logger": MockServerTestBase.logger},
+            autocommit_staleness={"max_staleness": datetime.timedelta(seconds=10)},
+        )
+
+        autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        with Session(autocommit_engine) as session:
+            session.scalars(select(Singer)).all()
+        # The staleness execution option takes precedence.
+        with Session(
+            autocommit_engine.execution_options(
+                staleness={"exact_staleness": datetime.timedelta(seconds=5)}
+            )
+        ) as session:
+            session.scalars(select(Singer)).all()
+        # Read/write transactions are not affected.
+        with Session(engine) as session:
+            session.scalars(select(Singer)).all()
+            session.commit()
+
+        requests = [
+            r for r in self.spanner_service.requests if isinstance(r, ExecuteSqlRequest)
+        ]
+        eq_(3, len(requests))
+        eq_(
+            TransactionOptions.ReadOnly(
+                dict(max_staleness={"seconds": 10}, return_read_timestamp=True)
+            ),
+            requests[0].transaction.single_use.read_only,
+        )
+        eq_(
+            TransactionOptions.ReadOnly(
+                dict(exact_staleness={"seconds": 5}, return_read_timestamp=True)
+            ),
+            requests[1].transaction.single_use.read_only,
+        )
+        is_true(requests[2].transaction.id)
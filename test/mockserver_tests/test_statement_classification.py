@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from sqlalchemy import select, text, update
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_, is_, is_true
+from google.cloud.spanner_dbapi import parse_utils
+from google.cloud.spanner_dbapi.parsed_statement import StatementType
+from google.cloud.spanner_v1 import (
+    CommitRequest,
+    ExecuteBatchDmlRequest,
+    ExecuteSqlRequest,
+)
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+    add_update_count,
+)
+
+from google.cloud.sqlalchemy_spanner import sqlalchemy_spanner
+
+
+class TestStatementClassification(MockServerTestBase):
+    def requests(self, request_type):
+        return [r for r in self.spanner_service.requests if isinstance(r, request_type)]
+
+    def classify_statement(self):
+        # The classification of the DB API, which parses the SQL string.
+        return mock.patch.object(
+            sqlalchemy_spanner,
+            "_dbapi_classify_statement",
+            wraps=sqlalchemy_spanner._dbapi_classify_statement,
+        )
+
+    def test_orm_flush(self):
+        from test.mockserver_tests.statement_classification_model import Singer
+
+        sql = "INSERT INTO singers (id, name) VALUES (@a0, @a1)"
+        add_update_count(sql, 1)
+        engine = self.create_engine()
+        with self.classify_statement() as classify, Session(engine) as session:
+            session.add_all([Singer(id=1, name="Jane"), Singer(id=2, name="John")])
+            session.commit()
+
+        classify.assert_not_called()
+        requests = self.requests(ExecuteBatchDmlRequest)
+        eq_(1, len(requests))
+        eq_([sql, sql], [s.sql for s in requests[0].statements])
+        eq_(1, len(self.requests(CommitRequest)))
+
+    def test_query_and_update_in_transaction(self):
+        from test.mockserver_tests.statement_classification_model import Singer
+
+        query = (
+            "SELECT singers.id, singers.name\n"
+            "FROM singers\n"
+            "WHERE singers.id = @a0"
+        )
+        add_singer_query_result(query)
+        dml = "UPDATE singers SET name=@a0 WHERE singers.id = @a1"
+        add_update_count(dml, 1)
+        engine = self.create_engine()
+        with self.classify_statement() as classify, engine.begin() as connection:
+            connection.execute(select(Singer).where(Singer.id == 1)).all()
+            result = connection.execute(
+                update(Singer).where(Singer.id == 1).values(name="Jane")
+            )
+            eq_(1, result.rowcount)
+
+        classify.assert_not_called()
+        requests = self.requests(ExecuteSqlRequest)
+        eq_([query, dml], [r.sql for r in requests])
+        is_true(requests[0].transaction.id)
+        eq_({"a0": "Jane", "a1": "1"}, dict(requests[1].params))
+        eq_(1, len(self.requests(CommitRequest)))
+
+    def test_autocommit_update(self):
+        from test.mockserver_tests.statement_classification_model import Singer
+
+        dml = "UPDATE singers SET name=@a0 WHERE singers.id = @a1"
+        add_update_count(dml, 1)
+        engine = self.create_engine().execution_options(isolation_level="AUTOCOMMIT")
+        with self.classify_statement() as classify, engine.connect() as connection:
+            result = connection.execute(
+                update(Singer).where(Singer.id == 1).values(name="Jane")
+            )
+            eq_(1, result.rowcount)
+
+        classify.assert_not_called()
+        eq_([dml], [r.sql for r in self.requests(ExecuteSqlRequest)])
+        eq_(1, len(self.requests(CommitRequest)))
+
+    def test_classified_by_dbapi(self):
+        from test.mockserver_tests.statement_classification_model import Singer
+
+        # The DB API adds the WHERE clause that Spanner requires to an
+        # UPDATE statement without one, and classifies textual SQL.
+        add_update_count("UPDATE singers SET name=@a0 WHERE 1=1", 2)
+        add_update_count("UPDATE singers SET name='Jane' WHERE id=1", 1)
+        engine = self.create_engine()
+        with self.classify_statement() as classify, engine.begin() as connection:
+            eq_(2, connection.execute(update(Singer).values(name="Jane")).rowcount)
+            eq_(
+                1,
+                connection.execute(
+                    text("UPDATE singers SET name='Jane' WHERE id=1")
+                ).rowcount,
+            )
+
+        eq_(2, classify.call_count)
+
+    def test_install_classify_statement(self):
+        self.create_engine()
+        is_(sqlalchemy_spanner._classify_statement, parse_utils.classify_statement)
+        # Statements that are not executed by the dialect are classified by
+        # the DB API.
+        eq_(
+            StatementType.DDL,
+            parse_utils.classify_statement("DROP TABLE singers").statement_type,
+        )
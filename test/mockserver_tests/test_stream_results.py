@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from sqlalchemy import select
+from sqlalchemy.engine.cursor import BufferedRowCursorFetchStrategy
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_, is_instance_of, is_true
+from google.cloud.spanner_v1 import ExecuteSqlRequest
+from test.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_singer_query_result,
+)
+
+
+class TestStreamResults(MockServerTestBase):
+    def test_stream_results(self):
+        from test.mockserver_tests.stream_results_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name \nFROM singers")
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            result = connection.execution_options(stream_results=True).execute(
+                select(Singer.id, Singer.name)
+            )
+            is_true(result.context._is_server_side)
+            is_instance_of(result.cursor_strategy, BufferedRowCursorFetchStrategy)
+            eq_([(1, "Jane Doe"), (2, "John Doe")], result.all())
+
+        requests = self.spanner_service.requests
+        execute_requests = [r for r in requests if isinstance(r, ExecuteSqlRequest)]
+        eq_(1, len(execute_requests))
+
+    def test_yield_per(self):
+        from test.mockserver_tests.stream_results_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name \nFROM singers")
+        engine = self.create_engine()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            result = connection.execution_options(yield_per=1).execute(
+                select(Singer.id, Singer.name)
+            )
+            is_true(result.context._is_server_side)
+            eq_(
+                [[(1, "Jane Doe")], [(2, "John Doe")]],
+                [list(partition) for partition in result.partitions()],
+            )
+
+    def test_orm_yield_per(self):
+        from test.mockserver_tests.stream_results_model import Singer
+
+        add_singer_query_result("SELECT singers.id, singers.name\nFROM singers")
+        engine = self.create_engine()
+        with Session(engine) as session:
+            singers = session.scalars(select(Singer).execution_options(yield_per=1))
+            eq_(["Jane Doe", "John Doe"], [singer.name for singer in singers])
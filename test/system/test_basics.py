@@ -34,6 +34,7 @@ from sqlalchemy import (
     update,
     delete,
     event,
+    tuple_,
 )
 from sqlalchemy.orm import Session, DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.types import REAL
@@ -362,6 +363,31 @@ class TestBasics(fixtures.TablesTest):
             insp.get_multi_foreign_keys(filter_names=["composite_fk"]),
         )
 
+    def test_in_unnest(self, connection):
+        """Ensures IN lists are sent as typed array parameters."""
+
+        connection.execute(
+            text(
+                """insert or update into composite_pk (a, b)
+                   values ('a', '1'), ('a', '2'), ('b', '1')"""
+            )
+        )
+        table = Table("composite_pk", MetaData(), autoload_with=connection)
+
+        rows = connection.execute(
+            select(table.c.a, table.c.b)
+            .where(table.c.a.in_(["a", "c"]))
+            .order_by(table.c.a, table.c.b)
+        ).all()
+        eq_([("a", "1"), ("a", "2")], rows)
+
+        rows = connection.execute(
+            select(table.c.a, table.c.b)
+            .where(tuple_(table.c.a, table.c.b).in_([("a", "2"), ("b", "1")]))
+            .order_by(table.c.a, table.c.b)
+        ).all()
+        eq_([("a", "2"), ("b", "1")], rows)
+
     def test_composite_index_lookups(self, connection):
         """Ensures we introspect composite indexes."""
 
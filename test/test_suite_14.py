@@ -2433,6 +2433,66 @@ class ReturningTest(fixtures.TestBase):
             )
 
 
+class InUnnestTest(fixtures.TablesTest):
+    """
+    SPANNER TEST:
+
+    Check that a list of values for IN is sent as one
+    array parameter with SQLAlchemy 1.4.
+    """
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "in_unnest_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(16)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.in_unnest_table.insert(),
+            [
+                {"id": 1, "data": "a"},
+                {"id": 2, "data": "b"},
+                {"id": 3, "data": "c"},
+            ],
+        )
+
+    def test_in_compiles_to_unnest(self):
+        table = self.tables.in_unnest_table
+
+        stmt = select(table.c.id).where(table.c.id.in_([1, 2]))
+
+        eq_(
+            str(stmt.compile(dialect=config.db.dialect)),
+            "SELECT in_unnest_table.id \nFROM in_unnest_table "
+            "\nWHERE in_unnest_table.id IN UNNEST(%s)",
+        )
+
+    def test_in(self, connection):
+        table = self.tables.in_unnest_table
+
+        stmt = select(table.c.id).where(table.c.id.in_([1, 3, 4])).order_by(table.c.id)
+
+        eq_(connection.execute(stmt).fetchall(), [(1,), (3,)])
+
+    def test_tuple_not_in(self, connection):
+        table = self.tables.in_unnest_table
+
+        stmt = (
+            select(table.c.id)
+            .where(sqlalchemy.tuple_(table.c.id, table.c.data).not_in([(1, "a")]))
+            .order_by(table.c.id)
+        )
+
+        eq_(connection.execute(stmt).fetchall(), [(2,), (3,)])
+
+
 @pytest.mark.skipif(
     bool(os.environ.get("SPANNER_EMULATOR_HOST")), reason="Skipped on emulator"
 )
@@ -0,0 +1,60 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from google.api_core.client_options import ClientOptions
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.spanner_v1 import Client
+from google.cloud.spanner_v1.pool import BurstyPool
+from sqlalchemy.testing import eq_, fixtures, is_true
+
+from google.cloud.sqlalchemy_spanner import _database_registry
+
+
+class TestDatabaseRegistry(fixtures.TestBase):
+    @pytest.mark.skipif(
+        not _database_registry._BATCH_CREATE_SESSIONS_SUPPORTED,
+        reason="The warm-up uses the public Session API with this client version",
+    )
+    def test_batch_create_sessions_internals(self):
+        # _batch_create_sessions() uses internals of the client library.
+        # Fail if the client library no longer has them, so that
+        # _BATCH_CREATE_SESSIONS_VERSIONS can be updated.
+        name = "projects/p/instances/i/databases/d"
+        eq_(
+            [("google-cloud-resource-prefix", name)],
+            _database_registry._metadata_with_prefix(name),
+        )
+        eq_(
+            ("x-goog-spanner-route-to-leader", "true"),
+            _database_registry._metadata_with_leader_aware_routing(True),
+        )
+        client = Client(
+            project="p",
+            credentials=AnonymousCredentials(),
+            client_options=ClientOptions(api_endpoint="localhost:9999"),
+        )
+        database = client.instance("i").database("d", pool=BurstyPool())
+        is_true(database._route_to_leader_enabled)
+        is_true(isinstance(type(database).spanner_api, property))
+        session = _database_registry._new_session(database, BurstyPool())
+        session._session_id = "s1"
+        eq_("s1", session.session_id)
+
+    def test_batch_create_sessions_versions(self):
+        lower, upper = _database_registry._BATCH_CREATE_SESSIONS_VERSIONS
+        eq_(
+            lower <= _database_registry._spanner_version() < upper,
+            _database_registry._BATCH_CREATE_SESSIONS_SUPPORTED,
+        )
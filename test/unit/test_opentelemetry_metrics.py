@@ -0,0 +1,113 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from sqlalchemy.testing import fixtures
+
+from google.cloud.spanner_dbapi.connection import Connection
+from google.cloud.sqlalchemy_spanner import _opentelemetry_metrics
+
+try:
+    from opentelemetry import metrics
+    from opentelemetry.metrics._internal import _ProxyMeterProvider
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    HAS_OPENTELEMETRY_INSTALLED = True
+except ImportError:
+    HAS_OPENTELEMETRY_INSTALLED = False
+
+
+@pytest.mark.skipif(
+    not HAS_OPENTELEMETRY_INSTALLED, reason="OpenTelemetry is not installed"
+)
+class TestOpenTelemetryMetrics(fixtures.TestBase):
+    def test_no_meter_provider(self):
+        with mock.patch.object(_opentelemetry_metrics, "_metrics", None), mock.patch(
+            "opentelemetry.metrics.get_meter_provider",
+            return_value=metrics.NoOpMeterProvider(),
+        ):
+            assert _opentelemetry_metrics.get_metrics() is None
+            context = _opentelemetry_metrics.measure_execute(None, None)
+            assert context is _opentelemetry_metrics._NO_METRICS
+            assert _opentelemetry_metrics.measure_commit() is context
+
+    def test_default_meter_provider(self):
+        # The global meter provider is a proxy until a meter provider is set.
+        with mock.patch.object(_opentelemetry_metrics, "_metrics", None), mock.patch(
+            "opentelemetry.metrics.get_meter_provider",
+            return_value=_ProxyMeterProvider(),
+        ):
+            assert _opentelemetry_metrics.get_metrics() is None
+            assert _opentelemetry_metrics._metrics is None
+
+    def test_meter_provider(self):
+        provider = MeterProvider()
+        with mock.patch.object(_opentelemetry_metrics, "_metrics", None), mock.patch(
+            "opentelemetry.metrics.get_meter_provider", return_value=provider
+        ):
+            dialect_metrics = _opentelemetry_metrics.get_metrics()
+            assert dialect_metrics is not None
+            assert _opentelemetry_metrics.get_metrics() is dialect_metrics
+
+    def test_dbapi_retry_helper(self):
+        # instrument_retries wraps the retry helper of the DB API connection,
+        # which is not a public API, and relies on the cursors sharing it.
+        # Fail if the DB API changes either.
+        connection = Connection(mock.Mock(), mock.Mock())
+        helper = connection._transaction_helper
+        assert callable(helper.retry_transaction)
+        assert connection.cursor().transaction_helper is helper
+
+    def test_instrument_retries(self):
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+        helper = mock.Mock()
+        helper.retry_transaction.side_effect = [None, RuntimeError("retry failed")]
+        connection = mock.Mock(_transaction_helper=helper)
+        with mock.patch.object(
+            _opentelemetry_metrics,
+            "_metrics",
+            _opentelemetry_metrics.DialectMetrics(meter),
+        ):
+            _opentelemetry_metrics.instrument_retries(connection)
+            helper.retry_transaction()
+            with pytest.raises(RuntimeError):
+                helper.retry_transaction()
+
+        metric = next(
+            metric
+            for resource_metrics in reader.get_metrics_data().resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+            if metric.name == "spanner.sqlalchemy.transaction.retries"
+        )
+        counts = {
+            point.attributes["success"]: point.value
+            for point in metric.data.data_points
+        }
+        assert counts == {True: 1, False: 1}
+
+    def test_statement_kind(self):
+        context = mock.Mock(
+            isinsert=False,
+            isupdate=False,
+            isdelete=True,
+            isddl=False,
+            _is_query=False,
+        )
+        assert _opentelemetry_metrics.statement_kind(context) == "delete"
+        assert _opentelemetry_metrics.statement_kind(None) == "other"
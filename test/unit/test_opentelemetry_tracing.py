@@ -48,6 +48,23 @@ if HAS_OPENTELEMETRY_INSTALLED:
             with _opentelemetry_tracing.trace_call("Test") as no_span:
                 assert no_span is None
 
+    class NoTracerProviderTest(OpenTelemetryBase):
+        def test_no_tracer_provider(self):
+            with mock.patch.object(
+                _opentelemetry_tracing, "_tracing_enabled", False
+            ), mock.patch.object(
+                trace_api,
+                "get_tracer_provider",
+                return_value=trace_api.ProxyTracerProvider(),
+            ):
+                context = _opentelemetry_tracing.trace_call(
+                    "CloudSpannerSqlAlchemy.Test", {"db.params": [1]}
+                )
+                assert context is _opentelemetry_tracing._NO_SPAN
+                with context as no_span:
+                    assert no_span is None
+            assert len(self.ot_exporter.get_finished_spans()) == 0
+
     class TracingTest(OpenTelemetryBase):
         def test_trace_call(self):
             extra_attributes = {
@@ -114,3 +131,49 @@ if HAS_OPENTELEMETRY_INSTALLED:
                 assert span_attr[key] == expected_attributes[key]
             assert span.name == "CloudSpannerSqlAlchemy.Test"
             assert span.status.status_code == StatusCode.ERROR
+
+        def test_trace_params(self):
+            params = [[i, "x" * 2000] for i in range(150)]
+            with _opentelemetry_tracing.trace_call(
+                "CloudSpannerSqlAlchemy.Test", {"db.params": params}
+            ):
+                pass
+
+            span = self.ot_exporter.get_finished_spans()[0]
+            traced = span.attributes["db.params"]
+            assert len(traced) == _opentelemetry_tracing.MAX_TRACED_PARAMS
+            assert traced[0] == str([0, "x" * 2000])[:1000] + "..."
+            assert span.attributes["db.params_truncated"] is True
+            # The attributes of the caller are not modified.
+            assert len(params) == 150
+
+        def test_hide_query_parameters(self):
+            with mock.patch.object(
+                _opentelemetry_tracing, "HIDE_QUERY_PARAMETERS", True
+            ):
+                with _opentelemetry_tracing.trace_call(
+                    "CloudSpannerSqlAlchemy.Test",
+                    {"db.params": [1], "db.instance": "database_name"},
+                ):
+                    pass
+
+            span = self.ot_exporter.get_finished_spans()[0]
+            assert "db.params" not in span.attributes
+            assert span.attributes["db.instance"] == "database_name"
+
+        def test_attributes_not_added_if_not_sampled(self):
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+            tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer(__name__)
+            with mock.patch.object(
+                _opentelemetry_tracing, "tracer", tracer
+            ), mock.patch.object(
+                _opentelemetry_tracing, "_span_attributes"
+            ) as span_attributes:
+                with _opentelemetry_tracing.trace_call(
+                    "CloudSpannerSqlAlchemy.Test", {"db.params": [1]}
+                ) as span:
+                    assert not span.is_recording()
+
+            span_attributes.assert_not_called()
@@ -18,7 +18,6 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
-from alembic.ddl.impl import DefaultImpl
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -40,10 +39,6 @@ target_metadata = None
 # ... etc.
 
 
-class SpannerImpl(DefaultImpl):
-    __dialect__ = "spanner+spanner"
-
-
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 